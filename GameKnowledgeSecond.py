@@ -1,6 +1,24 @@
 import random
 import copy
-import numpy
+import math
+import bisect
+import time
+import collections
+import collections.abc
+import sys
+import os
+
+
+numpy = None
+
+
+def import_numpy():
+    """Imports NumPy the first time a vectorized path needs it, so that the module and its pool workers start
+    without it"""
+    global numpy
+    if numpy is None:
+        import numpy
+    return numpy
 
 
 class Card(object):
@@ -9,38 +27,66 @@ class Card(object):
     values = {"2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "10": 10,
               "jack": 11, "queen": 12, "king": 13, "ace": 14, }
     suits = ["spades", "hearts", "diamonds", "clubs"]
+    suit_indexes = {"spades": 0, "hearts": 1, "diamonds": 2, "clubs": 3}
     value_items = list(dict.keys(values))
-
-    def __init__(self, value="", suit=""):
-
-        if value not in self.values and value != "":
-            print("Not a valid value.")
-        if suit not in self.suits and suit != "":
-            print("Not a valid suit.")
-        else:
-            if value == "":
-                self.value = random.choice(self.value_items)
-            if suit == "":
-                self.suit = random.choice(self.suits)
-
-            else:
-                self.value = value
-                self.suit = suit
+    interned = {}
+    below_masks = ()
+    above_masks = ()
+    below = ()
+    above = ()
+
+    __slots__ = ("value", "suit", "index")
+
+    def __new__(cls, value="", suit=""):
+        """Returns the interned card for a value and suit, choosing either at random when it is left empty"""
+        if value == "":
+            value = random.choice(cls.value_items)
+        if suit == "":
+            suit = random.choice(cls.suits)
+        try:
+            return cls.interned[value, suit]
+        except KeyError:
+            raise ValueError("%s of %s is not a card" % (value, suit)) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("cards are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("cards are immutable")
 
     def __repr__(self):
         """Defines the representation of a card"""
         return "%s of %s" % (self.value, self.suit)
 
     def __eq__(self, other):
-        return self.value == other.value and self.suit == other.suit
+        return self is other
 
-    def random_card(self):
-        """Replaces the card object with a random card"""
-        rand_value = random.randint(0, len(self.values) - 1)
-        rand_suit = random.randint(0, len(self.suits) - 1)
+    def __hash__(self):
+        return self.index
 
-        self.value = self.value_items[rand_value]
-        self.suit = self.suits[rand_suit]
+    def __reduce__(self):
+        """Pickles a card as a lookup of its singleton"""
+        return Card.from_index, (self.index,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def sort_key(self):
+        """Sort key of the card, its position in a sorted deck"""
+        return self.index
+
+    @classmethod
+    def from_index(cls, index):
+        """Returns the card view for a card index"""
+        return cards_by_index[index]
+
+    @classmethod
+    def random_card(cls):
+        """Returns a random card"""
+        return cards_by_index[random.randrange(52)]
 
     def card_sort(self, sort_card):
         """Determines the higher of two cards for sorting purposes"""
@@ -67,49 +113,124 @@ class Card(object):
 
     def cards_below(self):
         """Returns all cards in a suit ranked below the card"""
-        cards_to_return = []
-
-        for keys in self.value_items:
-            cards_to_return.append(Card(keys, self.suit))
-        cards_to_remove = []
-
-        for cards in cards_to_return:
-            if cards.hearts_compare(self):
-                cards_to_remove.append(cards)
-        cards_to_return = [i for i in cards_to_return if i not in cards_to_remove]
-        cards_to_return.remove(self)
-        return cards_to_return
+        return list(self.below[self.index])
 
     def cards_above(self):
         """Returns all cards in a suit ranked above the card"""
-        cards_to_return = []
+        return list(self.above[self.index])
+
+
+class CardSet(object):
+    """A set of cards stored as a 52-bit mask with one bit per card index"""
+
+    __slots__ = ("mask",)
+
+    full = (1 << 52) - 1
+    suit_masks = {"spades": 0x1FFF, "hearts": 0x1FFF << 13, "diamonds": 0x1FFF << 26, "clubs": 0x1FFF << 39}
+
+    def __init__(self, cards=(), mask=0):
+        """Builds a set from an iterable of cards and/or a raw mask"""
+        for card in cards:
+            mask |= 1 << card.index
+        self.mask = mask
+
+    def __repr__(self):
+        """Defines a representation of a card set"""
+        return "CardSet(%s)" % list(self)
+
+    def __eq__(self, other):
+        return isinstance(other, CardSet) and self.mask == other.mask
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __bool__(self):
+        return self.mask != 0
+
+    def __contains__(self, card):
+        return self.mask >> card.index & 1 == 1
+
+    def __iter__(self):
+        """Yields the cards in the set in sorted deck order"""
+        mask = self.mask
+        while mask:
+            low_bit = mask & -mask
+            yield cards_by_index[low_bit.bit_length() - 1]
+            mask ^= low_bit
+
+    def __copy__(self):
+        return CardSet(mask=self.mask)
+
+    def __deepcopy__(self, memo):
+        return CardSet(mask=self.mask)
+
+    def __or__(self, other):
+        return CardSet(mask=self.mask | other.mask)
+
+    def __and__(self, other):
+        return CardSet(mask=self.mask & other.mask)
+
+    def __sub__(self, other):
+        return CardSet(mask=self.mask & ~other.mask)
 
-        for keys in self.value_items:
-            cards_to_return.append(Card(keys, self.suit))
-        cards_to_remove = []
+    def copy(self):
+        """Returns an independent copy of the set"""
+        return CardSet(mask=self.mask)
 
-        for cards in cards_to_return:
-            if not cards.hearts_compare(self):
-                cards_to_remove.append(cards)
-        cards_to_return = [i for i in cards_to_return if i not in cards_to_remove]
-        return cards_to_return
+    def add(self, card):
+        """Adds a card to the set"""
+        self.mask |= 1 << card.index
 
-class Deck(Card):
+    def remove(self, card):
+        """Removes a card from the set, raising KeyError if it is missing"""
+        bit = 1 << card.index
+        if not self.mask & bit:
+            raise KeyError(card)
+        self.mask ^= bit
+
+    def discard(self, card):
+        """Removes a card from the set if it is present"""
+        self.mask &= ~(1 << card.index)
+
+    def select_suit(self, suit):
+        """Returns the cards of a particular suit"""
+        return CardSet(mask=self.mask & self.suit_masks[suit])
+
+    def complement(self):
+        """Returns every card of the deck that is not in the set"""
+        return CardSet(mask=self.full & ~self.mask)
+
+
+def intern_cards():
+    """Creates the 52 card singletons in sorted deck order, so that a card's index is its position in a sorted deck
+    and its bit in a CardSet, along with the tables of cards ranked below and above each card in its suit"""
+    cards = []
+    for suit in Card.suits:
+        for value in Card.value_items:
+            card = object.__new__(Card)
+            object.__setattr__(card, "value", value)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "index", len(cards))
+            Card.interned[value, suit] = card
+            cards.append(card)
+    Card.below_masks = tuple((1 << index) - (1 << index - index % 13) for index in range(52))
+    Card.above_masks = tuple((1 << index - index % 13 + 13) - (2 << index) for index in range(52))
+    Card.below = tuple(tuple(cards[index - index % 13:index]) for index in range(52))
+    Card.above = tuple(tuple(cards[index + 1:index - index % 13 + 13]) for index in range(52))
+    return cards
+
+
+cards_by_index = intern_cards()
+
+
+class Deck(object):
     """Defines a deck object for the two-handed hearts game"""
 
     def __init__(self):
         """Defines a deck as a list of card objects and defines an order and contents of a deck"""
-        card_list = []
-        suit_index = 0
-        for suit in self.suits:
-            value_index = 0
-            for value in self.value_items:
-                card_list.append(Card(value, suit))
-                value_index += 1
-            suit_index += 1
-
-        self.contents = card_list
-        self.order = card_list
+        self.contents = cards_by_index[:]
+        self.order = cards_by_index[:]
+        self.cards = CardSet(mask=CardSet.full)
 
     def __repr__(self):
         """Defines a string representation of a deck"""
@@ -121,61 +242,50 @@ class Deck(Card):
         """Defines equality amongst decks"""
         return self.contents == other.contents and self.order == other.order
 
-    def shuffle(self):
-        """Randomly shuffles the order of a deck"""
-        new_deck = []
-        for i in range(len(self.order)):
-            card_choice = random.choice(self.order)
-            self.order.remove(card_choice)
-            new_deck.append(card_choice)
+    def reset(self):
+        """Refills the deck with all 52 cards in sorted order, reusing the existing order buffer"""
+        self.order[:] = cards_by_index
+        self.contents = cards_by_index[:]
+        self.cards = CardSet(mask=CardSet.full)
+
+    def shuffle(self, rng=None):
+        """Shuffles the order of a deck in place (Fisher-Yates)
 
-        self.order = new_deck
+        rng may be a random.Random or numpy.random.Generator instance; the random module is used when it is None.
+        """
+        if rng is None:
+            rng = random
+        rng.shuffle(self.order)
 
     def sort_deck(self):
         """Robust sorting for a deck of arbitrary size"""
-        full_deck = Deck()
-        sort_values = []
-        new_order = []
-        for i in range(len(self.order)):
-            order_card = self.order[i]
-
-            sort_value = list.index(full_deck.contents, order_card)
-            sort_values.append(sort_value)
-        sort_values.sort()
-
-        for value_indexes in sort_values:
-            new_order.append(full_deck.contents[value_indexes])
-        self.order = new_order
+        self.order = sorted(self.order, key=Card.sort_key)
 
     def arrange_contents(self):
         """Keeps contents in order while maintaining order"""
-        full_deck = Deck()
-        sort_values = []
-        new_order = []
-        for i in range(len(self.order)):
-            order_card = self.order[i]
-
-            sort_value = list.index(full_deck.contents, order_card)
-            sort_values.append(sort_value)
-        sort_values.sort()
-
-        for value_indexes in sort_values:
-            new_order.append(full_deck.contents[value_indexes])
-        self.contents = new_order
+        self.contents = sorted(self.order, key=Card.sort_key)
 
 
 class Hand(Deck):
     """Defines a hand for the two-handed hearts game"""
 
+    two_of_clubs_mask = 1 << 39
+    non_hearts_mask = CardSet.full & ~CardSet.suit_masks["hearts"]
+    non_points_mask = non_hearts_mask & ~(1 << 10)
+    legal_memo_size = 1024
+
     def __init__(self, deck, size=13):
         """Initiates a hand of default size 13 by removing cards from the deck"""
 
         self.order = deck.order[0:size]
         self.contents = deck.order[0:size]
+        self.cards = CardSet(self.order)
         self.arrange_contents()
+        self.legal_memo = {}
 
         deck.order = deck.order[size:]
         deck.contents = deck.order
+        deck.cards = deck.cards - self.cards
         deck.arrange_contents()
 
     def __repr__(self):
@@ -184,87 +294,254 @@ class Hand(Deck):
 
         return "\n".join(hand_string)
 
-    def add_card(self, card):
-        """Adds a card to the hand"""
-        self.order.append(card)
-        self.contents.append(card)
-        self.arrange_contents()
+    def __contains__(self, card):
+        return self.cards.mask >> card.index & 1 == 1
+
+    def arrange_contents(self):
+        """Sorts the contents and rebuilds the per-suit buckets from them"""
+        Deck.arrange_contents(self)
+        self.index_suits()
+
+    def index_suits(self):
+        """Rebuilds the per-suit buckets, each holding the hand's cards of one suit in sorted order"""
+        self.by_suit = {suit: [] for suit in Card.suits}
+        for card in self.contents:
+            self.by_suit[card.suit].append(card)
+
+    def add_card(self, card, position=None):
+        """Adds a card to the hand, at the end of the dealt order unless a position is given"""
+        if position is None:
+            self.order.append(card)
+        else:
+            self.order.insert(position, card)
+        bisect.insort(self.contents, card, key=Card.sort_key)
+        bisect.insort(self.by_suit[card.suit], card, key=Card.sort_key)
+        self.cards.add(card)
 
     def remove_card(self, card):
-        """Removes a card from the hand"""
-        self.order.remove(card)
+        """Removes a card from the hand and returns the position it held in the dealt order"""
+        position = self.order.index(card)
+        del self.order[position]
         self.contents.remove(card)
+        self.by_suit[card.suit].remove(card)
+        self.cards.remove(card)
+        return position
+
+    def copy(self):
+        """Returns an independent copy of the hand"""
+        new_hand = copy.copy(self)
+        new_hand.order = self.order[:]
+        new_hand.contents = self.contents[:]
+        new_hand.by_suit = {suit: cards[:] for suit, cards in self.by_suit.items()}
+        new_hand.cards = self.cards.copy()
+        return new_hand
+
+    def set_cards(self, cards):
+        """Replaces the contents of the hand with a new collection of cards"""
+        self.order = list(cards)
+        self.contents = self.order[:]
+        self.cards = CardSet(self.order)
+        self.arrange_contents()
 
     def has_suit(self, suit):
         """Indicates whether the player has a suit"""
-        for cards in self.contents:
-            if suit == cards.suit:
-                return True
-        return False
+        return len(self.by_suit[suit]) > 0
+
+    def count_suit(self, suit):
+        """Counts the number of cards of a suit in the hand"""
+        return len(self.by_suit[suit])
 
     def select_suit(self, suit):
-        """Selects all cards of a particular suit"""
-        selected_cards = []
-        for cards in self.contents:
-            if suit == cards.suit:
-                selected_cards.append(cards)
-        return selected_cards
+        """Selects all cards of a particular suit
+
+        The returned list is the hand's own bucket for the suit, kept sorted as cards come and go, and must not be
+        modified by the caller.
+        """
+        return self.by_suit[suit]
 
     def select_anti_suit(self, suit):
         """Selects all cards not in a particular suit"""
         selected_cards = []
-        for cards in self.contents:
-            if suit != cards.suit:
-                selected_cards.append(cards)
+        for other_suit in Card.suits:
+            if other_suit != suit:
+                selected_cards.extend(self.by_suit[other_suit])
         return selected_cards
 
     def select_no_points(self):
         """Select all cards in the hand that aren't worth any points"""
-        selected_cards = []
-        queen_of_spades = Card("queen", "spades")
-        for cards in self.contents:
-            if cards.suit != "hearts" and cards != queen_of_spades:
-                selected_cards.append(cards)
+        selected_cards = [cards for cards in self.by_suit["spades"] if cards.index != 10]
+        selected_cards.extend(self.by_suit["diamonds"])
+        selected_cards.extend(self.by_suit["clubs"])
         return selected_cards
 
     def one_suit(self):
         """Determines if a hand is composed of a single suit"""
-        first_suit = self.order[0].suit
-        for cards in self.order[1:]:
-            if cards.suit != first_suit:
-                return False
-        return True
+        return len(self.by_suit[self.order[0].suit]) == len(self.order)
 
     def legal_moves(self, trick, trick_num, hearts_broken):
         """Determines a set of legal cards to play given a trick and a trick number"""
-        legal_cards = []
-        if trick_num == 0:
-            if trick == []:
-                if Card("2", "clubs") in self.contents:
-                    legal_cards.append(Card("2", "clubs"))
+        lead_suit = trick[0].suit if trick else ""
+        return list(self.legal_entry(lead_suit, trick_num == 0, hearts_broken)[1])
+
+    def legal_mask(self, lead_suit, first_trick, hearts_broken):
+        """Returns the mask of legal cards to play, given the suit led ("" when leading), whether this is the first
+        trick, and whether hearts are broken"""
+        return self.legal_entry(lead_suit, first_trick, hearts_broken)[0]
+
+    def legal_entry(self, lead_suit, first_trick, hearts_broken):
+        """Returns the legal mask and the sorted tuple of legal cards for a situation
+
+        Entries depend only on the hand's mask and the situation, so they stay valid as rollouts undo or restore the
+        hand to earlier states; copies of the hand share them, and the memo is emptied once it reaches
+        legal_memo_size entries.
+        """
+        if first_trick and lead_suit != "":
+            lead_suit = "clubs"
+        hand = self.cards.mask
+        situation = (hand, lead_suit, first_trick, hearts_broken)
+        entry = self.legal_memo.get(situation)
+        if entry is None:
+            if first_trick and lead_suit == "":
+                legal = hand & self.two_of_clubs_mask
+                cards = (cards_by_index[39],) if legal else ()
+            elif lead_suit != "" and self.by_suit[lead_suit]:
+                legal = hand & CardSet.suit_masks[lead_suit]
+                cards = tuple(self.by_suit[lead_suit])
+            elif first_trick and hand & self.non_points_mask:
+                legal = hand & self.non_points_mask
+                cards = tuple(self.select_no_points())
+            elif lead_suit == "" and not hearts_broken and hand & self.non_hearts_mask:
+                legal = hand & self.non_hearts_mask
+                cards = tuple(self.select_anti_suit("hearts"))
             else:
-                if self.has_suit("clubs"):
-                    legal_cards.extend(self.select_suit("clubs"))
-                else:
-                    legal_cards.extend(self.select_no_points())
-                    if legal_cards == []:
-                        legal_cards = self.contents
-        else:
-            if trick == []:
-                if not hearts_broken:
-                    legal_cards.extend(self.select_anti_suit("hearts"))
-                    if legal_cards == []:
-                        legal_cards = self.contents
-                else:
-                    legal_cards = self.contents
+                legal = hand
+                cards = tuple(self.contents)
+            entry = (legal, cards)
+            if len(self.legal_memo) >= self.legal_memo_size:
+                self.legal_memo.clear()
+            self.legal_memo[situation] = entry
+        return entry
+
+class KnowledgeState(collections.abc.Mapping):
+    """What a player knows about the cards they cannot see: for each other seat (left, across, right) a 52-bit mask
+    of the cards that seat may still hold. A card shown clears one bit in every mask and a void is an AND-NOT of a
+    suit mask. The old dict keys ("held by left or across",
+    "left no spades", "only points", ...) still read as the same card lists and flags, but cannot be written"""
+
+    __slots__ = ("possible", "only_points")
+
+    seat_names = ["left", "across", "right"]
+    held_keys = {"held by any": (0, 1, 2), "held by left": (0,), "held by across": (1,), "held by right": (2,),
+                 "held by left or across": (0, 1), "held by left or right": (0, 2), "held by across or right": (1, 2)}
+    void_keys = {name + " no " + suit: (seat, CardSet.suit_masks[suit]) for suit in Card.suits
+                 for seat, name in enumerate(["left", "across", "right"])}
+    key_order = list(held_keys) + list(void_keys) + ["only points"]
+
+    def __init__(self, unseen=0):
+        """Starts from a mask of the cards the player cannot see, any of which any other seat may hold"""
+        self.possible = [unseen, unseen, unseen]
+        self.only_points = ""
+
+    def __repr__(self):
+        """Defines a representation of a knowledge state"""
+        return "KnowledgeState(%s)" % {key: self[key] for key in self.held_keys if self[key]}
+
+    def __getitem__(self, key):
+        seats = self.held_keys.get(key)
+        if seats is not None:
+            return list(CardSet(mask=self.held_mask(seats)))
+        void = self.void_keys.get(key)
+        if void is not None:
+            return not self.possible[void[0]] & void[1]
+        if key == "only points":
+            return self.only_points
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.key_order)
+
+    def __len__(self):
+        return len(self.key_order)
+
+    def __eq__(self, other):
+        return isinstance(other, KnowledgeState) and self.state() == other.state()
+
+    def held_mask(self, seats):
+        """Mask of the cards that exactly the given seats may hold"""
+        possible = self.possible
+        mask = CardSet.full
+        for seat in range(3):
+            if seat in seats:
+                mask &= possible[seat]
             else:
-                trick_suit = trick[0].suit
-                if self.has_suit(trick_suit):
-                    legal_cards.extend(self.select_suit(trick_suit))
-                else:
-                    legal_cards = self.contents
+                mask &= ~possible[seat]
+        return mask
+
+    def copy(self):
+        """Returns an independent copy of the knowledge"""
+        new_knowledge = KnowledgeState()
+        new_knowledge.possible = self.possible[:]
+        new_knowledge.only_points = self.only_points
+        return new_knowledge
+
+    def state(self):
+        """Captures the knowledge in a tuple that restore() accepts"""
+        return tuple(self.possible), self.only_points
+
+    def restore(self, state):
+        """Returns the knowledge to a state captured by state()"""
+        possible, self.only_points = state
+        self.possible = list(possible)
+
+    def remove(self, mask):
+        """Records that the cards in mask are no longer held by any other seat"""
+        possible = self.possible
+        possible[0] &= ~mask
+        possible[1] &= ~mask
+        possible[2] &= ~mask
+
+    def assign(self, seat, mask):
+        """Records that seat holds the cards in mask, such as cards passed to it"""
+        for other in range(3):
+            if other == seat:
+                self.possible[other] |= mask
+            else:
+                self.possible[other] &= ~mask
+
+    def exclude(self, seat, mask):
+        """Records that seat holds none of the cards in mask"""
+        self.possible[seat] &= ~mask
+
+    def observe(self, seat, index, excluded, cards_left):
+        """Updates the knowledge after seat plays the card with the given index, which shows that it holds none of
+        the cards in excluded and leaves it cards_left cards"""
+        self.remove(1 << index)
+        if excluded:
+            if excluded & HeartsRound.non_points_mask == HeartsRound.non_points_mask:
+                self.only_points = seat
+            self.exclude(seat, excluded)
+        possible = self.possible
+        certain = possible[seat] & ~(possible[seat - 1] | possible[seat - 2])
+        if certain.bit_count() == cards_left:
+            possible[seat] = certain
+        elif possible[seat].bit_count() == cards_left:
+            possible[seat - 1] &= ~possible[seat]
+            possible[seat - 2] &= ~possible[seat]
+
+
+def print_event(event, *details):
+    """Default event sink for HeartsRound and Hearts, printing each event to the console"""
+    if event == "play":
+        print(details[0].name, "played:", details[1])
+    elif event == "trick":
+        print(details[0])
+    elif event == "win":
+        print(details[0].name, "has won trick", details[1], "with the", details[2])
+    elif event == "invalid":
+        print("Invalid play:", details[0], "- try again")
+    else:
+        print(details[0])
 
-        return legal_cards
 
 class Player(object):
     """Defines a player in a hearts game. Random Performance: Approaches 78 ppg with a variance approaching 26 ppg.
@@ -279,12 +556,7 @@ class Player(object):
         self.won_cards = []
         self.score = 0
         self.trials = 0
-        self.knowledge = {"held by any": [], "held by left": [], "held by across": [], "held by right": [],
-                          "held by left or across": [], "held by left or right": [], "held by across or right": [],
-                          "left no spades": False, "across no spades": False, "right no spades": False,
-                          "left no hearts": False, "across no hearts": False, "right no hearts": False,
-                          "left no diamonds": False, "across no diamonds": False, "right no diamonds": False,
-                          "left no clubs": False, "across no clubs": False, "right no clubs": False, "only points": ""}
+        self.knowledge = KnowledgeState()
 
         # {"my score": 0, "left score": 0, "across score": 0, "right score": 0,
         #               "pass direction": "", "passed by me": [], "passed to me": [], "played by all": [],
@@ -344,10 +616,10 @@ class Player(object):
                 choice_str = str(input("Choose a card from your hand to pass: "))
                 card_value = ""
                 card_suit = ""
-                for value in hand.value_items:
+                for value in Card.value_items:
                     if value in choice_str:
                         card_value = value
-                for suit in hand.suits:
+                for suit in Card.suits:
                     if suit in choice_str:
                         card_suit = suit
                 if card_value == "" or card_suit == "":
@@ -381,10 +653,10 @@ class Player(object):
                 choice_str = str(input("Choose a card from your hand to play: "))
                 card_value = ""
                 card_suit = ""
-                for value in self.hand.value_items:
+                for value in Card.value_items:
                     if value in choice_str:
                         card_value = value
-                for suit in self.hand.suits:
+                for suit in Card.suits:
                     if suit in choice_str:
                         card_suit = suit
                 if card_value == "" or card_suit == "":
@@ -395,7 +667,7 @@ class Player(object):
 
     def play_card(self, card):
         """Compels a player to play a particular card"""
-        if card in self.hand.contents:
+        if card in self.hand:
             self.hand.remove_card(card)
             return card
         else:
@@ -403,37 +675,44 @@ class Player(object):
 
     def has_suit(self, suit):
         """Indicates whether the player has a suit"""
-        for cards in self.hand.order:
-            if suit == cards.suit:
-                return True
-        return False
+        return self.hand.has_suit(suit)
 
     def count_suit(self, suit):
         """Counts the number of cards of a suit in a players hand"""
-        count = 0
-        for cards in self.hand.order:
-            if suit == cards.suit:
-                count += 1
-        return count
+        return self.hand.count_suit(suit)
 
     def has_start(self, start_card=Card("2", "clubs")):
         """Indicates with the player has the starting card"""
-        for cards in self.hand.order:
-            if cards.suit == start_card.suit and cards.value == start_card.value:
-                return True
-        return False
+        return start_card in self.hand
+
+def zobrist_table(rng, rows, columns):
+    """Returns a rows x columns table of random 64-bit Zobrist keys"""
+    return [[rng.getrandbits(64) for column in range(columns)] for row in range(rows)]
+
 
 class HeartsRound(object):
     """Plays a round of hearts"""
 
     pass_options = ["left", "right", "across", "none"]
 
-    standard_deck = Deck()
-
-    def __init__(self, player1, player2, player3, player4, pass_dir):
-        """Initiates a games of hearts with 4 players"""
+    seat_names = ["left", "across", "right"]
+    queen_of_spades_mask = 1 << 10
+    non_hearts_mask = CardSet.full & ~CardSet.suit_masks["hearts"]
+    non_points_mask = non_hearts_mask & ~queen_of_spades_mask
+    points_mask = CardSet.full & ~non_points_mask
+    card_points = (0,) * 10 + (13,) + (0,) * 2 + (1,) * 13 + (0,) * 26
+
+    zobrist_rng = random.Random(0x5EED)
+    hand_keys = zobrist_table(zobrist_rng, 4, 52)
+    trick_keys = zobrist_table(zobrist_rng, 4, 52)
+    lead_keys = zobrist_table(zobrist_rng, 1, 4)[0]
+    points_keys = zobrist_table(zobrist_rng, 4, 27)
+    hearts_broken_key = zobrist_rng.getrandbits(64)
+
+    def __init__(self, player1, player2, player3, player4, pass_dir, rng=None):
+        """Initiates a games of hearts with 4 players, dealing with rng (a random.Random or numpy Generator)"""
         new_deck = Deck()
-        new_deck.shuffle()
+        new_deck.shuffle(rng)
         player1.hand = Hand(new_deck)
         player2.hand = Hand(new_deck)
         player3.hand = Hand(new_deck)
@@ -445,27 +724,10 @@ class HeartsRound(object):
 
         self.players = [player1, player2, player3, player4]
         for player in self.players:
-            for card in self.standard_deck.contents:
-                if card not in player.hand.contents:
-                    list.append(player.knowledge["held by any"], card)
-            if player.hand.one_suit():
-                single_suit = player.hand.contents[0].suit
-                if pass_dir == "none":
-                    player.knowledge["left no " + single_suit] = True
-                    player.knowledge["across no " + single_suit] = True
-                    player.knowledge["right no " + single_suit] = True
-                elif pass_dir == "left":
-                    player.knowledge["across no " + single_suit] = True
-                    player.knowledge["right no " + single_suit] = True
-                elif pass_dir == "across":
-                    player.knowledge["left no " + single_suit] = True
-                    player.knowledge["right no " + single_suit] = True
-                else:
-                    player.knowledge["left no " + single_suit] = True
-                    player.knowledge["across no " + single_suit] = True
+            player.knowledge = KnowledgeState(player.hand.cards.complement().mask)
 
         self.played_players = {player1.name: [], player2.name: [], player3.name: [], player4.name: []}
-        self.played_all = []
+        self.played_all = CardSet()
         self.passed_players = {player1.name: [], player2.name: [], player3.name: [], player4.name: []}
         self.passed = False
         self.started = False
@@ -476,6 +738,12 @@ class HeartsRound(object):
         self.trick_num = 0
         self.hearts_broken = False
         self.round_score = {player1.name: 0, player2.name: 0, player3.name: 0, player4.name: 0}
+        self.points_won = [0, 0, 0, 0]
+        # Cards each seat has shown it lacks; the list is replaced rather than changed, so clones and undo entries
+        # can share it
+        self.ruled_out = [0, 0, 0, 0]
+        self.undo_stack = []
+        self.zobrist = self.position_hash()
         if pass_dir in self.pass_options:
             self.pass_dir = pass_dir
         else:
@@ -490,6 +758,247 @@ class HeartsRound(object):
             self.hearts_broken == other.hearts_broken and self.round_score == other.round_score and self.pass_dir == \
             other.pass_dir
 
+    def clone(self, ai=None):
+        """Returns a copy of the round that shares no mutable state with it. The players are copied as well, and
+        are replaced by plain Players with the given ai when one is given"""
+        new_round = copy.copy(self)
+        new_round.players = []
+        for player in self.players:
+            if ai is None:
+                new_player = copy.copy(player)
+            else:
+                new_player = Player(player.name, None, ai)
+                new_player.trials = player.trials
+            new_player.hand = player.hand.copy()
+            new_player.won_cards = player.won_cards[:]
+            new_player.score = player.score
+            new_player.knowledge = player.knowledge.copy()
+            new_round.players.append(new_player)
+        new_round.has_lead = new_round.players[self.players.index(self.has_lead)]
+        new_round.played_players = {name: cards[:] for name, cards in self.played_players.items()}
+        new_round.played_all = self.played_all.copy()
+        new_round.passed_players = dict(self.passed_players)
+        new_round.trick = self.trick[:]
+        new_round.round_score = dict(self.round_score)
+        new_round.points_won = self.points_won[:]
+        new_round.undo_stack = []
+        return new_round
+
+    def snapshot(self):
+        """Captures the mutable per-round state in a flat tuple that can be handed back to restore()"""
+        player_states = []
+        for player in self.players:
+            hand = player.hand
+            player_states.append((hand.order[:], hand.contents[:], hand.cards.mask, player.won_cards[:], player.score,
+                                  player.knowledge.copy()))
+        return (player_states, {name: cards[:] for name, cards in self.played_players.items()},
+                self.played_all.mask, dict(self.passed_players), self.passed, self.started, self.complete,
+                self.players.index(self.has_lead), self.trick[:], self.trick_suit, self.trick_num,
+                self.hearts_broken, dict(self.round_score), self.points_won[:], self.ruled_out)
+
+    def restore(self, state):
+        """Returns the round to a state captured by snapshot(); a snapshot can be restored any number of times"""
+        (player_states, played_players, played_mask, passed_players, self.passed, self.started, self.complete,
+         lead_index, trick, self.trick_suit, self.trick_num, self.hearts_broken, round_score, points_won,
+         self.ruled_out) = state
+        for player, (order, contents, mask, won_cards, score, knowledge) in zip(self.players, player_states):
+            hand = player.hand
+            hand.order = order[:]
+            hand.contents = contents[:]
+            hand.index_suits()
+            hand.cards = CardSet(mask=mask)
+            player.won_cards = won_cards[:]
+            player.score = score
+            player.knowledge = knowledge.copy()
+        self.played_players = {name: cards[:] for name, cards in played_players.items()}
+        self.played_all = CardSet(mask=played_mask)
+        self.passed_players = dict(passed_players)
+        self.has_lead = self.players[lead_index]
+        self.trick = trick[:]
+        self.round_score = dict(round_score)
+        self.points_won = points_won[:]
+        self.undo_stack = []
+        self.zobrist = self.position_hash()
+
+    def position_hash(self):
+        """Computes the Zobrist hash of the position from scratch: the cards in each hand, the current trick, the
+        leader, whether hearts are broken and the points won by each seat. apply_play() and undo_play() keep
+        self.zobrist equal to it incrementally"""
+        lead_seat = self.players.index(self.has_lead)
+        key = self.lead_keys[lead_seat]
+        for seat, player in enumerate(self.players):
+            hand = player.hand.cards.mask
+            while hand:
+                low = hand & -hand
+                key ^= self.hand_keys[seat][low.bit_length() - 1]
+                hand ^= low
+            key ^= self.points_keys[seat][self.points_won[seat]]
+        for position, card in enumerate(self.trick):
+            key ^= self.trick_keys[(lead_seat + position) % 4][card.index]
+        if self.hearts_broken:
+            key ^= self.hearts_broken_key
+        return key
+
+    def apply_play(self, player, card):
+        """Plays a card for a player: updates the trick, the lead, the played cards and the other players'
+        knowledge, and resolves the trick once it is complete, returning the winning card if it did. Every change is
+        logged so that undo_play() can revert it"""
+        journal = []
+        trick_suit = self.trick_suit
+        leader = self.has_lead
+        zobrist = self.zobrist
+        ruled_out = self.ruled_out
+        self.observe_play(player, card, journal)
+        position = player.hand.remove_card(card)
+        seat = self.players.index(player)
+        self.zobrist ^= self.hand_keys[seat][card.index] ^ self.trick_keys[seat][card.index]
+        if not self.trick:
+            self.zobrist ^= self.lead_keys[self.players.index(self.has_lead)] ^ self.lead_keys[seat]
+            self.has_lead = player
+            self.trick_suit = card.suit
+        self.trick.append(card)
+        self.played_all.add(card)
+        self.played_players[player.name].append(card)
+        finished = None
+        high_card = None
+        if len(self.trick) == 4:
+            finished = (self.trick, self.trick_suit, self.has_lead, self.hearts_broken, self.complete,
+                        self.points_won[:])
+            high_card = self.finish_trick()
+            lead_seat = self.players.index(finished[2])
+            for position_in_trick, trick_card in enumerate(finished[0]):
+                self.zobrist ^= self.trick_keys[(lead_seat + position_in_trick) % 4][trick_card.index]
+            winner = self.players.index(self.has_lead)
+            self.zobrist ^= self.lead_keys[lead_seat] ^ self.lead_keys[winner]
+            self.zobrist ^= self.points_keys[winner][finished[5][winner]] ^ \
+                self.points_keys[winner][self.points_won[winner]]
+            if self.hearts_broken != finished[3]:
+                self.zobrist ^= self.hearts_broken_key
+        self.undo_stack.append((player, card, position, trick_suit, leader, journal, finished, zobrist, ruled_out))
+        return high_card
+
+    def undo_play(self):
+        """Reverts the most recent apply_play()"""
+        (player, card, position, trick_suit, leader, journal, finished, self.zobrist,
+         self.ruled_out) = self.undo_stack.pop()
+        if finished is not None:
+            del self.has_lead.won_cards[-4:]
+            self.trick, self.trick_suit, self.has_lead, self.hearts_broken, self.complete, self.points_won = finished
+            self.trick_num -= 1
+        self.trick.pop()
+        self.trick_suit = trick_suit
+        self.has_lead = leader
+        self.played_all.discard(card)
+        self.played_players[player.name].pop()
+        player.hand.add_card(card, position)
+        for knowledge, state in reversed(journal):
+            knowledge.restore(state)
+
+    def observe_play(self, player, card, journal=None):
+        """Updates the knowledge of the other three players after player shows card in the current trick, and the
+        public record of the cards each seat has shown it lacks. The state each knowledge had before is logged to
+        journal as (knowledge, state)"""
+        leading = not self.trick
+        excluded = 0
+        if leading:
+            if card.suit == "hearts" and not self.hearts_broken and self.trick_num > 0:
+                excluded = self.non_hearts_mask
+        else:
+            if card.suit != self.trick_suit:
+                excluded = CardSet.suit_masks[self.trick_suit]
+            if self.trick_num == 0 and (card.suit == "hearts" or card.index == 10):
+                excluded |= self.non_points_mask
+        cards_left = len(player.hand.contents) - 1
+
+        player_index = self.players.index(player)
+        if excluded & ~self.ruled_out[player_index]:
+            self.ruled_out = self.ruled_out[:]
+            self.ruled_out[player_index] |= excluded
+        for offset in range(1, 4):
+            knowledge = self.players[(player_index - offset) % 4].knowledge
+            if journal is not None:
+                journal.append((knowledge, knowledge.state()))
+            knowledge.observe(offset - 1, card.index, excluded, cards_left)
+
+    def rebuild_knowledge(self, seats):
+        """Gives the players in seats fresh knowledge after their hands were redealt, derived in one pass from the
+        public record: every seat may hold any unplayed card it has not been shown to lack, other than the observer's
+        own cards. The masks each seat may hold are worked out once and shared by all the observers"""
+        unplayed = CardSet.full & ~self.played_all.mask
+        allowed = [unplayed & ~ruled_out for ruled_out in self.ruled_out]
+        for seat in seats:
+            player = self.players[seat]
+            knowledge = KnowledgeState()
+            knowledge.only_points = player.knowledge.only_points
+            unseen = ~player.hand.cards.mask
+            knowledge.possible = [allowed[(seat + 1) % 4] & unseen, allowed[(seat + 2) % 4] & unseen,
+                                  allowed[(seat + 3) % 4] & unseen]
+            player.knowledge = knowledge
+
+    def finish_trick(self):
+        """Awards a complete trick to its winner, who takes the lead, and returns the winning card"""
+        high_card = self.trick[0]
+        for card in self.trick:
+            if card.hearts_compare(high_card):
+                high_card = card
+            if card.suit == "hearts" and not self.hearts_broken:
+                self.hearts_broken = True
+        high_card_index = self.trick.index(high_card)
+        if high_card_index == 0:
+            self.has_lead.won_cards.extend(self.trick)
+        if high_card_index > 0:
+            other_players = self.player_rotation()
+            self.has_lead = other_players[high_card_index - 1]
+            self.has_lead.won_cards.extend(self.trick)
+        self.points_won[self.players.index(self.has_lead)] += sum(self.card_points[card.index] for card in self.trick)
+        self.trick_num += 1
+        if self.trick_num == 13:
+            self.complete = True
+        self.trick = []
+        self.trick_suit = ""
+        return high_card
+
+    def play_history(self):
+        """Returns the (player, card) plays made through apply_play() since the round was created, in order"""
+        return [(entry[0], entry[1]) for entry in self.undo_stack]
+
+    def next_player(self):
+        """Returns the player due to play the next card"""
+        if self.trick_num == 0 and self.trick == []:
+            for player in self.players:
+                if player.has_start():
+                    return player
+        return self.players[(self.players.index(self.has_lead) + len(self.trick)) % 4]
+
+    def play_out(self):
+        """Silently plays the rest of the round with apply_play() and returns the number of cards played"""
+        plays = 0
+        while self.trick_num < 13:
+            player = self.next_player()
+            self.apply_play(player, player.choose_play(self))
+            plays += 1
+        return plays
+
+    def information_set(self, seat):
+        """Returns a hashable key for everything the player in seat knows about the position: its hand and
+        knowledge, the cards played, the current trick and its leader, the points taken and the game scores"""
+        player = self.players[seat]
+        return (seat, player.hand.cards.mask, player.knowledge.state(), self.played_all.mask,
+                tuple(card.index for card in self.trick), self.players.index(self.has_lead), tuple(self.points_won),
+                tuple(other.score for other in self.players))
+
+    def points_taken(self):
+        """Returns the points in each player's won cards so far this round, in seat order"""
+        return self.points_won[:]
+
+    def round_points(self):
+        """Counts the points each player has taken this round, in seat order and after the moonshot rule, without
+        touching the scores"""
+        points = self.points_taken()
+        if 26 in points:
+            points = [0 if p == 26 else 26 for p in points]
+        return points
+
     def player_rotation(self):
         """Determines the player rotation given the player with the lead"""
         lead_position = self.players.index(self.has_lead)
@@ -514,61 +1023,53 @@ class HeartsRound(object):
         if lead_position == 3:
             return self.players[:3]
 
+    def outstanding_mask(self, player):
+        """Mask of the cards another player may still play against the player's cards: those neither played nor in
+        the player's hand, plus the cards of the current trick"""
+        return CardSet.full & ~(self.played_all.mask | player.hand.cards.mask) | CardSet(self.trick).mask
+
     def equivalent_moves(self, player):
         """Determines if all of a players legal moves are equivalent"""
-        legal_moves = player.hand.legal_moves(self.trick, self.trick_num, self.hearts_broken)
-        card_suit = legal_moves[0].suit
-        for cards in legal_moves[1:]:
-            if cards.suit != card_suit:
-                return False
-        low_card = legal_moves[0]
-        for cards in legal_moves[1:]:
-            if low_card.hearts_compare(cards):
-                low_card = cards
-        high_card = legal_moves[0]
-        for cards in legal_moves[1:]:
-            if not high_card.hearts_compare(cards):
-                high_card = cards
-        higher_cards = low_card.cards_above()
-        lower_cards = high_card.cards_below()
-        inbetween_cards = [i for i in lower_cards if i in higher_cards]
-
-        for cards in inbetween_cards:
-            if cards not in self.played_all and cards not in player.hand.contents or cards in self.trick:
-                return False
-        return True
+        legal = player.hand.legal_mask(self.trick_suit, self.trick_num == 0, self.hearts_broken)
+        low_index = (legal & -legal).bit_length() - 1
+        high_index = legal.bit_length() - 1
+        if low_index // 13 != high_index // 13:
+            return False
+        inbetween_cards = Card.above_masks[low_index] & Card.below_masks[high_index]
+        return inbetween_cards & self.outstanding_mask(player) == 0
+
+    def move_classes(self, player, cards):
+        """Groups a player's cards into classes of interchangeable moves: cards of a suit with no card ranked between
+        them still unplayed or in the current trick, keeping the queen of spades apart for its points. The classes
+        and the cards in each run from low to high"""
+        live = CardSet.full & ~self.played_all.mask | CardSet(self.trick).mask
+        classes = []
+        previous = None
+        for card in sorted(cards, key=Card.sort_key):
+            if previous is None or previous.suit != card.suit or card.index == 10 or previous.index == 10 or \
+                    live & Card.above_masks[previous.index] & Card.below_masks[card.index]:
+                classes.append([card])
+            else:
+                classes[-1].append(card)
+            previous = card
+        return classes
 
     def points_remain(self):
         """Determines if points remain in the round"""
-        points_cards = [Card("2", "hearts"), Card("3", "hearts"), Card("4", "hearts"), Card("5", "hearts"),
-                        Card("6", "hearts"), Card("7", "hearts"), Card("8", "hearts"), Card("9", "hearts"),
-                        Card("10", "hearts"), Card("jack", "hearts"), Card("queen", "hearts"), Card("king", "hearts"),
-                        Card("ace", "hearts"), Card("queen", "spades")]
-
-        for cards in points_cards:
-            if cards not in self.played_all or cards in self.trick:
-                return True
-        return False
+        return self.points_mask & (~self.played_all.mask | CardSet(self.trick).mask) != 0
 
     def cant_effect_outcome(self, player):
         """Determines if any of the cards in the players hand can win a trick and if any of them contain points"""
-        player_hand = player.hand.contents
-        points_cards = [Card("2", "hearts"), Card("3", "hearts"), Card("4", "hearts"), Card("5", "hearts"),
-                        Card("6", "hearts"), Card("7", "hearts"), Card("8", "hearts"), Card("9", "hearts"),
-                        Card("10", "hearts"), Card("jack", "hearts"), Card("queen", "hearts"), Card("king", "hearts"),
-                        Card("ace", "hearts"), Card("queen", "spades")]
-
-        for cards in player_hand:
-            if cards in points_cards:
-                return False
-            lower_cards = cards.cards_below()
-            for card in lower_cards:
-                if card not in self.played_all and card not in player.hand.contents or card in self.trick:
-                    return False
-        return True
-
-    def start_passing(self):
-        """Starts a passing before a round of hearts"""
+        hand_mask = player.hand.cards.mask
+        if hand_mask & self.points_mask:
+            return False
+        lower_cards = 0
+        for cards in player.hand.contents:
+            lower_cards |= Card.below_masks[cards.index]
+        return lower_cards & self.outstanding_mask(player) == 0
+
+    def start_passing(self, sink=print_event):
+        """Starts a passing before a round of hearts, reporting the cards passed to human players to sink"""
         if self.passed is False and self.trick_num == 0 and self.pass_dir != "none":
             passes = {}
             for player in self.players:
@@ -577,3553 +1078,100 @@ class HeartsRound(object):
             if self.pass_dir == "left":
                 for i, player in enumerate(self.players):
                     pass_to_player = self.players[(i + 1) % 4]
-                    list.extend(player.knowledge["held by left"], passes[player.name])
+                    player.knowledge.assign(0, CardSet(passes[player.name]).mask)
                     for cards in passes[player.name]:
                         pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
-                    if pass_to_player.ai == "human":
-                        print(pass_to_player.name, "has been passed:\n", passes[player.name])
+                        pass_to_player.knowledge.remove(1 << cards.index)
+                    if pass_to_player.ai == "human" and sink is not None:
+                        sink("notice", "%s has been passed:\n %s" % (pass_to_player.name, passes[player.name]))
 
             if self.pass_dir == "right":
                 for i, player in enumerate(self.players):
                     pass_to_player = self.players[(i - 1) % 4]
-                    list.extend(player.knowledge["held by right"], passes[player.name])
+                    player.knowledge.assign(2, CardSet(passes[player.name]).mask)
                     for cards in passes[player.name]:
                         pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
-                    if pass_to_player.ai == "human":
-                        print(pass_to_player.name, "has been passed:\n", passes[player.name])
+                        pass_to_player.knowledge.remove(1 << cards.index)
+                    if pass_to_player.ai == "human" and sink is not None:
+                        sink("notice", "%s has been passed:\n %s" % (pass_to_player.name, passes[player.name]))
 
             if self.pass_dir == "across":
                 for i, player in enumerate(self.players):
                     pass_to_player = self.players[(i + 2) % 4]
-                    list.extend(player.knowledge["held by across"], passes[player.name])
+                    player.knowledge.assign(1, CardSet(passes[player.name]).mask)
                     for cards in passes[player.name]:
                         pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
-                    if pass_to_player.ai == "human":
-                        print(pass_to_player.name, "has been passed:\n", passes[player.name])
+                        pass_to_player.knowledge.remove(1 << cards.index)
+                    if pass_to_player.ai == "human" and sink is not None:
+                        sink("notice", "%s has been passed:\n %s" % (pass_to_player.name, passes[player.name]))
 
             self.passed_players = passes
             self.passed = True
+            self.zobrist = self.position_hash()
 
         else:
             if self.pass_dir == "none":
                 self.passed = True
-            else:
-                print("Players already passed")
+            elif sink is not None:
+                sink("notice", "Players already passed")
 
     def start_passing_np(self):
         """Starts a passing before a round of hearts with no printing"""
-        if self.passed is False and self.trick_num == 0 and self.pass_dir != "none":
-            passes = {}
-            for player in self.players:
-                passes[player.name] = player.choose_pass()
-
-            if self.pass_dir == "left":
-                for i, player in enumerate(self.players):
-                    pass_to_player = self.players[(i + 1) % 4]
-                    list.extend(player.knowledge["held by left"], passes[player.name])
-                    for cards in passes[player.name]:
-                        pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
-
-            if self.pass_dir == "right":
-                for i, player in enumerate(self.players):
-                    pass_to_player = self.players[(i - 1) % 4]
-                    list.extend(player.knowledge["held by right"], passes[player.name])
-                    for cards in passes[player.name]:
-                        pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
-
-            if self.pass_dir == "across":
-                for i, player in enumerate(self.players):
-                    pass_to_player = self.players[(i + 2) % 4]
-                    list.extend(player.knowledge["held by across"], passes[player.name])
-                    for cards in passes[player.name]:
-                        pass_to_player.hand.add_card(cards)
-                        list.remove(pass_to_player.knowledge["held by any"], cards)
+        self.start_passing(None)
 
-            self.passed_players = passes
-            self.passed = True
-
-        else:
-            if self.pass_dir == "none":
-                self.passed = True
-
-    def play_trick(self):
-        """Initiates the next trick of the round"""
+    def play_trick(self, sink=print_event):
+        """Plays the rest of the current trick, reporting each event to sink; pass sink=None to play silently"""
         if self.passed is False:
-            print("Please pass first")
+            if sink is not None:
+                sink("notice", "Please pass first")
             return
         if self.trick_num >= 13:
-            print("Round over!")
+            if sink is not None:
+                sink("notice", "Round over!")
             return
 
-        elif self.trick_num == 0 and self.trick == []:
+        if self.trick_num == 0 and self.trick == []:
             self.started = True
-            for player in self.players:
-                if player.hand.one_suit():
-                    single_suit = player.hand.contents[0].suit
-                    player.knowledge["left no " + single_suit] = True
-                    player.knowledge["across no " + single_suit] = True
-                    player.knowledge["right no " + single_suit] = True
-                if player.has_start() is True:
-                    self.has_lead = player
-            self.trick.append(self.has_lead.play_card(Card("2", "clubs")))
-            self.trick_suit = "clubs"
-            self.played_all.append(Card("2", "clubs"))
-            self.played_players[self.has_lead.name].append(Card("2", "clubs"))
-            print(self.has_lead.name, "played:", Card("2", "clubs"))
-            for player in self.player_rotation():
-                if self.trick[0] in player.knowledge["held by any"]:
-                    list.remove(player.knowledge["held by any"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left"]:
-                    list.remove(player.knowledge["held by left"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across"]:
-                    list.remove(player.knowledge["held by across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by right"]:
-                    list.remove(player.knowledge["held by right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or across"]:
-                    list.remove(player.knowledge["held by left or across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or right"]:
-                    list.remove(player.knowledge["held by left or right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across or right"]:
-                    list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                card_to_play = player.choose_play(self)
-                while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                    print("Invalid play: you must follow suit - try again")
-                    card_to_play = player.choose_play(self)
-
-                while card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades"):
-                    print("Invalid play: no points on the first trick - try again")
-                    card_to_play = player.choose_play(self)
-                    if not player.has_suit("diamonds") and not player.has_suit("clubs") \
-                            and not player.has_suit("spades") or not player.has_suit("diamonds") \
-                            and not player.has_suit("clubs") and player.count_suit("hearts") == 12 \
-                            and player.has_start("queen", "spades"):
-                        break
-
-                notify_players = self.player_order(player)
-
-                for p in notify_players:
-                    if card_to_play in p.knowledge["held by any"]:
-                        list.remove(p.knowledge["held by any"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left"]:
-                        list.remove(p.knowledge["held by left"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across"]:
-                        list.remove(p.knowledge["held by across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by right"]:
-                        list.remove(p.knowledge["held by right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or across"]:
-                        list.remove(p.knowledge["held by left or across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or right"]:
-                        list.remove(p.knowledge["held by left or right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across or right"]:
-                        list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                if card_to_play.suit != self.trick_suit:
-                    if card_to_play == Card("queen", "spades"):
-                        notify_players[0].knowledge["only points"] = 2
-                        notify_players[1].knowledge["only points"] = 1
-                        notify_players[2].knowledge["only points"] = 0
-
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            notify_players[0].knowledge["right no spades"] = True
-                            notify_players[0].knowledge["right no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if notify_players[0].has_suit("hearts"):
-                                notify_players[0].knowledge["held by right"].extend(
-                                    notify_players[0].knowledge["held by any"])
-                                notify_players[0].knowledge["held by any"] = []
-
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            notify_players[1].knowledge["across no spades"] = True
-                            notify_players[1].knowledge["across no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if notify_players[1].has_suit("hearts"):
-                                notify_players[1].knowledge["held by across"].extend(
-                                    notify_players[1].knowledge["held by any"])
-                                notify_players[1].knowledge["held by any"] = []
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            notify_players[2].knowledge["left no spades"] = True
-                            notify_players[2].knowledge["left no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                            if notify_players[2].has_suit("hearts"):
-                                notify_players[2].knowledge["held by left"].extend(
-                                    notify_players[2].knowledge["held by any"])
-                                notify_players[2].knowledge["held by any"] = []
-
-                    elif card_to_play.suit == "hearts":
-                        notify_players[0].knowledge["only points"] = 2
-                        notify_players[1].knowledge["only points"] = 1
-                        notify_players[2].knowledge["only points"] = 0
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            notify_players[0].knowledge["right no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                                notify_players[0].knowledge["held by right"].extend(notify_players[0].knowledge["held by any"])
-                                notify_players[0].knowledge["held by any"] = []
-
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            notify_players[1].knowledge["across no spades"] = True
-                            notify_players[1].knowledge["across no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                                notify_players[1].knowledge["held by across"].extend(notify_players[1].knowledge["held by any"])
-                                notify_players[1].knowledge["held by any"] = []
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            notify_players[2].knowledge["left no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                                notify_players[2].knowledge["held by left"].extend(notify_players[2].knowledge["held by any"])
-                                notify_players[2].knowledge["held by any"] = []
-                    else:
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                self.trick.append(card_to_play)
-                player.hand.remove_card(card_to_play)
-                self.played_all.append(card_to_play)
-                self.played_players[player.name].append(card_to_play)
-                print(player.name, "played:", card_to_play)
-            print(self.trick)
-
-        elif self.trick_num == 0:
-            trick_progress = len(self.trick) - 1
-            rotation = self.player_rotation()
-            last_card = self.trick[trick_progress]
-            if trick_progress == 0:
-                last_player = self.has_lead
-            else:
-                last_player = rotation[trick_progress - 1]
-
-            notify_players = self.player_order(last_player)
-
-            for p in notify_players:
-                if last_card in p.knowledge["held by any"]:
-                    list.remove(p.knowledge["held by any"], last_card)
-                elif last_card in p.knowledge["held by left"]:
-                    list.remove(p.knowledge["held by left"], last_card)
-                elif last_card in p.knowledge["held by across"]:
-                    list.remove(p.knowledge["held by across"], last_card)
-                elif last_card in p.knowledge["held by right"]:
-                    list.remove(p.knowledge["held by right"], last_card)
-                elif last_card in p.knowledge["held by left or across"]:
-                    list.remove(p.knowledge["held by left or across"], last_card)
-                elif last_card in p.knowledge["held by left or right"]:
-                    list.remove(p.knowledge["held by left or right"], last_card)
-                elif last_card in p.knowledge["held by across or right"]:
-                    list.remove(p.knowledge["held by across or right"], last_card)
-
-            if last_card.suit != self.trick_suit:
-                if last_card == Card("queen", "spades"):
-                    notify_players[0].knowledge["only points"] = 2
-                    notify_players[1].knowledge["only points"] = 1
-                    notify_players[2].knowledge["only points"] = 0
-
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        notify_players[0].knowledge["right no spades"] = True
-                        notify_players[0].knowledge["right no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if notify_players[0].has_suit("hearts"):
-                            notify_players[0].knowledge["held by right"].extend(
-                                notify_players[0].knowledge["held by any"])
-                            notify_players[0].knowledge["held by any"] = []
-
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        notify_players[1].knowledge["across no spades"] = True
-                        notify_players[1].knowledge["across no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if notify_players[1].has_suit("hearts"):
-                            notify_players[1].knowledge["held by across"].extend(
-                                notify_players[1].knowledge["held by any"])
-                            notify_players[1].knowledge["held by any"] = []
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        notify_players[2].knowledge["left no spades"] = True
-                        notify_players[2].knowledge["left no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                        if notify_players[2].has_suit("hearts"):
-                            notify_players[2].knowledge["held by left"].extend(
-                                notify_players[2].knowledge["held by any"])
-                            notify_players[2].knowledge["held by any"] = []
-
-                elif last_card.suit == "hearts":
-                    notify_players[0].knowledge["only points"] = 2
-                    notify_players[1].knowledge["only points"] = 1
-                    notify_players[2].knowledge["only points"] = 0
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        notify_players[0].knowledge["right no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                            notify_players[0].knowledge["held by right"].extend(
-                                notify_players[0].knowledge["held by any"])
-                            notify_players[0].knowledge["held by any"] = []
-
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        notify_players[1].knowledge["across no spades"] = True
-                        notify_players[1].knowledge["across no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                            notify_players[1].knowledge["held by across"].extend(
-                                notify_players[1].knowledge["held by any"])
-                            notify_players[1].knowledge["held by any"] = []
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        notify_players[2].knowledge["left no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                            notify_players[2].knowledge["held by left"].extend(
-                                notify_players[2].knowledge["held by any"])
-                            notify_players[2].knowledge["held by any"] = []
-                else:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-            if trick_progress < 3:
-                for player in rotation[trick_progress:]:
-                    if self.trick[0] in player.knowledge["held by any"]:
-                        list.remove(player.knowledge["held by any"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left"]:
-                        list.remove(player.knowledge["held by left"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across"]:
-                        list.remove(player.knowledge["held by across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by right"]:
-                        list.remove(player.knowledge["held by right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or across"]:
-                        list.remove(player.knowledge["held by left or across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or right"]:
-                        list.remove(player.knowledge["held by left or right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across or right"]:
-                        list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                    card_to_play = player.choose_play(self)
-                    while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                        print("Invalid play: you must follow suit - try again")
-                        card_to_play = player.choose_play(self)
-
-                    while card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades"):
-                        print("Invalid play: no points on the first trick - try again")
-                        card_to_play = player.choose_play(self)
-                        if not player.has_suit("diamonds") and not player.has_suit("clubs") \
-                                and not player.has_suit("spades") or not player.has_suit("diamonds") \
-                                and not player.has_suit("clubs") and player.count_suit("hearts") == 12 \
-                                and player.has_start("queen", "spades"):
-                            break
-
-                    notify_players = self.player_order(player)
-
-                    for p in notify_players:
-                        if card_to_play in p.knowledge["held by any"]:
-                            list.remove(p.knowledge["held by any"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left"]:
-                            list.remove(p.knowledge["held by left"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across"]:
-                            list.remove(p.knowledge["held by across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by right"]:
-                            list.remove(p.knowledge["held by right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or across"]:
-                            list.remove(p.knowledge["held by left or across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or right"]:
-                            list.remove(p.knowledge["held by left or right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across or right"]:
-                            list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                    if card_to_play.suit != self.trick_suit:
-                        if card_to_play == Card("queen", "spades"):
-                            notify_players[0].knowledge["only points"] = 2
-                            notify_players[1].knowledge["only points"] = 1
-                            notify_players[2].knowledge["only points"] = 0
-
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                notify_players[0].knowledge["right no spades"] = True
-                                notify_players[0].knowledge["right no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                                if notify_players[0].has_suit("hearts"):
-                                    notify_players[0].knowledge["held by right"].extend(
-                                        notify_players[0].knowledge["held by any"])
-                                    notify_players[0].knowledge["held by any"] = []
-
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                notify_players[1].knowledge["across no spades"] = True
-                                notify_players[1].knowledge["across no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                                if notify_players[1].has_suit("hearts"):
-                                    notify_players[1].knowledge["held by across"].extend(
-                                        notify_players[1].knowledge["held by any"])
-                                    notify_players[1].knowledge["held by any"] = []
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                notify_players[2].knowledge["left no spades"] = True
-                                notify_players[2].knowledge["left no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                                if notify_players[2].has_suit("hearts"):
-                                    notify_players[2].knowledge["held by left"].extend(
-                                        notify_players[2].knowledge["held by any"])
-                                    notify_players[2].knowledge["held by any"] = []
-
-                        elif card_to_play.suit == "hearts":
-                            notify_players[0].knowledge["only points"] = 2
-                            notify_players[1].knowledge["only points"] = 1
-                            notify_players[2].knowledge["only points"] = 0
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                notify_players[0].knowledge["right no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                                    notify_players[0].knowledge["held by right"].extend(notify_players[0].knowledge["held by any"])
-                                    notify_players[0].knowledge["held by any"] = []
-
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                notify_players[1].knowledge["across no spades"] = True
-                                notify_players[1].knowledge["across no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                                    notify_players[1].knowledge["held by across"].extend(notify_players[1].knowledge["held by any"])
-                                    notify_players[1].knowledge["held by any"] = []
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                notify_players[2].knowledge["left no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                                    notify_players[2].knowledge["held by left"].extend(notify_players[2].knowledge["held by any"])
-                                    notify_players[2].knowledge["held by any"] = []
-                        else:
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                    self.trick.append(card_to_play)
-                    player.hand.remove_card(card_to_play)
-                    self.played_all.append(card_to_play)
-                    self.played_players[player.name].append(card_to_play)
-                    print(player.name, "played:", card_to_play)
-            print(self.trick)
-
-        elif self.trick_num < 13 and self.trick == []:
-            self.trick_suit = ""
-            lead_card = self.has_lead.choose_play(self)
-            while not self.hearts_broken and lead_card.suit == "hearts":
-                print("Invalid play: hearts have not been broken - try again")
-                lead_card = self.has_lead.choose_play(self)
-                if not self.has_lead.has_suit("spades") and not self.has_lead.has_suit("diamonds") \
-                        and not self.has_lead.has_suit("clubs"):
-                    o_players = self.player_rotation()
-
-                    o_players[0].knowledge["right no spades"] = True
-                    o_players[0].knowledge["right no diamonds"] = True
-                    o_players[0].knowledge["right no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by any"] = [i for i in
-                                                             o_players[0].knowledge["held by any"] if
-                                                             i not in cards_to_remove]
-                    o_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by left or right"] = \
-                        [i for i in o_players[0].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by across or right"] = \
-                        [i for i in o_players[0].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by across"].extend(cards_to_remove)
-
-                    o_players[1].knowledge["across no clubs"] = True
-                    o_players[1].knowledge["across no spades"] = True
-                    o_players[1].knowledge["across no diamonds"] = True
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by any"] = \
-                        [i for i in o_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by left or across"] = \
-                        [i for i in o_players[1].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by across or right"] = \
-                        [i for i in o_players[1].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by right"].extend(cards_to_remove)
-
-                    o_players[2].knowledge["left no spades"] = True
-                    o_players[2].knowledge["left no diamonds"] = True
-                    o_players[2].knowledge["left no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by any"] = \
-                        [i for i in o_players[2].knowledge["held by any"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or across"] = \
-                        [i for i in o_players[2].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or right"] = \
-                        [i for i in o_players[2].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by right"].extend(cards_to_remove)
-                    break
-            if (lead_card.suit == "hearts" or lead_card == Card("queen", "spades")) and self.has_lead.knowledge["only points"] != "":
-                players_without_points = self.player_rotation()
-                players_without_points.remove(players_without_points[self.has_lead.knowledge["only points"]])
-                if players_without_points[0].knowledge["only points"] == 0:
-                    players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                        "held by any"]
-                if players_without_points[0].knowledge["only points"] == 1:
-                    players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                        "held by any"]
-                if players_without_points[0].knowledge["only points"] == 2:
-                    players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                        "held by any"]
-                players_without_points[0].knowledge["held by any"] = []
-
-                if players_without_points[1].knowledge["only points"] == 0:
-                    players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                        "held by any"]
-                if players_without_points[1].knowledge["only points"] == 1:
-                    players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                        "held by any"]
-                if players_without_points[1].knowledge["only points"] == 2:
-                    players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                        "held by any"]
-                players_without_points[1].knowledge["held by any"] = []
-
-            self.played_all.append(lead_card)
-            self.has_lead.hand.remove_card(lead_card)
-
-            notify_players = self.player_rotation()
-            self.played_players[self.has_lead.name].append(lead_card)
-            self.trick_suit = lead_card.suit
-            self.trick.append(lead_card)
-            print(self.has_lead.name, "played:", lead_card)
-            for player in self.player_rotation():
-                if self.trick[0] in player.knowledge["held by any"]:
-                    list.remove(player.knowledge["held by any"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left"]:
-                    list.remove(player.knowledge["held by left"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across"]:
-                    list.remove(player.knowledge["held by across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by right"]:
-                    list.remove(player.knowledge["held by right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or across"]:
-                    list.remove(player.knowledge["held by left or across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or right"]:
-                    list.remove(player.knowledge["held by left or right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across or right"]:
-                    list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                card_to_play = player.choose_play(self)
-                while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                    print("Invalid play: you must follow suit - try again")
-                    card_to_play = player.choose_play(self)
-
-                notify_players = self.player_order(player)
-
-                for p in notify_players:
-                    if card_to_play in p.knowledge["held by any"]:
-                        list.remove(p.knowledge["held by any"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left"]:
-                        list.remove(p.knowledge["held by left"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across"]:
-                        list.remove(p.knowledge["held by across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by right"]:
-                        list.remove(p.knowledge["held by right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or across"]:
-                        list.remove(p.knowledge["held by left or across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or right"]:
-                        list.remove(p.knowledge["held by left or right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across or right"]:
-                        list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                if (card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades")) and player.knowledge["only points"] != "":
-                    players_without_points = notify_players
-                    players_without_points.remove(players_without_points[player.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge["held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge["held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge["held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge["held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge["held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge["held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-                if card_to_play.suit != self.trick_suit:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                self.trick.append(card_to_play)
-                player.hand.remove_card(card_to_play)
-                self.played_all.append(card_to_play)
-                self.played_players[player.name].append(card_to_play)
-                print(player.name, "played:", card_to_play)
-            print(self.trick)
 
-        elif self.trick_num < 13:
-            trick_progress = len(self.trick) - 1
-            rotation = self.player_rotation()
-            last_card = self.trick[trick_progress]
-            if trick_progress == 0:
-                last_player = self.has_lead
+        high_card = None
+        while high_card is None:
+            player = self.next_player()
+            if self.trick_num == 0 and self.trick == []:
+                card = Card("2", "clubs")
             else:
-                last_player = rotation[trick_progress - 1]
-
-            notify_players = self.player_order(last_player)
-
-            for p in notify_players:
-                if last_card in p.knowledge["held by any"]:
-                    list.remove(p.knowledge["held by any"], last_card)
-                elif last_card in p.knowledge["held by left"]:
-                    list.remove(p.knowledge["held by left"], last_card)
-                elif last_card in p.knowledge["held by across"]:
-                    list.remove(p.knowledge["held by across"], last_card)
-                elif last_card in p.knowledge["held by right"]:
-                    list.remove(p.knowledge["held by right"], last_card)
-                elif last_card in p.knowledge["held by left or across"]:
-                    list.remove(p.knowledge["held by left or across"], last_card)
-                elif last_card in p.knowledge["held by left or right"]:
-                    list.remove(p.knowledge["held by left or right"], last_card)
-                elif last_card in p.knowledge["held by across or right"]:
-                    list.remove(p.knowledge["held by across or right"], last_card)
-
-            if trick_progress == 0:
-                self.trick_suit = last_card.suit
-                if not self.hearts_broken and last_card.suit == "hearts" and not self.has_lead.has_suit("spades") and \
-                        not self.has_lead.has_suit("diamonds") and not self.has_lead.has_suit("clubs"):
-                    o_players = self.player_rotation()
-
-                    o_players[0].knowledge["right no spades"] = True
-                    o_players[0].knowledge["right no diamonds"] = True
-                    o_players[0].knowledge["right no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by any"] = [i for i in
-                                                             o_players[0].knowledge["held by any"] if
-                                                             i not in cards_to_remove]
-                    o_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by left or right"] = \
-                        [i for i in o_players[0].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by across or right"] = \
-                        [i for i in o_players[0].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by across"].extend(cards_to_remove)
-
-                    o_players[1].knowledge["across no clubs"] = True
-                    o_players[1].knowledge["across no spades"] = True
-                    o_players[1].knowledge["across no diamonds"] = True
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by any"] = \
-                        [i for i in o_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by left or across"] = \
-                        [i for i in o_players[1].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by across or right"] = \
-                        [i for i in o_players[1].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by right"].extend(cards_to_remove)
-
-                    o_players[2].knowledge["left no spades"] = True
-                    o_players[2].knowledge["left no diamonds"] = True
-                    o_players[2].knowledge["left no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by any"] = \
-                        [i for i in o_players[2].knowledge["held by any"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or across"] = \
-                        [i for i in o_players[2].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or right"] = \
-                        [i for i in o_players[2].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by right"].extend(cards_to_remove)
-                if (last_card.suit == "hearts" or last_card == Card("queen", "spades")) and self.has_lead.knowledge["only points"] != "":
-                    players_without_points = self.player_rotation()
-                    players_without_points.remove(players_without_points[self.has_lead.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-                if len(last_player.hand.contents) == len(notify_players[0].knowledge["held by right"]):
-                    notify_players[0].knowledge["held by left"].extend(
-                        notify_players[0].knowledge["held by left or right"])
-                    notify_players[0].knowledge["held by left or right"] = []
-                    notify_players[0].knowledge["held by across"].extend(
-                        notify_players[0].knowledge["held by across or right"])
-                    notify_players[0].knowledge["held by across or right"] = []
-                    notify_players[0].knowledge["held by left or across"].extend(
-                        notify_players[0].knowledge["held by any"])
-                    notify_players[0].knowledge["held by any"] = []
-                if len(last_player.hand.contents) == len(notify_players[1].knowledge["held by across"]):
-                    notify_players[1].knowledge["held by left"].extend(
-                        notify_players[1].knowledge["held by left or across"])
-                    notify_players[1].knowledge["held by left or across"] = []
-                    notify_players[1].knowledge["held by right"].extend(
-                        notify_players[1].knowledge["held by across or right"])
-                    notify_players[1].knowledge["held by across or right"] = []
-                    notify_players[1].knowledge["held by left or right"].extend(
-                        notify_players[1].knowledge["held by any"])
-                    notify_players[1].knowledge["held by any"] = []
-                if len(last_player.hand.contents) == len(notify_players[2].knowledge["held by left"]):
-                    notify_players[2].knowledge["held by across"].extend(
-                        notify_players[2].knowledge["held by left or across"])
-                    notify_players[2].knowledge["held by left or across"] = []
-                    notify_players[2].knowledge["held by right"].extend(
-                        notify_players[2].knowledge["held by left or right"])
-                    notify_players[2].knowledge["held by left or right"] = []
-                    notify_players[2].knowledge["held by across or right"].extend(
-                        notify_players[2].knowledge["held by any"])
-                    notify_players[2].knowledge["held by any"] = []
-
-                print(self.has_lead.name, "played:", last_card)
-            else:
-                if (last_card.suit == "hearts" or last_card == Card("queen", "spades")) and last_player.knowledge[
-                        "only points"] != "":
-                    players_without_points = notify_players
-                    players_without_points.remove(players_without_points[last_player.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-                if last_card.suit != self.trick_suit:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                print(last_player, "played:", last_card)
-            if trick_progress < 3:
-                for player in rotation[trick_progress:]:
-                    if self.trick[0] in player.knowledge["held by any"]:
-                        list.remove(player.knowledge["held by any"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left"]:
-                        list.remove(player.knowledge["held by left"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across"]:
-                        list.remove(player.knowledge["held by across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by right"]:
-                        list.remove(player.knowledge["held by right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or across"]:
-                        list.remove(player.knowledge["held by left or across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or right"]:
-                        list.remove(player.knowledge["held by left or right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across or right"]:
-                        list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                    card_to_play = player.choose_play(self)
-                    while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                        print("Invalid play: you must follow suit - try again")
-                        card_to_play = player.choose_play(self)
-
-                    notify_players = self.player_order(player)
-
-                    for p in notify_players:
-                        if card_to_play in p.knowledge["held by any"]:
-                            list.remove(p.knowledge["held by any"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left"]:
-                            list.remove(p.knowledge["held by left"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across"]:
-                            list.remove(p.knowledge["held by across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by right"]:
-                            list.remove(p.knowledge["held by right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or across"]:
-                            list.remove(p.knowledge["held by left or across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or right"]:
-                            list.remove(p.knowledge["held by left or right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across or right"]:
-                            list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                    if (card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades")) and player.knowledge["only points"] != "":
-                        players_without_points = notify_players
-                        players_without_points.remove(players_without_points[player.knowledge["only points"]])
-                        if players_without_points[0].knowledge["only points"] == 0:
-                            players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge["held by any"]
-                        if players_without_points[0].knowledge["only points"] == 1:
-                            players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge["held by any"]
-                        if players_without_points[0].knowledge["only points"] == 2:
-                            players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge["held by any"]
-                        players_without_points[0].knowledge["held by any"] = []
-
-                        if players_without_points[1].knowledge["only points"] == 0:
-                            players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge["held by any"]
-                        if players_without_points[1].knowledge["only points"] == 1:
-                            players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge["held by any"]
-                        if players_without_points[1].knowledge["only points"] == 2:
-                            players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge["held by any"]
-                        players_without_points[1].knowledge["held by any"] = []
-
-                    if card_to_play.suit != self.trick_suit:
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                    self.trick.append(card_to_play)
-                    player.hand.remove_card(card_to_play)
-                    self.played_all.append(card_to_play)
-                    self.played_players[player.name].append(card_to_play)
-                    print(player.name, "played:", card_to_play)
-            print(self.trick)
+                card = self.request_play(player, sink)
+            trick = self.trick
+            high_card = self.apply_play(player, card)
+            if sink is not None:
+                sink("play", player, card)
 
-        high_card = self.trick[0]
-        for card in self.trick:
-            if card.hearts_compare(high_card):
-                high_card = card
-            if card.suit == "hearts" and not self.hearts_broken:
-                self.hearts_broken = True
-        high_card_index = self.trick.index(high_card)
-        if high_card_index == 0:
-            self.has_lead.won_cards.extend(self.trick)
-        if high_card_index > 0:
-            other_players = self.player_rotation()
-            self.has_lead = other_players[high_card_index - 1]
-            self.has_lead.won_cards.extend(self.trick)
-        self.trick_num += 1
-        if self.trick_num == 13:
-            self.complete = True
-        self.trick = []
-        self.trick_suit = ""
-        print(self.has_lead.name, "has won trick", self.trick_num, "with the", high_card)
+        if sink is not None:
+            sink("trick", trick)
+            sink("win", self.has_lead, self.trick_num, high_card)
 
     def play_trick_np(self):
         """Plays trick with no printing"""
-        if self.passed is False:
-            return
-        if self.trick_num >= 13:
-            return
-
-        elif self.trick_num == 0 and self.trick == []:
-            self.started = True
-            for player in self.players:
-                if player.hand.one_suit():
-                    single_suit = player.hand.contents[0].suit
-                    player.knowledge["left no " + single_suit] = True
-                    player.knowledge["across no " + single_suit] = True
-                    player.knowledge["right no " + single_suit] = True
-                if player.has_start() is True:
-                    self.has_lead = player
-            self.trick.append(self.has_lead.play_card(Card("2", "clubs")))
-            self.trick_suit = "clubs"
-            self.played_all.append(Card("2", "clubs"))
-            self.played_players[self.has_lead.name].append(Card("2", "clubs"))
-            for player in self.player_rotation():
-                if self.trick[0] in player.knowledge["held by any"]:
-                    list.remove(player.knowledge["held by any"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left"]:
-                    list.remove(player.knowledge["held by left"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across"]:
-                    list.remove(player.knowledge["held by across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by right"]:
-                    list.remove(player.knowledge["held by right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or across"]:
-                    list.remove(player.knowledge["held by left or across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or right"]:
-                    list.remove(player.knowledge["held by left or right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across or right"]:
-                    list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                card_to_play = player.choose_play(self)
-                while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                    card_to_play = player.choose_play(self)
-
-                while card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades"):
-                    card_to_play = player.choose_play(self)
-                    if not player.has_suit("diamonds") and not player.has_suit("clubs") \
-                            and not player.has_suit("spades") or not player.has_suit("diamonds") \
-                            and not player.has_suit("clubs") and player.count_suit("hearts") == 12 \
-                            and player.has_start("queen", "spades"):
-                        break
-
-                notify_players = self.player_order(player)
-
-                for p in notify_players:
-                    if card_to_play in p.knowledge["held by any"]:
-                        list.remove(p.knowledge["held by any"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left"]:
-                        list.remove(p.knowledge["held by left"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across"]:
-                        list.remove(p.knowledge["held by across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by right"]:
-                        list.remove(p.knowledge["held by right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or across"]:
-                        list.remove(p.knowledge["held by left or across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or right"]:
-                        list.remove(p.knowledge["held by left or right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across or right"]:
-                        list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                if card_to_play.suit != self.trick_suit:
-                    if card_to_play == Card("queen", "spades"):
-                        notify_players[0].knowledge["only points"] = 2
-                        notify_players[1].knowledge["only points"] = 1
-                        notify_players[2].knowledge["only points"] = 0
-
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            notify_players[0].knowledge["right no spades"] = True
-                            notify_players[0].knowledge["right no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if notify_players[0].has_suit("hearts"):
-                                notify_players[0].knowledge["held by right"].extend(
-                                    notify_players[0].knowledge["held by any"])
-                                notify_players[0].knowledge["held by any"] = []
-
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            notify_players[1].knowledge["across no spades"] = True
-                            notify_players[1].knowledge["across no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if notify_players[1].has_suit("hearts"):
-                                notify_players[1].knowledge["held by across"].extend(
-                                    notify_players[1].knowledge["held by any"])
-                                notify_players[1].knowledge["held by any"] = []
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            notify_players[2].knowledge["left no spades"] = True
-                            notify_players[2].knowledge["left no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                            if notify_players[2].has_suit("hearts"):
-                                notify_players[2].knowledge["held by left"].extend(
-                                    notify_players[2].knowledge["held by any"])
-                                notify_players[2].knowledge["held by any"] = []
-
-                    elif card_to_play.suit == "hearts":
-                        notify_players[0].knowledge["only points"] = 2
-                        notify_players[1].knowledge["only points"] = 1
-                        notify_players[2].knowledge["only points"] = 0
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            notify_players[0].knowledge["right no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                                notify_players[0].knowledge["held by right"].extend(notify_players[0].knowledge["held by any"])
-                                notify_players[0].knowledge["held by any"] = []
-
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            notify_players[1].knowledge["across no spades"] = True
-                            notify_players[1].knowledge["across no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                                notify_players[1].knowledge["held by across"].extend(notify_players[1].knowledge["held by any"])
-                                notify_players[1].knowledge["held by any"] = []
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            notify_players[2].knowledge["left no diamonds"] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                        or cards.suit == "diamonds":
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                            if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                                notify_players[2].knowledge["held by left"].extend(notify_players[2].knowledge["held by any"])
-                                notify_players[2].knowledge["held by any"] = []
-                    else:
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                self.trick.append(card_to_play)
-                player.hand.remove_card(card_to_play)
-                self.played_all.append(card_to_play)
-                self.played_players[player.name].append(card_to_play)
-
-        elif self.trick_num == 0:
-            trick_progress = len(self.trick) - 1
-            rotation = self.player_rotation()
-            last_card = self.trick[trick_progress]
-            if trick_progress == 0:
-                last_player = self.has_lead
-            else:
-                last_player = rotation[trick_progress - 1]
-
-            notify_players = self.player_order(last_player)
-
-            for p in notify_players:
-                if last_card in p.knowledge["held by any"]:
-                    list.remove(p.knowledge["held by any"], last_card)
-                elif last_card in p.knowledge["held by left"]:
-                    list.remove(p.knowledge["held by left"], last_card)
-                elif last_card in p.knowledge["held by across"]:
-                    list.remove(p.knowledge["held by across"], last_card)
-                elif last_card in p.knowledge["held by right"]:
-                    list.remove(p.knowledge["held by right"], last_card)
-                elif last_card in p.knowledge["held by left or across"]:
-                    list.remove(p.knowledge["held by left or across"], last_card)
-                elif last_card in p.knowledge["held by left or right"]:
-                    list.remove(p.knowledge["held by left or right"], last_card)
-                elif last_card in p.knowledge["held by across or right"]:
-                    list.remove(p.knowledge["held by across or right"], last_card)
-
-            if last_card.suit != self.trick_suit:
-                if last_card == Card("queen", "spades"):
-                    notify_players[0].knowledge["only points"] = 2
-                    notify_players[1].knowledge["only points"] = 1
-                    notify_players[2].knowledge["only points"] = 0
-
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        notify_players[0].knowledge["right no spades"] = True
-                        notify_players[0].knowledge["right no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if notify_players[0].has_suit("hearts"):
-                            notify_players[0].knowledge["held by right"].extend(
-                                notify_players[0].knowledge["held by any"])
-                            notify_players[0].knowledge["held by any"] = []
-
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        notify_players[1].knowledge["across no spades"] = True
-                        notify_players[1].knowledge["across no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if notify_players[1].has_suit("hearts"):
-                            notify_players[1].knowledge["held by across"].extend(
-                                notify_players[1].knowledge["held by any"])
-                            notify_players[1].knowledge["held by any"] = []
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        notify_players[2].knowledge["left no spades"] = True
-                        notify_players[2].knowledge["left no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                        if notify_players[2].has_suit("hearts"):
-                            notify_players[2].knowledge["held by left"].extend(
-                                notify_players[2].knowledge["held by any"])
-                            notify_players[2].knowledge["held by any"] = []
-
-                elif last_card.suit == "hearts":
-                    notify_players[0].knowledge["only points"] = 2
-                    notify_players[1].knowledge["only points"] = 1
-                    notify_players[2].knowledge["only points"] = 0
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        notify_players[0].knowledge["right no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                            notify_players[0].knowledge["held by right"].extend(
-                                notify_players[0].knowledge["held by any"])
-                            notify_players[0].knowledge["held by any"] = []
-
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        notify_players[1].knowledge["across no spades"] = True
-                        notify_players[1].knowledge["across no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                            notify_players[1].knowledge["held by across"].extend(
-                                notify_players[1].knowledge["held by any"])
-                            notify_players[1].knowledge["held by any"] = []
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        notify_players[2].knowledge["left no diamonds"] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                    or cards.suit == "diamonds":
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                        if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                            notify_players[2].knowledge["held by left"].extend(
-                                notify_players[2].knowledge["held by any"])
-                            notify_players[2].knowledge["held by any"] = []
+        self.play_trick(None)
+
+    def request_play(self, player, sink=None):
+        """Asks a player for cards until they choose a legal play, reporting invalid choices to sink"""
+        legal = player.hand.legal_mask(self.trick_suit, self.trick_num == 0, self.hearts_broken)
+        card = player.choose_play(self)
+        while not legal >> card.index & 1:
+            if sink is not None:
+                if card not in player.hand:
+                    sink("invalid", "that card is not in your hand")
+                elif not self.trick:
+                    sink("invalid", "hearts have not been broken")
+                elif card.suit != self.trick_suit and player.hand.has_suit(self.trick_suit):
+                    sink("invalid", "you must follow suit")
                 else:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-            if trick_progress < 3:
-                for player in rotation[trick_progress:]:
-                    if self.trick[0] in player.knowledge["held by any"]:
-                        list.remove(player.knowledge["held by any"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left"]:
-                        list.remove(player.knowledge["held by left"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across"]:
-                        list.remove(player.knowledge["held by across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by right"]:
-                        list.remove(player.knowledge["held by right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or across"]:
-                        list.remove(player.knowledge["held by left or across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or right"]:
-                        list.remove(player.knowledge["held by left or right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across or right"]:
-                        list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                    card_to_play = player.choose_play(self)
-                    while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                        card_to_play = player.choose_play(self)
-
-                    while card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades"):
-                        card_to_play = player.choose_play(self)
-                        if not player.has_suit("diamonds") and not player.has_suit("clubs") \
-                                and not player.has_suit("spades") or not player.has_suit("diamonds") \
-                                and not player.has_suit("clubs") and player.count_suit("hearts") == 12 \
-                                and player.has_start("queen", "spades"):
-                            break
-
-                    notify_players = self.player_order(player)
-
-                    for p in notify_players:
-                        if card_to_play in p.knowledge["held by any"]:
-                            list.remove(p.knowledge["held by any"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left"]:
-                            list.remove(p.knowledge["held by left"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across"]:
-                            list.remove(p.knowledge["held by across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by right"]:
-                            list.remove(p.knowledge["held by right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or across"]:
-                            list.remove(p.knowledge["held by left or across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or right"]:
-                            list.remove(p.knowledge["held by left or right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across or right"]:
-                            list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                    if card_to_play.suit != self.trick_suit:
-                        if card_to_play == Card("queen", "spades"):
-                            notify_players[0].knowledge["only points"] = 2
-                            notify_players[1].knowledge["only points"] = 1
-                            notify_players[2].knowledge["only points"] = 0
-
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                notify_players[0].knowledge["right no spades"] = True
-                                notify_players[0].knowledge["right no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                                if notify_players[0].has_suit("hearts"):
-                                    notify_players[0].knowledge["held by right"].extend(
-                                        notify_players[0].knowledge["held by any"])
-                                    notify_players[0].knowledge["held by any"] = []
-
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                notify_players[1].knowledge["across no spades"] = True
-                                notify_players[1].knowledge["across no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                                if notify_players[1].has_suit("hearts"):
-                                    notify_players[1].knowledge["held by across"].extend(
-                                        notify_players[1].knowledge["held by any"])
-                                    notify_players[1].knowledge["held by any"] = []
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                notify_players[2].knowledge["left no spades"] = True
-                                notify_players[2].knowledge["left no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                                if notify_players[2].has_suit("hearts"):
-                                    notify_players[2].knowledge["held by left"].extend(
-                                        notify_players[2].knowledge["held by any"])
-                                    notify_players[2].knowledge["held by any"] = []
-
-                        elif card_to_play.suit == "hearts":
-                            notify_players[0].knowledge["only points"] = 2
-                            notify_players[1].knowledge["only points"] = 1
-                            notify_players[2].knowledge["only points"] = 0
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                notify_players[0].knowledge["right no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[0].hand or notify_players[0].has_suit("hearts"):
-                                    notify_players[0].knowledge["held by right"].extend(notify_players[0].knowledge["held by any"])
-                                    notify_players[0].knowledge["held by any"] = []
-
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                notify_players[1].knowledge["across no spades"] = True
-                                notify_players[1].knowledge["across no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[1].hand or notify_players[1].has_suit("hearts"):
-                                    notify_players[1].knowledge["held by across"].extend(notify_players[1].knowledge["held by any"])
-                                    notify_players[1].knowledge["held by any"] = []
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                notify_players[2].knowledge["left no diamonds"] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit or cards.suit == "spades" and cards.value != "queen" \
-                                            or cards.suit == "diamonds":
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-                                if Card("queen", "spades") in notify_players[2].hand or notify_players[2].has_suit("hearts"):
-                                    notify_players[2].knowledge["held by left"].extend(notify_players[2].knowledge["held by any"])
-                                    notify_players[2].knowledge["held by any"] = []
-                        else:
-                            if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                                notify_players[0].knowledge["right no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by any"] = [i for i in
-                                                                              notify_players[0].knowledge["held by any"] if
-                                                                              i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[0].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[0].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[0].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                            if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                                notify_players[1].knowledge["across no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by any"] = \
-                                    [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[1].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[1].knowledge["held by across or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[1].knowledge["held by across or right"] = \
-                                    [i for i in notify_players[1].knowledge["held by across or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                            if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                                notify_players[2].knowledge["left no " + self.trick_suit] = True
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by any"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by any"] = \
-                                    [i for i in notify_players[2].knowledge["held by any"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or across"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or across"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or across"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                                cards_to_remove = []
-                                for cards in notify_players[2].knowledge["held by left or right"]:
-                                    if cards.suit == self.trick_suit:
-                                        cards_to_remove.append(cards)
-                                notify_players[2].knowledge["held by left or right"] = \
-                                    [i for i in notify_players[2].knowledge["held by left or right"]
-                                     if i not in cards_to_remove]
-                                notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                    self.trick.append(card_to_play)
-                    player.hand.remove_card(card_to_play)
-                    self.played_all.append(card_to_play)
-                    self.played_players[player.name].append(card_to_play)
-
-        elif self.trick_num < 13 and self.trick == []:
-            self.trick_suit = ""
-            lead_card = self.has_lead.choose_play(self)
-            while not self.hearts_broken and lead_card.suit == "hearts":
-                lead_card = self.has_lead.choose_play(self)
-                if not self.has_lead.has_suit("spades") and not self.has_lead.has_suit("diamonds") \
-                        and not self.has_lead.has_suit("clubs"):
-                    o_players = self.player_rotation()
-
-                    o_players[0].knowledge["right no spades"] = True
-                    o_players[0].knowledge["right no diamonds"] = True
-                    o_players[0].knowledge["right no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by any"] = [i for i in
-                                                             o_players[0].knowledge["held by any"] if
-                                                             i not in cards_to_remove]
-                    o_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by left or right"] = \
-                        [i for i in o_players[0].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by across or right"] = \
-                        [i for i in o_players[0].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by across"].extend(cards_to_remove)
-
-                    o_players[1].knowledge["across no clubs"] = True
-                    o_players[1].knowledge["across no spades"] = True
-                    o_players[1].knowledge["across no diamonds"] = True
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by any"] = \
-                        [i for i in o_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by left or across"] = \
-                        [i for i in o_players[1].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by across or right"] = \
-                        [i for i in o_players[1].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by right"].extend(cards_to_remove)
-
-                    o_players[2].knowledge["left no spades"] = True
-                    o_players[2].knowledge["left no diamonds"] = True
-                    o_players[2].knowledge["left no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by any"] = \
-                        [i for i in o_players[2].knowledge["held by any"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or across"] = \
-                        [i for i in o_players[2].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or right"] = \
-                        [i for i in o_players[2].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by right"].extend(cards_to_remove)
-                    break
-            if (lead_card.suit == "hearts" or lead_card == Card("queen", "spades")) and self.has_lead.knowledge["only points"] != "":
-                players_without_points = self.player_rotation()
-                players_without_points.remove(players_without_points[self.has_lead.knowledge["only points"]])
-                if players_without_points[0].knowledge["only points"] == 0:
-                    players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                        "held by any"]
-                if players_without_points[0].knowledge["only points"] == 1:
-                    players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                        "held by any"]
-                if players_without_points[0].knowledge["only points"] == 2:
-                    players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                        "held by any"]
-                players_without_points[0].knowledge["held by any"] = []
-
-                if players_without_points[1].knowledge["only points"] == 0:
-                    players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                        "held by any"]
-                if players_without_points[1].knowledge["only points"] == 1:
-                    players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                        "held by any"]
-                if players_without_points[1].knowledge["only points"] == 2:
-                    players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                        "held by any"]
-                players_without_points[1].knowledge["held by any"] = []
-
-            self.played_all.append(lead_card)
-            self.has_lead.hand.remove_card(lead_card)
-            self.played_players[self.has_lead.name].append(lead_card)
-            self.trick_suit = lead_card.suit
-            self.trick.append(lead_card)
-            for player in self.player_rotation():
-                if self.trick[0] in player.knowledge["held by any"]:
-                    list.remove(player.knowledge["held by any"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left"]:
-                    list.remove(player.knowledge["held by left"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across"]:
-                    list.remove(player.knowledge["held by across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by right"]:
-                    list.remove(player.knowledge["held by right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or across"]:
-                    list.remove(player.knowledge["held by left or across"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by left or right"]:
-                    list.remove(player.knowledge["held by left or right"], self.trick[0])
-                elif self.trick[0] in player.knowledge["held by across or right"]:
-                    list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                card_to_play = player.choose_play(self)
-                while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                    card_to_play = player.choose_play(self)
-
-                notify_players = self.player_order(player)
-
-                for p in notify_players:
-                    if card_to_play in p.knowledge["held by any"]:
-                        list.remove(p.knowledge["held by any"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left"]:
-                        list.remove(p.knowledge["held by left"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across"]:
-                        list.remove(p.knowledge["held by across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by right"]:
-                        list.remove(p.knowledge["held by right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or across"]:
-                        list.remove(p.knowledge["held by left or across"], card_to_play)
-                    elif card_to_play in p.knowledge["held by left or right"]:
-                        list.remove(p.knowledge["held by left or right"], card_to_play)
-                    elif card_to_play in p.knowledge["held by across or right"]:
-                        list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                if (card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades")) and player.knowledge["only points"] != "":
-                    players_without_points = notify_players
-                    players_without_points.remove(players_without_points[player.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge["held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge["held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge["held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge["held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge["held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge["held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-                if card_to_play.suit != self.trick_suit:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                self.trick.append(card_to_play)
-                player.hand.remove_card(card_to_play)
-                self.played_all.append(card_to_play)
-                self.played_players[player.name].append(card_to_play)
-
-        elif self.trick_num < 13:
-            trick_progress = len(self.trick) - 1
-            rotation = self.player_rotation()
-            last_card = self.trick[trick_progress]
-            if trick_progress == 0:
-                last_player = self.has_lead
-            else:
-                last_player = rotation[trick_progress - 1]
-
-            notify_players = self.player_order(last_player)
-
-            for p in notify_players:
-                if last_card in p.knowledge["held by any"]:
-                    list.remove(p.knowledge["held by any"], last_card)
-                elif last_card in p.knowledge["held by left"]:
-                    list.remove(p.knowledge["held by left"], last_card)
-                elif last_card in p.knowledge["held by across"]:
-                    list.remove(p.knowledge["held by across"], last_card)
-                elif last_card in p.knowledge["held by right"]:
-                    list.remove(p.knowledge["held by right"], last_card)
-                elif last_card in p.knowledge["held by left or across"]:
-                    list.remove(p.knowledge["held by left or across"], last_card)
-                elif last_card in p.knowledge["held by left or right"]:
-                    list.remove(p.knowledge["held by left or right"], last_card)
-                elif last_card in p.knowledge["held by across or right"]:
-                    list.remove(p.knowledge["held by across or right"], last_card)
-
-            if trick_progress == 0:
-                self.trick_suit = last_card.suit
-                if not self.hearts_broken and last_card.suit == "hearts" and not self.has_lead.has_suit("spades") and \
-                        not self.has_lead.has_suit("diamonds") and not self.has_lead.has_suit("clubs"):
-                    o_players = self.player_rotation()
-
-                    o_players[0].knowledge["right no spades"] = True
-                    o_players[0].knowledge["right no diamonds"] = True
-                    o_players[0].knowledge["right no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by any"] = [i for i in
-                                                             o_players[0].knowledge["held by any"] if
-                                                             i not in cards_to_remove]
-                    o_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by left or right"] = \
-                        [i for i in o_players[0].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[0].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[0].knowledge["held by across or right"] = \
-                        [i for i in o_players[0].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[0].knowledge["held by across"].extend(cards_to_remove)
-
-                    o_players[1].knowledge["across no clubs"] = True
-                    o_players[1].knowledge["across no spades"] = True
-                    o_players[1].knowledge["across no diamonds"] = True
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by any"] = \
-                        [i for i in o_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by left or across"] = \
-                        [i for i in o_players[1].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by left"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[1].knowledge["held by across or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[1].knowledge["held by across or right"] = \
-                        [i for i in o_players[1].knowledge["held by across or right"]
-                         if i not in cards_to_remove]
-                    o_players[1].knowledge["held by right"].extend(cards_to_remove)
-
-                    o_players[2].knowledge["left no spades"] = True
-                    o_players[2].knowledge["left no diamonds"] = True
-                    o_players[2].knowledge["left no clubs"] = True
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by any"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by any"] = \
-                        [i for i in o_players[2].knowledge["held by any"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or across"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or across"] = \
-                        [i for i in o_players[2].knowledge["held by left or across"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by across"].extend(cards_to_remove)
-                    cards_to_remove = []
-                    for cards in o_players[2].knowledge["held by left or right"]:
-                        if cards.suit != "hearts":
-                            cards_to_remove.append(cards)
-                    o_players[2].knowledge["held by left or right"] = \
-                        [i for i in o_players[2].knowledge["held by left or right"]
-                         if i not in cards_to_remove]
-                    o_players[2].knowledge["held by right"].extend(cards_to_remove)
-                if (last_card.suit == "hearts" or last_card == Card("queen", "spades")) and self.has_lead.knowledge["only points"] != "":
-                    players_without_points = self.player_rotation()
-                    players_without_points.remove(players_without_points[self.has_lead.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-            else:
-                if (last_card.suit == "hearts" or last_card == Card("queen", "spades")) and last_player.knowledge[
-                        "only points"] != "":
-                    players_without_points = notify_players
-                    players_without_points.remove(players_without_points[last_player.knowledge["only points"]])
-                    if players_without_points[0].knowledge["only points"] == 0:
-                        players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 1:
-                        players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    if players_without_points[0].knowledge["only points"] == 2:
-                        players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge[
-                            "held by any"]
-                    players_without_points[0].knowledge["held by any"] = []
-
-                    if players_without_points[1].knowledge["only points"] == 0:
-                        players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 1:
-                        players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    if players_without_points[1].knowledge["only points"] == 2:
-                        players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge[
-                            "held by any"]
-                    players_without_points[1].knowledge["held by any"] = []
-
-                if last_card.suit != self.trick_suit:
-                    if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                        notify_players[0].knowledge["right no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by any"] = [i for i in
-                                                                      notify_players[0].knowledge["held by any"] if
-                                                                      i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by left or right"] = \
-                            [i for i in notify_players[0].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[0].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[0].knowledge["held by across or right"] = \
-                            [i for i in notify_players[0].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                    if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                        notify_players[1].knowledge["across no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by any"] = \
-                            [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by left or across"] = \
-                            [i for i in notify_players[1].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[1].knowledge["held by across or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[1].knowledge["held by across or right"] = \
-                            [i for i in notify_players[1].knowledge["held by across or right"]
-                             if i not in cards_to_remove]
-                        notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                    if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                        notify_players[2].knowledge["left no " + self.trick_suit] = True
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by any"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by any"] = \
-                            [i for i in notify_players[2].knowledge["held by any"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or across"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or across"] = \
-                            [i for i in notify_players[2].knowledge["held by left or across"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                        cards_to_remove = []
-                        for cards in notify_players[2].knowledge["held by left or right"]:
-                            if cards.suit == self.trick_suit:
-                                cards_to_remove.append(cards)
-                        notify_players[2].knowledge["held by left or right"] = \
-                            [i for i in notify_players[2].knowledge["held by left or right"]
-                             if i not in cards_to_remove]
-                        notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-            if trick_progress < 3:
-                for player in rotation[trick_progress:]:
-                    if self.trick[0] in player.knowledge["held by any"]:
-                        list.remove(player.knowledge["held by any"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left"]:
-                        list.remove(player.knowledge["held by left"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across"]:
-                        list.remove(player.knowledge["held by across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by right"]:
-                        list.remove(player.knowledge["held by right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or across"]:
-                        list.remove(player.knowledge["held by left or across"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by left or right"]:
-                        list.remove(player.knowledge["held by left or right"], self.trick[0])
-                    elif self.trick[0] in player.knowledge["held by across or right"]:
-                        list.remove(player.knowledge["held by across or right"], self.trick[0])
-
-                    card_to_play = player.choose_play(self)
-                    while card_to_play.suit != self.trick_suit and player.has_suit(self.trick_suit):
-                        card_to_play = player.choose_play(self)
-
-                    notify_players = self.player_order(player)
-
-                    for p in notify_players:
-                        if card_to_play in p.knowledge["held by any"]:
-                            list.remove(p.knowledge["held by any"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left"]:
-                            list.remove(p.knowledge["held by left"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across"]:
-                            list.remove(p.knowledge["held by across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by right"]:
-                            list.remove(p.knowledge["held by right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or across"]:
-                            list.remove(p.knowledge["held by left or across"], card_to_play)
-                        elif card_to_play in p.knowledge["held by left or right"]:
-                            list.remove(p.knowledge["held by left or right"], card_to_play)
-                        elif card_to_play in p.knowledge["held by across or right"]:
-                            list.remove(p.knowledge["held by across or right"], card_to_play)
-
-                    if (card_to_play.suit == "hearts" or card_to_play == Card("queen", "spades")) and player.knowledge["only points"] != "":
-                        players_without_points = notify_players
-                        players_without_points.remove(players_without_points[player.knowledge["only points"]])
-                        if players_without_points[0].knowledge["only points"] == 0:
-                            players_without_points[0].knowledge["held by left"] = players_without_points[0].knowledge["held by any"]
-                        if players_without_points[0].knowledge["only points"] == 1:
-                            players_without_points[0].knowledge["held by across"] = players_without_points[0].knowledge["held by any"]
-                        if players_without_points[0].knowledge["only points"] == 2:
-                            players_without_points[0].knowledge["held by right"] = players_without_points[0].knowledge["held by any"]
-                        players_without_points[0].knowledge["held by any"] = []
-
-                        if players_without_points[1].knowledge["only points"] == 0:
-                            players_without_points[1].knowledge["held by left"] = players_without_points[1].knowledge["held by any"]
-                        if players_without_points[1].knowledge["only points"] == 1:
-                            players_without_points[1].knowledge["held by across"] = players_without_points[1].knowledge["held by any"]
-                        if players_without_points[1].knowledge["only points"] == 2:
-                            players_without_points[1].knowledge["held by right"] = players_without_points[1].knowledge["held by any"]
-                        players_without_points[1].knowledge["held by any"] = []
-
-                    if card_to_play.suit != self.trick_suit:
-                        if not notify_players[0].knowledge["right no " + self.trick_suit]:
-                            notify_players[0].knowledge["right no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by any"] = [i for i in
-                                                                          notify_players[0].knowledge["held by any"] if
-                                                                          i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left or across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by left or right"] = \
-                                [i for i in notify_players[0].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[0].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[0].knowledge["held by across or right"] = \
-                                [i for i in notify_players[0].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[0].knowledge["held by across"].extend(cards_to_remove)
-                        if not notify_players[1].knowledge["across no " + self.trick_suit]:
-                            notify_players[1].knowledge["across no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by any"] = \
-                                [i for i in notify_players[1].knowledge["held by any"] if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by left or across"] = \
-                                [i for i in notify_players[1].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by left"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[1].knowledge["held by across or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[1].knowledge["held by across or right"] = \
-                                [i for i in notify_players[1].knowledge["held by across or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[1].knowledge["held by right"].extend(cards_to_remove)
-                        if not notify_players[2].knowledge["left no " + self.trick_suit]:
-                            notify_players[2].knowledge["left no " + self.trick_suit] = True
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by any"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by any"] = \
-                                [i for i in notify_players[2].knowledge["held by any"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across or right"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or across"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or across"] = \
-                                [i for i in notify_players[2].knowledge["held by left or across"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by across"].extend(cards_to_remove)
-                            cards_to_remove = []
-                            for cards in notify_players[2].knowledge["held by left or right"]:
-                                if cards.suit == self.trick_suit:
-                                    cards_to_remove.append(cards)
-                            notify_players[2].knowledge["held by left or right"] = \
-                                [i for i in notify_players[2].knowledge["held by left or right"]
-                                 if i not in cards_to_remove]
-                            notify_players[2].knowledge["held by right"].extend(cards_to_remove)
-
-                    self.trick.append(card_to_play)
-                    player.hand.remove_card(card_to_play)
-                    self.played_all.append(card_to_play)
-                    self.played_players[player.name].append(card_to_play)
-
-        high_card = self.trick[0]
-        for card in self.trick:
-            if card.hearts_compare(high_card):
-                high_card = card
-            if card.suit == "hearts" and not self.hearts_broken:
-                self.hearts_broken = True
-        high_card_index = self.trick.index(high_card)
-        if high_card_index == 0:
-            self.has_lead.won_cards.extend(self.trick)
-        if high_card_index > 0:
-            other_players = self.player_rotation()
-            self.has_lead = other_players[high_card_index - 1]
-            self.has_lead.won_cards.extend(self.trick)
-        self.trick_num += 1
-        if self.trick_num == 13:
-            self.complete = True
-        self.trick = []
-        self.trick_suit = ""
+                    sink("invalid", "no points on the first trick")
+            card = player.choose_play(self)
+        return card
 
-    def score_round(self):
-        """Scores a completed round of hearts"""
+    def score_round(self, sink=print_event):
+        """Scores a completed round of hearts, reporting the round score to sink as a "score" event"""
         if self.trick_num == 13:
             for player in self.players:
                 round_score = 0
@@ -4143,69 +1191,46 @@ class HeartsRound(object):
                         p.score += 26
                         self.round_score[p.name] += 26
                 self.round_score[player.name] += round_score
-            print(self.round_score)
-        else:
-            print("Round is not complete")
+            if sink is not None:
+                sink("score", self.round_score)
+        elif sink is not None:
+            sink("notice", "Round is not complete")
 
     def score_round_np(self):
         """Scores a completed round of hearts with no printing"""
-        if self.trick_num == 13:
-            for player in self.players:
-                round_score = 0
-                for card in player.won_cards:
-                    if card.suit == "hearts":
-                        player.score += 1
-                        round_score += 1
-                    if card.suit == "spades" and card.value == "queen":
-                        player.score += 13
-                        round_score += 13
-                if round_score == 26:
-                    player.score += -26
-                    round_score += -26
-                    self.has_lead = player
-                    other_players = self.player_rotation()
-                    for p in other_players:
-                        p.score += 26
-                        self.round_score[p.name] += 26
-                self.round_score[player.name] += round_score
+        self.score_round(None)
 
-    def play_round(self):
-        """Plays a round of hearts"""
+    def play_round(self, sink=print_event):
+        """Plays a round of hearts, reporting the passing, every trick and the score to sink; pass sink=None to play
+        silently"""
         if not self.passed and not self.started:
-            self.start_passing()
+            self.start_passing(sink)
             for trick in range(13):
-                self.play_trick()
-            self.score_round()
+                self.play_trick(sink)
+            self.score_round(sink)
         elif self.trick_num < 13:
             for trick in range(13 - self.trick_num):
-                self.play_trick()
-            self.score_round()
+                self.play_trick(sink)
+            self.score_round(sink)
         else:
-            self.score_round()
+            self.score_round(sink)
 
     def play_round_np(self):
         """Plays a round of hearts with no printing"""
-        if not self.passed and not self.started:
-            self.start_passing_np()
-            for trick in range(13):
-                self.play_trick_np()
-            self.score_round_np()
-        else:
-            for trick in range(13 - self.trick_num):
-                self.play_trick()
-            self.score_round()
+        self.play_round(None)
 
 
 class Hearts(HeartsRound):
     """Plays a full hearts game"""
 
-    def __init__(self, player1, player2, player3, player4):
-        """Initiates a game of hearts"""
+    def __init__(self, player1, player2, player3, player4, rng=None):
+        """Initiates a game of hearts, dealing every round with rng when one is given"""
 
         self.players = [player1, player2, player3, player4]
+        self.rng = rng
         for player in self.players:
             player.score = 0
-            player.knowledge = {}
+            player.knowledge = KnowledgeState()
 
         self.game_score = {player1.name: 0, player2.name: 0, player3.name: 0, player4.name: 0}
         self.round_num = 0
@@ -4221,14 +1246,15 @@ class Hearts(HeartsRound):
         self.mpr = {player1.name: 0, player2.name: 0, player3.name: 0, player4.name: 0}
         self.ppr = {player1.name: 0, player2.name: 0, player3.name: 0, player4.name: 0}
 
-    def single_round(self):
-        """Plays a single round of a hearts game"""
+    def single_round(self, sink=print_event):
+        """Plays a single round of a hearts game, reporting the round and the game score to sink; pass sink=None to
+        play silently"""
         if not self.started:
             self.started = True
         if max(self.game_score.values()) < self.score_limit:
             current_round = HeartsRound(self.players[0], self.players[1], self.players[2], self.players[3],
-                                        self.pass_options[self.round_num % 4])
-            current_round.play_round()
+                                        self.pass_options[self.round_num % 4], self.rng)
+            current_round.play_round(sink)
             for player in self.players:
                 self.game_score[player.name] = player.score
 
@@ -4247,48 +1273,622 @@ class Hearts(HeartsRound):
                 self.ppr[player.name] = player.score / (self.round_num + 1)
 
             self.round_num += 1
-            print("Game score at round", self.round_num, ":", "\n", self.game_score)
+            if sink is not None:
+                sink("notice", "Game score at round %d : \n %s" % (self.round_num, self.game_score))
             if max(self.game_score.values()) >= self.score_limit:
                 self.complete = True
                 self.victor = min(self.game_score.keys(), key=(lambda key: self.game_score[key]))
-                print("Game is complete,", self.victor, "is the winner")
-
-                print("Queens taken: \n", self.queens)
-                print("Successful moonshots: \n", self.moonshots)
-                print("Hearts received per round: \n", self.hpr)
-                print("Queens taken per round: \n", self.qpr)
-                print("Moonshots per round: \n", self.mpr)
-                print("Points taken per round: \n", self.ppr)
+                if sink is not None:
+                    sink("notice", "Game is complete, %s is the winner" % self.victor)
+                    sink("notice", "Queens taken: \n %s" % self.queens)
+                    sink("notice", "Successful moonshots: \n %s" % self.moonshots)
+                    sink("notice", "Hearts received per round: \n %s" % self.hpr)
+                    sink("notice", "Queens taken per round: \n %s" % self.qpr)
+                    sink("notice", "Moonshots per round: \n %s" % self.mpr)
+                    sink("notice", "Points taken per round: \n %s" % self.ppr)
 
         else:
             return
 
-    def play_hearts(self):
-        """Plays a game of hearts"""
+    def play_hearts(self, sink=print_event):
+        """Plays a game of hearts, reporting to sink as single_round() does"""
         while max(self.game_score.values()) < self.score_limit:
-            self.single_round()
+            self.single_round(sink)
+
+
+class BatchRollout(object):
+    """Plays many random-policy completions of a round position at once. Each simulation is a row of NumPy arrays:
+    hands are boolean card masks per seat and tricks are arrays of card indexes"""
+
+    suit_rows = None
+
+    def __init__(self, rng=None):
+        """Creates a simulator drawing from rng, which may be a numpy Generator, a seed or None"""
+        self.make_tables()
+        self.rng = numpy.random.default_rng(rng)
+
+    @classmethod
+    def make_tables(cls):
+        """Imports NumPy and builds the card mask rows shared by every simulator, once"""
+        import_numpy()
+        if cls.suit_rows is None:
+            cls.suit_rows = numpy.repeat(numpy.eye(4, dtype=bool), 13, axis=1)
+            cls.non_hearts_row = ~cls.suit_rows[1]
+            cls.non_points_row = cls.non_hearts_row.copy()
+            cls.non_points_row[10] = False
+            cls.two_of_clubs_row = numpy.zeros(52, dtype=bool)
+            cls.two_of_clubs_row[39] = True
+
+    def run(self, hround, owners):
+        """Completes the round from its current trick once per row of owners (an N x 52 array of seat indexes, -1
+        for cards out of play) and returns an N x 4 array of round points after the moonshot rule"""
+        self.make_tables()
+        owners = numpy.asarray(owners)
+        count = owners.shape[0]
+        rows = numpy.arange(count)
+        hands = owners[:, None, :] == numpy.arange(4)[None, :, None]
+
+        if hround.trick_num == 0 and hround.trick == []:
+            leader = owners[:, 39].astype(numpy.int64)
+        else:
+            leader = numpy.full(count, hround.players.index(hround.has_lead))
+        trick = numpy.full((count, 4), -1, dtype=numpy.int64)
+        for position, card in enumerate(hround.trick):
+            trick[:, position] = card.index
+        hearts_broken = numpy.full(count, hround.hearts_broken)
+        points = numpy.tile(numpy.array(hround.points_taken()), (count, 1))
+
+        first = len(hround.trick)
+        for trick_num in range(hround.trick_num, 13):
+            for position in range(first, 4):
+                seat = (leader + position) % 4
+                hand = hands[rows, seat]
+                if position == 0:
+                    if trick_num == 0:
+                        legal = hand & self.two_of_clubs_row
+                    else:
+                        safe = hand & self.non_hearts_row
+                        legal = numpy.where((~hearts_broken & safe.any(1))[:, None], safe, hand)
+                else:
+                    following = hand & self.suit_rows[trick[:, 0] // 13]
+                    has_suit = following.any(1)
+                    legal = numpy.where(has_suit[:, None], following, hand)
+                    if trick_num == 0:
+                        safe = hand & self.non_points_row
+                        legal = numpy.where((~has_suit & safe.any(1))[:, None], safe, legal)
+                keys = self.rng.random((count, 52))
+                keys[~legal] = -1
+                card = keys.argmax(1)
+                hands[rows, seat, card] = False
+                trick[:, position] = card
+            first = 0
+
+            suits = trick // 13
+            ranks = numpy.where(suits == suits[:, :1], trick, -1)
+            leader = (leader + ranks.argmax(1)) % 4
+            hearts = suits == 1
+            points[rows, leader] += hearts.sum(1) + 13 * (trick == 10).any(1)
+            hearts_broken |= hearts.any(1)
+
+        moonshots = (points == 26).any(1)
+        points[moonshots] = numpy.where(points[moonshots] == 26, 0, 26)
+        return points
+
+
+class SearchTimeout(Exception):
+    """Raised by EndgameSolver.search when a solve runs past its deadline"""
+
+
+class EndgameSolver(object):
+    """Solves a fully dealt position exactly by paranoid alpha-beta search: the AI's seat minimises its rollout
+    score (its round points less the lowest opponent total) and the other seats maximise it. Hands are card masks,
+    cards that are interchangeable in the remaining play are searched once, and positions are keyed by Zobrist
+    hash into a transposition table"""
+
+    suit_masks = tuple(CardSet.suit_masks[suit] for suit in Card.suits)
+    hearts_mask = CardSet.suit_masks["hearts"]
+    points_mask = hearts_mask | 1 << 10
+    non_points_mask = CardSet.full & ~points_mask
+    card_points = HeartsRound.card_points
+
+    hand_keys = HeartsRound.hand_keys
+    trick_keys = HeartsRound.trick_keys
+    lead_keys = HeartsRound.lead_keys
+    points_keys = HeartsRound.points_keys
+    hearts_broken_key = HeartsRound.hearts_broken_key
+
+    exact = 0
+    lower = 1
+    upper = 2
+    infinity = 1000
+
+    def __init__(self, table_size=1 << 18):
+        """Creates a solver whose transposition table is cleared whenever it reaches table_size entries"""
+        self.table_size = table_size
+        self.table = {}
+        self.context = None
+        self.nodes = 0
+        self.deadline = None
+
+    def load(self, hround, ai_index):
+        """Copies the position of a round into the solver, with the AI in seat ai_index"""
+        players = hround.players
+        self.hands = [player.hand.cards.mask for player in players]
+        self.trick = [card.index for card in hround.trick]
+        self.trick_num = hround.trick_num
+        self.hearts_broken = hround.hearts_broken
+        self.points = hround.points_taken()
+        self.leader = players.index(hround.has_lead)
+        self.hash = hround.zobrist
+        if self.trick_num == 0 and not self.trick:
+            self.leader = [hand >> 39 & 1 for hand in self.hands].index(1)
+            self.hash ^= self.lead_keys[players.index(hround.has_lead)] ^ self.lead_keys[self.leader]
+        context = (ai_index, tuple(player.score for player in players))
+        if context != self.context:
+            self.table.clear()
+            self.context = context
+        self.ai_index = ai_index
+        self.scores = context[1]
+
+    def solve(self, hround, ai_index, cards, deadline=None):
+        """Returns the exact score of the AI playing each of cards next in hround, lower being better for the AI.
+        Raises SearchTimeout once time.perf_counter() passes deadline, if one is given"""
+        self.load(hround, ai_index)
+        self.deadline = deadline
+        scores = []
+        for card in cards:
+            key = self.hash
+            undo = self.play(ai_index, card.index)
+            scores.append(self.search(-self.infinity, self.infinity))
+            self.unplay(ai_index, card.index, undo)
+            self.hash = key
+        return scores
+
+    def value(self):
+        """Scores a position in which no points are left to take"""
+        points = self.points
+        if 26 in points:
+            points = [0 if p == 26 else 26 for p in points]
+        ai_index = self.ai_index
+        return points[ai_index] - min(self.scores[(ai_index + i) % 4] + points[(ai_index + i) % 4] for i in range(1, 4))
+
+    def legal(self, seat):
+        """Returns the mask of the cards seat may play next"""
+        hand = self.hands[seat]
+        if not self.trick:
+            if self.trick_num == 0:
+                return hand & 1 << 39
+            if not self.hearts_broken and hand & ~self.hearts_mask:
+                return hand & ~self.hearts_mask
+            return hand
+        following = hand & self.suit_masks[self.trick[0] // 13]
+        if following:
+            return following
+        if self.trick_num == 0 and hand & self.non_points_mask:
+            return hand & self.non_points_mask
+        return hand
+
+    def moves(self, seat):
+        """Returns one card from each run of legal cards that are interchangeable: cards of a suit with no card
+        still in play ranked between them, keeping the queen of spades apart for its points. Higher cards come first,
+        which lets alpha-beta cut off sooner"""
+        legal = self.legal(seat)
+        live = self.hands[0] | self.hands[1] | self.hands[2] | self.hands[3]
+        for card in self.trick:
+            live |= 1 << card
+        moves = []
+        previous = -1
+        while legal:
+            low = legal & -legal
+            card = low.bit_length() - 1
+            legal ^= low
+            if previous < 0 or previous // 13 != card // 13 or card == 10 or previous == 10 or \
+                    live & (low - 1) & ~((2 << previous) - 1):
+                moves.append(card)
+            previous = card
+        moves.reverse()
+        return moves
+
+    def play(self, seat, card):
+        """Plays card for seat, resolving the trick when it completes, and returns what unplay() needs"""
+        self.hands[seat] ^= 1 << card
+        self.hash ^= self.hand_keys[seat][card] ^ self.trick_keys[seat][card]
+        self.trick.append(card)
+        if len(self.trick) < 4:
+            return None
+        trick = self.trick
+        lead_suit = trick[0] // 13
+        winner_position = 0
+        taken = 0
+        for position in range(4):
+            if trick[position] // 13 == lead_suit and trick[position] > trick[winner_position]:
+                winner_position = position
+            taken += self.card_points[trick[position]]
+        undo = (trick, self.leader, self.hearts_broken)
+        winner = (self.leader + winner_position) % 4
+        for position in range(4):
+            self.hash ^= self.trick_keys[(self.leader + position) % 4][trick[position]]
+        self.hash ^= self.lead_keys[self.leader] ^ self.lead_keys[winner]
+        self.hash ^= self.points_keys[winner][self.points[winner]] ^ \
+            self.points_keys[winner][self.points[winner] + taken]
+        if not self.hearts_broken and any(card // 13 == 1 for card in trick):
+            self.hearts_broken = True
+            self.hash ^= self.hearts_broken_key
+        self.points[winner] += taken
+        self.leader = winner
+        self.trick = []
+        self.trick_num += 1
+        return undo + (winner, taken)
+
+    def unplay(self, seat, card, undo):
+        """Reverts play(); the caller restores the hash it saved before playing"""
+        if undo is not None:
+            self.trick, self.leader, self.hearts_broken, winner, taken = undo
+            self.points[winner] -= taken
+            self.trick_num -= 1
+        self.trick.pop()
+        self.hands[seat] |= 1 << card
+
+    def search(self, alpha, beta):
+        """Returns the paranoid value of the loaded position within the window (alpha, beta)"""
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes & 255 and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.trick_num == 13:
+            return self.value()
+        live = self.hands[0] | self.hands[1] | self.hands[2] | self.hands[3]
+        for card in self.trick:
+            live |= 1 << card
+        if not live & self.points_mask:
+            return self.value()
+
+        key = self.hash
+        entry = self.table.get(key)
+        best_card = -1
+        if entry is not None:
+            value, bound, best_card = entry
+            if bound == self.exact or bound == self.lower and value >= beta or bound == self.upper and value <= alpha:
+                return value
+
+        seat = (self.leader + len(self.trick)) % 4
+        maximising = seat != self.ai_index
+        moves = self.moves(seat)
+        if best_card in moves:
+            moves.remove(best_card)
+            moves.insert(0, best_card)
+
+        window = (alpha, beta)
+        best = -self.infinity if maximising else self.infinity
+        for card in moves:
+            undo = self.play(seat, card)
+            value = self.search(alpha, beta)
+            self.unplay(seat, card, undo)
+            self.hash = key
+            if maximising:
+                if value > best:
+                    best, best_card = value, card
+                    alpha = max(alpha, value)
+            elif value < best:
+                best, best_card = value, card
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        if best <= window[0]:
+            bound = self.upper
+        elif best >= window[1]:
+            bound = self.lower
+        else:
+            bound = self.exact
+        if len(self.table) >= self.table_size:
+            self.table.clear()
+        self.table[key] = (best, bound, best_card)
+        return best
+
+
+rollout_pools = {}
+
+
+def rollout_pool(workers):
+    """Returns the persistent process pool with the given number of workers, starting and warming it up on first
+    use so that every worker process exists before the first decision"""
+    pool = rollout_pools.get(workers)
+    if pool is None:
+        import concurrent.futures
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+        list(pool.map(warm_up_worker, range(workers)))
+        rollout_pools[workers] = pool
+    return pool
+
+
+def warm_up_worker(n):
+    """No-op task used to start a pool worker ahead of time"""
+    return n
+
+
+worker_rollouts = {}
+
+
+def rollout_state(virtual_round):
+    """Pickles what a pool worker needs to rebuild a virtual round: the player names, the pass direction and a
+    snapshot. The bytes are made once per decision and shared by all of its tasks"""
+    import pickle
+    return pickle.dumps(([player.name for player in virtual_round.players], virtual_round.pass_dir,
+                         virtual_round.snapshot()), pickle.HIGHEST_PROTOCOL)
+
+
+def run_rollout_chunk(state, ai_index, card_index, trials, seed):
+    """Pool task: rebuilds the virtual round from rollout_state() bytes unless the worker already holds it, seeds
+    the worker's random module, then returns the summed score of trials rollouts of one card"""
+    if worker_rollouts.get("state") != state:
+        import pickle
+        names, pass_dir, snapshot = pickle.loads(state)
+        virtual_round = HeartsRound(*[Player(name, None, "random") for name in names], pass_dir)
+        virtual_round.restore(snapshot)
+        worker_rollouts.update(state=state, round=virtual_round, player=AIplayer("rollout", None, 0))
+    random.seed(seed)
+    return worker_rollouts["player"].rollout_score(worker_rollouts["round"], ai_index, cards_by_index[card_index],
+                                                   trials)
+
+
+class DealSampler(object):
+    """Draws the hands of a player's three opponents uniformly from every deal consistent with the player's
+    knowledge. Each unseen card is in one knowledge list that names the seats that may hold it, so a deal is fixed by
+    how many cards of each shared list go to each seat. The sampler counts the deals for every such split exactly,
+    picks a split with probability proportional to its count and then deals each list's cards uniformly within it"""
+
+    shared_keys = ["held by left or across", "held by left or right", "held by across or right"]
+    seat_keys = ["held by left", "held by across", "held by right"]
+
+    def __init__(self, knowledge, hand_sizes):
+        """Builds the sampler for a knowledge dict and the hand sizes of the left, across and right players. Raises
+        ValueError if no deal fits the knowledge"""
+        self.key = self.signature(knowledge, hand_sizes)
+        self.fixed = [knowledge[key][:] for key in self.seat_keys]
+        self.shared = [knowledge[key][:] for key in self.shared_keys]
+        self.any = knowledge["held by any"][:]
+        left_need, across_need, right_need = [size - len(cards) for size, cards in zip(hand_sizes, self.fixed)]
+        left_or_across, left_or_right, across_or_right = [len(cards) for cards in self.shared]
+        unknown = len(self.any)
+
+        self.splits = []
+        self.cumulative = []
+        self.count = 0
+        for to_left_from_across in range(left_or_across + 1):
+            for to_left_from_right in range(left_or_right + 1):
+                any_to_left = left_need - to_left_from_across - to_left_from_right
+                if any_to_left < 0:
+                    break
+                for to_across_from_right in range(across_or_right + 1):
+                    any_to_across = across_need - (left_or_across - to_left_from_across) - to_across_from_right
+                    any_to_right = unknown - any_to_left - any_to_across
+                    if any_to_across < 0 or any_to_right < 0 or \
+                            any_to_right + (left_or_right - to_left_from_right) + \
+                            (across_or_right - to_across_from_right) != right_need:
+                        continue
+                    self.count += math.comb(left_or_across, to_left_from_across) * \
+                        math.comb(left_or_right, to_left_from_right) * \
+                        math.comb(across_or_right, to_across_from_right) * \
+                        math.comb(unknown, any_to_left) * math.comb(unknown - any_to_left, any_to_across)
+                    self.splits.append((to_left_from_across, to_left_from_right, to_across_from_right, any_to_left,
+                                        any_to_across))
+                    self.cumulative.append(self.count)
+        if not self.count:
+            raise ValueError("No deal is consistent with the knowledge")
+
+    @classmethod
+    def signature(cls, knowledge, hand_sizes):
+        """Returns a hashable summary of the knowledge lists and hand sizes a sampler depends on"""
+        return tuple(knowledge.possible) + (tuple(hand_sizes),)
+
+    def sample(self, rng=random):
+        """Returns one deal as lists of cards for the left, across and right players. Lists are shuffled by sorting on
+        random keys, which is several times faster than random.sample for hands this size"""
+        split = self.splits[bisect.bisect_right(self.cumulative, rng.randrange(self.count))]
+        to_left_from_across, to_left_from_right, to_across_from_right, any_to_left, any_to_across = split
+        draw = rng.random
+        left, across, right = [cards[:] for cards in self.fixed]
+        left_or_across, left_or_right, across_or_right = [sorted(cards, key=lambda card: draw()) for cards in
+                                                          self.shared]
+        unknown = sorted(self.any, key=lambda card: draw())
+        left += left_or_across[:to_left_from_across] + left_or_right[:to_left_from_right] + unknown[:any_to_left]
+        across += left_or_across[to_left_from_across:] + across_or_right[:to_across_from_right] + \
+            unknown[any_to_left:any_to_left + any_to_across]
+        right += left_or_right[to_left_from_right:] + across_or_right[to_across_from_right:] + \
+            unknown[any_to_left + any_to_across:]
+        return left, across, right
+
+
+class Determinizer(object):
+    """Deals determinizations in bulk as NumPy arrays of card owners, uniformly over the deals consistent with a
+    player's knowledge. It draws splits from the same exact counts as a DealSampler, then shuffles every knowledge
+    list for all rows with one sort of random keys and cuts them by the splits, so no Python objects are made per
+    determinization"""
+
+    def __init__(self, rng=None):
+        """Creates a determinizer drawing from rng, which may be a numpy Generator, a seed or None"""
+        import_numpy()
+        self.rng = numpy.random.default_rng(rng)
+        self.sampler = None
+        self.seats = None
+
+    def deal(self, hround, ai_index, count):
+        """Returns a count x 52 array giving the seat holding each card in count determinizations of hround as seen
+        from seat ai_index, with -1 for cards already played or in the current trick"""
+        import_numpy()
+        ai_player = hround.players[ai_index]
+        seats = [(ai_index + i) % 4 for i in range(1, 4)]
+        hand_sizes = [len(hround.players[seat].hand.contents) for seat in seats]
+        signature = DealSampler.signature(ai_player.knowledge, hand_sizes)
+        if self.sampler is None or self.sampler.key != signature or self.seats != seats:
+            self.sampler = DealSampler(ai_player.knowledge, hand_sizes)
+            self.lay_out(seats)
+        sampler = self.sampler
+
+        owners = numpy.full((count, 52), -1, dtype=numpy.int8)
+        owners[:, [card.index for card in ai_player.hand.contents]] = ai_index
+        for seat, cards in zip(seats, sampler.fixed):
+            owners[:, [card.index for card in cards]] = seat
+        if not len(self.cards):
+            return owners
+
+        picks = numpy.searchsorted(self.cumulative, self.rng.random(count) * sampler.count, side="right")
+        seat_rows = self.seat_rows[numpy.minimum(picks, len(self.seat_rows) - 1)]
+        owners[numpy.arange(count)[:, None], numpy.take(self.cards, self.shuffle(count) & 63)] = seat_rows
+        return owners
+
+    def stream(self, hround, ai_index, size):
+        """Yields arrays of size determinizations from deal() for as long as the caller keeps asking"""
+        while True:
+            yield self.deal(hround, ai_index, size)
+
+    def lay_out(self, seats):
+        """Lines up the sampler's shared lists and unknown cards as numbered groups of columns, and tabulates for
+        every split the seat given each position of a shuffled row"""
+        left, across, right = seats
+        lists = self.sampler.shared + [self.sampler.any]
+        self.seats = seats
+        self.cards = numpy.array([card.index for cards in lists for card in cards], dtype=numpy.intp)
+        groups = numpy.array([group for group, cards in enumerate(lists) for card in cards], dtype=numpy.uint32)
+        self.base_keys = groups << 30 | numpy.arange(len(self.cards), dtype=numpy.uint32)
+        self.cumulative = numpy.array(self.sampler.cumulative, dtype=float)
+        self.seat_rows = numpy.empty((len(self.sampler.splits), len(self.cards)), dtype=numpy.int8)
+        for row, split in zip(self.seat_rows, self.sampler.splits):
+            to_left_from_across, to_left_from_right, to_across_from_right, any_to_left, any_to_across = split
+            row[:] = [left] * to_left_from_across + [across] * (len(lists[0]) - to_left_from_across) + \
+                [left] * to_left_from_right + [right] * (len(lists[1]) - to_left_from_right) + \
+                [across] * to_across_from_right + [right] * (len(lists[2]) - to_across_from_right) + \
+                [left] * any_to_left + [across] * any_to_across + \
+                [right] * (len(lists[3]) - any_to_left - any_to_across)
+
+    def shuffle(self, count):
+        """Returns count rows of sorted keys whose low six bits shuffle the columns within every group. Each key
+        holds its group, 24 random bits and its column, and rows where two keys of a group drew the same bits are
+        drawn again so the order stays uniform"""
+        size = count * len(self.cards)
+        random_bits = self.rng.bit_generator.random_raw((size + 1) // 2).view(numpy.uint32)[:size]
+        keys = random_bits.reshape(count, len(self.cards)) & numpy.uint32(0x3FFFFFC0) | self.base_keys
+        keys.sort(axis=1)
+        ties = (numpy.diff(keys, axis=1) < 64).any(axis=1)
+        if ties.any():
+            keys[ties] = self.shuffle(int(ties.sum()))
+        return keys
+
+
+class RolloutCache(object):
+    """Bounded least-recently-used map from (information set, card index) to the accumulated rollout statistics
+    [total score, rollouts] of the AI playing that card from that information set. The key recurs whenever the AI
+    faces the same decision again, so later rollouts add to earlier ones. Entries are evicted oldest first once
+    there are more than max_entries of them or their keys and values take more than about max_bytes"""
+
+    def __init__(self, max_entries=100000, max_bytes=64 << 20):
+        """Creates an empty cache"""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def rollouts(self, key):
+        """Returns the number of rollouts held for key, without counting a lookup"""
+        stats = self.entries.get(key)
+        return 0 if stats is None else stats[1]
+
+    def get(self, key, rollouts):
+        """Returns the statistics for key when they hold at least the given number of rollouts, counting a hit, or
+        None, counting a miss"""
+        stats = self.entries.get(key)
+        if stats is None or stats[1] < rollouts:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return stats
+
+    def add(self, key, score, rollouts=1):
+        """Adds the summed score of some rollouts to the statistics for key and returns the statistics"""
+        stats = self.entries.get(key)
+        if stats is None:
+            stats = self.entries[key] = [0, 0]
+            self.bytes += self.entry_size(key, stats)
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                old_key, old_stats = self.entries.popitem(last=False)
+                self.bytes -= self.entry_size(old_key, old_stats)
+                self.evictions += 1
+        else:
+            self.entries.move_to_end(key)
+        stats[0] += score
+        stats[1] += rollouts
+        return stats
+
+    @staticmethod
+    def entry_size(key, stats):
+        """Approximate memory held by one entry, counting nested key tuples but not the dict slot"""
+        size = sys.getsizeof(stats)
+        items = [key]
+        while items:
+            item = items.pop()
+            size += sys.getsizeof(item)
+            if isinstance(item, tuple):
+                items.extend(item)
+        return size
+
+    def stats(self):
+        """Returns the cache's counters as a dict"""
+        lookups = self.hits + self.misses
+        return {"entries": len(self.entries), "bytes": self.bytes, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "hit rate": self.hits / lookups if lookups else 0.0}
 
 
 class AIplayer(Player):
     """Defines an AI player for a game of hearts"""
 
-    standard_deck = Deck()
-
-    def __init__(self, name, hand, trials):
-        """Initiates a player with a hand and an AI"""
+    allocations = ["uniform", "halving"]
+
+    def __init__(self, name, hand, trials, vectorized=False, workers=1, time_limit=None, allocation="uniform",
+                 endgame_trick=None, cache=None):
+        """Initiates a player with a hand and an AI. Vectorized players evaluate their trials with a BatchRollout;
+        with more than one worker the trials are spread over a process pool instead. A time_limit in seconds
+        replaces the fixed trial count with as many rollouts as fit in that budget for each play, and the
+        "halving" allocation prunes weak plays by successive halving instead of giving every play self.trials.
+        Only one of these evaluation modes may be chosen, and a ValueError is raised when several are. From trick
+        number endgame_trick onwards each trial is solved exactly by an EndgameSolver instead, whichever mode is
+        chosen for the earlier tricks; a time_limit still bounds those decisions. A RolloutCache given as cache keeps
+        the uniform rollouts of each play from each information set, so a decision met again reuses them; it cannot
+        be combined with another evaluation mode"""
+        if allocation not in self.allocations:
+            raise ValueError("Unknown allocation: %s" % allocation)
+        modes = [mode for mode, chosen in (("vectorized", vectorized), ("workers", workers > 1),
+                                           ("time_limit", time_limit is not None),
+                                           ("halving allocation", allocation == "halving")) if chosen]
+        if len(modes) > 1:
+            raise ValueError("Conflicting evaluation modes: %s" % ", ".join(modes))
+        if cache is not None and modes:
+            raise ValueError("A rollout cache only serves uniform rollouts, not %s" % modes[0])
         self.name = name
         self.hand = hand
         self.won_cards = []
         self.score = 0
-        self.knowledge = {"held by any": [], "held by left": [], "held by across": [], "held by right": [],
-                          "held by left or across": [], "held by left or right": [], "held by across or right": [],
-                          "left no spades": False, "across no spades": False, "right no spades": False,
-                          "left no hearts": False, "across no hearts": False, "right no hearts": False,
-                          "left no diamonds": False, "across no diamonds": False, "right no diamonds": False,
-                          "left no clubs": False, "across no clubs": False, "right no clubs": False, "only points": ""}
+        self.knowledge = KnowledgeState()
 
         self.ai = "program"
         self.trials = trials
+        self.vectorized = vectorized
+        self.workers = workers
+        self.time_limit = time_limit
+        self.allocation = allocation
+        self.endgame_trick = endgame_trick
+        self.cache = cache
+        self.search_stats = {}
+        self.batch_rollout = None
+        self.determinizer = None
+        self.endgame_solver = None
+        self.deal_sampler = None
 
     def __repr__(self):
         """Defines a representation of a player"""
@@ -4319,10 +1919,10 @@ class AIplayer(Player):
                 choice_str = str(input("Choose a card from your hand to pass: "))
                 card_value = ""
                 card_suit = ""
-                for value in hand.value_items:
+                for value in Card.value_items:
                     if value in choice_str:
                         card_value = value
-                for suit in hand.suits:
+                for suit in Card.suits:
                     if suit in choice_str:
                         card_suit = suit
                 if card_value == "" or card_suit == "":
@@ -4338,7 +1938,7 @@ class AIplayer(Player):
 
     def play_card(self, card):
         """Compels a player to play a particular card"""
-        if card in self.hand.contents:
+        if card in self.hand:
             self.hand.remove_card(card)
             return card
         else:
@@ -4346,1290 +1946,477 @@ class AIplayer(Player):
 
     def has_suit(self, suit):
         """Indicates whether the player has a suit"""
-        for cards in self.hand.order:
-            if suit == cards.suit:
-                return True
-        return False
+        return self.hand.has_suit(suit)
 
     def count_suit(self, suit):
         """Counts the number of cards of a suit in a players hand"""
-        count = 0
-        for cards in self.hand.order:
-            if suit == cards.suit:
-                count += 1
-        return count
+        return self.hand.count_suit(suit)
 
     def has_start(self, start_card=Card("2", "clubs")):
         """Indicates with the player has the starting card"""
-        for cards in self.hand.order:
-            if cards.suit == start_card.suit and cards.value == start_card.value:
-                return True
-        return False
+        return start_card in self.hand
 
     def choose_play(self, hround):
         """Picks a card to play using a monte carlo simulation"""
 
-        trick = copy.deepcopy(hround.trick)
-        trick_num = copy.deepcopy(hround.trick_num)
-        hearts_broken = copy.deepcopy(hround.hearts_broken)
-        play_options = self.hand.legal_moves(trick, trick_num, hearts_broken)
+        play_options = self.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
 
-        virtual_round = copy.deepcopy(hround)
-
-        if len(play_options) == 1 or virtual_round.equivalent_moves(self) or not virtual_round.points_remain or \
-                virtual_round.cant_effect_outcome(self):
+        if len(play_options) == 1 or not hround.points_remain() or hround.cant_effect_outcome(self):
             return random.choice(play_options)
 
-        ai_index = virtual_round.players.index(self)
-        lead_position = virtual_round.players.index(virtual_round.has_lead)
-        virtual_players = ["", "", "", ""]
-
-        ai_player = AIplayer(virtual_round.players[ai_index].name,
-                             virtual_round.players[ai_index].hand, self.trials)
-        ai_player.won_cards = virtual_round.players[ai_index].won_cards[:]
-        ai_player.score = virtual_round.players[ai_index].score
-        ai_player.knowledge = virtual_round.players[ai_index].knowledge
-
-        left_player = Player(virtual_round.players[(ai_index + 1) % 4].name,
-                               virtual_round.players[(ai_index + 1) % 4].hand, "random")
-        left_player.won_cards = virtual_round.players[(ai_index + 1) % 4].won_cards[:]
-        left_player.score = virtual_round.players[(ai_index + 1) % 4].score
-        left_player.knowledge = virtual_round.players[(ai_index + 1) % 4].knowledge
-
-        across_player = Player(virtual_round.players[(ai_index + 2) % 4].name,
-                                 virtual_round.players[(ai_index + 2) % 4].hand, "random")
-        across_player.won_cards = virtual_round.players[(ai_index + 2) % 4].won_cards[:]
-        across_player.score = virtual_round.players[(ai_index + 2) % 4].score
-        across_player.knowledge = virtual_round.players[(ai_index + 2) % 4].knowledge
-
-        right_player = Player(virtual_round.players[(ai_index + 3) % 4].name,
-                                virtual_round.players[(ai_index + 3) % 4].hand, "random")
-        right_player.won_cards = virtual_round.players[(ai_index + 3) % 4].won_cards[:]
-        right_player.score = virtual_round.players[(ai_index + 3) % 4].score
-        right_player.knowledge = virtual_round.players[(ai_index + 3) % 4].knowledge
-
-        print(ai_player.name, "knowledge:", ai_player.knowledge)
-        held_by_any = ai_player.knowledge["held by any"][:]
-        held_by_left_or_across = ai_player.knowledge["held by left or across"][:]
-        held_by_left_or_right = ai_player.knowledge["held by left or right"][:]
-        held_by_across_or_right = ai_player.knowledge["held by across or right"][:]
-        left_potential_cards = held_by_any[:]
-        left_potential_cards.extend(held_by_left_or_across)
-        left_potential_cards.extend(held_by_left_or_right)
-        left_hand_size = len(left_player.hand.contents)
-        across_hand_size = len(across_player.hand.contents)
-        right_hand_size = len(right_player.hand.contents)
-        left_to_pick = left_hand_size - len(ai_player.knowledge["held by left"])
-        across_to_pick = across_hand_size - len(ai_player.knowledge["held by across"])
-        right_to_pick = right_hand_size - len(ai_player.knowledge["held by right"])
-
-        new_left_hand = ai_player.knowledge["held by left"][:]
-        new_across_hand = ai_player.knowledge["held by across"][:]
-        new_right_hand = ai_player.knowledge["held by right"][:]
-        print(len(held_by_any))
-        print(len(held_by_across_or_right))
-        print(across_to_pick)
-        print(len(held_by_left_or_across))
-        print(right_to_pick)
-        print(len(held_by_left_or_right))
-        for x in range(left_to_pick):
-            if len(held_by_any) + len(held_by_across_or_right) > across_to_pick - len(held_by_left_or_across) and \
-                    len(held_by_any) + len(held_by_across_or_right) > right_to_pick - len(held_by_left_or_right):
-                chosen_card = random.choice(left_potential_cards)
-                new_left_hand.append(chosen_card)
-                left_potential_cards.remove(chosen_card)
-                if chosen_card in held_by_any:
-                    held_by_any.remove(chosen_card)
-                if chosen_card in held_by_left_or_across:
-                    held_by_left_or_across.remove(chosen_card)
-                if chosen_card in held_by_left_or_right:
-                    held_by_left_or_right.remove(chosen_card)
-            elif len(held_by_any) + len(held_by_across_or_right) <= across_to_pick - len(held_by_left_or_across):
-                chosen_card = random.choice(held_by_left_or_right)
-                new_left_hand.append(chosen_card)
-                held_by_left_or_right.remove(chosen_card)
-            elif len(held_by_any) + len(held_by_across_or_right) <= right_to_pick - len(held_by_left_or_right):
-                chosen_card = random.choice(held_by_left_or_across)
-                new_left_hand.append(chosen_card)
-                left_potential_cards.remove(chosen_card)
-                held_by_left_or_across.remove(chosen_card)
-
-        left_player.hand.contents = new_left_hand[:]
-        left_player.hand.order = new_left_hand[:]
-        left_player.hand.arrange_contents()
-
-        new_across_hand.extend(held_by_left_or_across)
-        across_to_pick = across_to_pick - len(held_by_left_or_across)
-        across_potential_cards = held_by_any[:]
-        across_potential_cards.extend(held_by_across_or_right)
-        if across_potential_cards != []:
-            for x in range(across_to_pick):
-                chosen_card = random.choice(across_potential_cards)
-                new_across_hand.append(chosen_card)
-                across_potential_cards.remove(chosen_card)
-                if chosen_card in held_by_any:
-                    held_by_any.remove(chosen_card)
-                if chosen_card in held_by_across_or_right:
-                    held_by_across_or_right.remove(chosen_card)
-
-        across_player.hand.contents = new_across_hand[:]
-        across_player.hand.order = new_across_hand[:]
-        across_player.hand.arrange_contents()
-
-        new_right_hand.extend(held_by_any)
-        new_right_hand.extend(held_by_across_or_right)
-        new_right_hand.extend(held_by_left_or_right)
-
-        right_player.hand.contents = new_right_hand[:]
-        right_player.hand.order = new_right_hand[:]
-        right_player.hand.arrange_contents()
-
-
-
-
-        # new_left_hand = ai_player.knowledge["held by left"][:]
-        # # print("lpc:", left_potential_cards)
-        # # print("left hand:", new_left_hand)
-        # # if len(held_by_any) + len(held_by_across_or_right) + len(ai_player.knowledge["held by across"]) + \
-        # #         len(held_by_left_or_across) <= len(across_player.hand.contents) and \
-        # #         len(held_by_any) + len(held_by_left_or_right) + len(ai_player.knowledge["held by right"]) + \
-        # #         len(held_by_across_or_right) <= len(right_player.hand.contents):
-        # #     left_potential_cards = []
-        # #
-        # # elif len(held_by_any) + len(held_by_across_or_right) + len(ai_player.knowledge["held by across"]) + \
-        # #         len(held_by_left_or_across) <= len(across_player.hand.contents):
-        # #     left_potential_cards = held_by_left_or_right
-        # #     print("blah1")
-        # #
-        # # elif len(held_by_any) + len(held_by_left_or_right) + len(held_by_across_or_right) + \
-        # #         len(ai_player.knowledge["held by right"]) <= len(right_player.hand.contents):
-        # #     print("blah2")
-        # #     left_potential_cards = held_by_left_or_across
-        #
-        # left_hand_size = len(left_player.hand.contents) - len(new_left_hand)
-        # if left_potential_cards != []:
-        #     for x in range(left_hand_size):
-        #         chosen_card = random.choice(left_potential_cards)
-        #         new_left_hand.append(chosen_card)
-        #         left_potential_cards.remove(chosen_card)
-        #         if chosen_card in held_by_any:
-        #             held_by_any.remove(chosen_card)
-        #         if chosen_card in held_by_left_or_across:
-        #             held_by_left_or_across.remove(chosen_card)
-        #         if chosen_card in held_by_left_or_right:
-        #             held_by_left_or_right.remove(chosen_card)
-        # # left_player.hand.contents = new_left_hand[:]
-        # # left_player.hand.order = new_left_hand[:]
-        # # left_player.hand.arrange_contents()
-        # # new_across_hand = ai_player.knowledge["held by across"][:]
-        # # new_across_hand.extend(held_by_left_or_across)
-        # # across_potential_cards = held_by_any[:]
-        # # across_potential_cards.extend(held_by_across_or_right)
-        # #
-        # # if len(held_by_any) + len(held_by_across_or_right) + len(held_by_left_or_right) + \
-        # #         len(ai_player.knowledge["held by right"]) <= len(right_player.hand.contents):
-        # #     across_potential_cards = held_by_left_or_across
-        # #     print("blah3")
-        #
-        #
-        #
-        # across_hand_size = len(across_player.hand.contents) - len(new_across_hand)
-        #
-        # # print("apc:", across_potential_cards)
-        # # print("across hand:", new_across_hand)
-        # if across_potential_cards != []:
-        #     for x in range(across_hand_size):
-        #         chosen_card = random.choice(across_potential_cards)
-        #         new_across_hand.append(chosen_card)
-        #         across_potential_cards.remove(chosen_card)
-        #         if chosen_card in held_by_any:
-        #             held_by_any.remove(chosen_card)
-        #         if chosen_card in held_by_across_or_right:
-        #             held_by_across_or_right.remove(chosen_card)
-        #
-        # # across_player.hand.contents = new_across_hand[:]
-        # # across_player.hand.order = new_across_hand[:]
-        # # across_player.hand.arrange_contents()
-        # #
-        # # new_right_hand = ai_player.knowledge["held by right"][:]
-        # # new_right_hand.extend(held_by_any)
-        # # new_right_hand.extend(held_by_across_or_right)
-        # # new_right_hand.extend(held_by_left_or_right)
-        # #
-        # # right_player.hand.contents = new_right_hand[:]
-        # # right_player.hand.order = new_right_hand[:]
-        # # right_player.hand.arrange_contents()
-
-        print(ai_player.name, len(ai_player.hand.contents), ai_player.hand.contents)
-        print(left_player.name, len(left_player.hand.contents), left_player.hand.contents)
-        print(across_player.name, len(across_player.hand.contents), across_player.hand.contents)
-        print(right_player.name, len(right_player.hand.contents), right_player.hand.contents, "\n")
-
-        all_cards = self.standard_deck.contents[:]
-
-        all_cards = [i for i in all_cards if i not in virtual_round.played_all]
-
-        left_player.knowledge["held by any"] = [i for i in all_cards if i not in left_player.hand.contents]
-        left_player.knowledge["held by left or across"] = []
-        left_player.knowledge["held by left or right"] = []
-        left_player.knowledge["held by across or right"] = []
-        left_player.knowledge["held by across"] = []
-        left_player.knowledge["held by left"] = []
-        left_player.knowledge["held by right"] = []
-
-        if left_player.knowledge["left no spades"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["left no hearts"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["left no diamonds"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["left no clubs"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["across no spades"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["across no hearts"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["across no diamonds"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["across no clubs"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or across"] = [i for i in
-                                                               left_player.knowledge["held by left or across"]
-                                                               if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if left_player.knowledge["right no spades"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if left_player.knowledge["right no hearts"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if left_player.knowledge["right no diamonds"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if left_player.knowledge["right no clubs"]:
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by any"] = [i for i in left_player.knowledge["held by any"] if i not in
-                                                    cards_to_remove]
-            left_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by left or right"] = [i for i in
-                                                              left_player.knowledge["held by left or right"]
-                                                              if i not in cards_to_remove]
-            left_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in left_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            left_player.knowledge["held by across or right"] = [i for i in
-                                                                left_player.knowledge["held by across or right"]
-                                                                if i not in cards_to_remove]
-            left_player.knowledge["held by across"].extend(cards_to_remove)
-
-        across_player.knowledge["held by any"] = [i for i in all_cards if i not in across_player.hand.contents]
-        across_player.knowledge["held by left or across"] = []
-        across_player.knowledge["held by left or right"] = []
-        across_player.knowledge["held by across or right"] = []
-        across_player.knowledge["held by left"] = []
-        across_player.knowledge["held by right"] = []
-        across_player.knowledge["held by across"] = []
-
-        if across_player.knowledge["left no spades"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["left no hearts"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not in
-                                                      cards_to_remove]
-            across_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["left no diamonds"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["left no clubs"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["across no spades"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not in
-                                                      cards_to_remove]
-            across_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["across no hearts"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["across no diamonds"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["across no clubs"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or across"] = [i for i in
-                                                                 across_player.knowledge["held by left or across"]
-                                                                 if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if across_player.knowledge["right no spades"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not in
-                                                      cards_to_remove]
-            across_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if across_player.knowledge["right no hearts"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if across_player.knowledge["right no diamonds"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if across_player.knowledge["right no clubs"]:
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by any"] = [i for i in across_player.knowledge["held by any"] if i not
-                                                      in cards_to_remove]
-            across_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by left or right"] = [i for i in
-                                                                across_player.knowledge["held by left or right"]
-                                                                if i not in cards_to_remove]
-            across_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in across_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            across_player.knowledge["held by across or right"] = [i for i in
-                                                                  across_player.knowledge["held by across or right"]
-                                                                  if i not in cards_to_remove]
-            across_player.knowledge["held by across"].extend(cards_to_remove)
-
-        right_player.knowledge["held by any"] = [i for i in all_cards if i not in right_player.hand.contents]
-        right_player.knowledge["held by left or across"] = []
-        right_player.knowledge["held by left or right"] = []
-        right_player.knowledge["held by across or right"] = []
-        right_player.knowledge["held by right"] = []
-        right_player.knowledge["held by across"] = []
-        right_player.knowledge["held by left"] = []
-
-        if right_player.knowledge["left no spades"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["left no hearts"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if
-                                                     i not in
-                                                     cards_to_remove]
-            right_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["left no diamonds"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["left no clubs"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by across or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["across no spades"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if
-                                                     i not in
-                                                     cards_to_remove]
-            right_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["across no hearts"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["across no diamonds"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["across no clubs"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or right"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or across"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or across"] = [i for i in
-                                                                right_player.knowledge[
-                                                                    "held by left or across"]
-                                                                if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by right"].extend(cards_to_remove)
-
-        if right_player.knowledge["right no spades"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if
-                                                     i not in
-                                                     cards_to_remove]
-            right_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "spades":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if right_player.knowledge["right no hearts"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "hearts":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if right_player.knowledge["right no diamonds"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "diamonds":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-
-        if right_player.knowledge["right no clubs"]:
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by any"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by any"] = [i for i in right_player.knowledge["held by any"] if i not
-                                                     in cards_to_remove]
-            right_player.knowledge["held by left or across"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by left or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by left or right"] = [i for i in
-                                                               right_player.knowledge["held by left or right"]
-                                                               if i not in cards_to_remove]
-            right_player.knowledge["held by left"].extend(cards_to_remove)
-            cards_to_remove = []
-            for cards in right_player.knowledge["held by across or right"]:
-                if cards.suit == "clubs":
-                    cards_to_remove.append(cards)
-            right_player.knowledge["held by across or right"] = [i for i in
-                                                                 right_player.knowledge[
-                                                                     "held by across or right"]
-                                                                 if i not in cards_to_remove]
-            right_player.knowledge["held by across"].extend(cards_to_remove)
-
-        print(ai_player.name, "knowledge:", ai_player.knowledge)
-        print(left_player.name, "knowledge:", left_player.knowledge)
-        print(across_player.name, "knowledge:", across_player.knowledge)
-        print(right_player.name, "knowledge:", right_player.knowledge)
-
-        virtual_players[ai_index] = ai_player
-        virtual_players[(ai_index + 1) % 4] = left_player
-        virtual_players[(ai_index + 2) % 4] = across_player
-        virtual_players[(ai_index + 3) % 4] = right_player
-
-        virtual_round.players = virtual_players
-
-        virtual_round.has_lead = virtual_round.players[lead_position]
-
-        virtual_round.played_players = {virtual_round.players[0].name:
-                                            hround.played_players[hround.players[0].name],
-                                        virtual_round.players[1].name:
-                                            hround.played_players[hround.players[1].name],
-                                        virtual_round.players[2].name:
-                                            hround.played_players[hround.players[2].name],
-                                        virtual_round.players[3].name:
-                                            hround.played_players[hround.players[3].name]}
-        virtual_round.passed_players = {virtual_round.players[0].name:
-                                            hround.passed_players[hround.players[0].name],
-                                        virtual_round.players[1].name:
-                                            hround.passed_players[hround.players[1].name],
-                                        virtual_round.players[2].name:
-                                            hround.passed_players[hround.players[2].name],
-                                        virtual_round.players[3].name:
-                                            hround.passed_players[hround.players[3].name]}
-        virtual_round.round_score = {virtual_round.players[0].name:
-                                         hround.round_score[hround.players[0].name],
-                                     virtual_round.players[1].name:
-                                         hround.round_score[hround.players[1].name],
-                                     virtual_round.players[2].name:
-                                         hround.round_score[hround.players[2].name],
-                                     virtual_round.players[3].name:
-                                         hround.round_score[hround.players[3].name]}
+        play_options = [cards[0] for cards in hround.move_classes(self, play_options)]
+        if len(play_options) == 1:
+            return play_options[0]
+
+        ai_index = hround.players.index(self)
+        virtual_round = hround.clone("random")
 
         option_score = {}
         for opt in play_options:
-            option_score[str(opt)] = 0
+            option_score[opt] = 0
+        if self.endgame_trick is not None and hround.trick_num >= self.endgame_trick:
+            self.solve_evaluate(virtual_round, ai_index, play_options, option_score)
+        elif self.time_limit is not None:
+            self.timed_evaluate(virtual_round, ai_index, play_options, option_score)
+        elif self.allocation == "halving":
+            self.halving_evaluate(virtual_round, ai_index, play_options, option_score)
+        elif self.vectorized:
+            self.batch_evaluate(virtual_round, ai_index, play_options, option_score)
+        elif self.workers > 1:
+            self.parallel_evaluate(virtual_round, ai_index, play_options, option_score)
+        else:
+            for card in play_options:
+                option_score[card] += self.cached_rollout_score(virtual_round, ai_index, card, self.trials)
+
+        return min(option_score.keys(), key=(lambda key: option_score[key]))
+
+    def rollout_score(self, virtual_round, ai_index, card, trials):
+        """Plays trials random rollouts of card in place on virtual_round and returns their summed score, where a
+        lower score is better for the AI"""
+        ai_player = virtual_round.players[ai_index]
+        score = 0
+        for n in range(trials):
+            self.determinize(virtual_round, ai_index)
+            virtual_round.apply_play(ai_player, card)
+            plays = virtual_round.play_out() + 1
+
+            points = virtual_round.round_points()
+            other_player_scores = [virtual_round.players[(ai_index + i) % 4].score + points[(ai_index + i) % 4]
+                                   for i in range(1, 4)]
+            trial_score = points[ai_index] - min(other_player_scores)
+            score += trial_score
+
+            for i in range(plays):
+                virtual_round.undo_play()
+        return score
+
+    def cached_rollout_score(self, virtual_round, ai_index, card, trials):
+        """Returns the score of trials rollouts of card as rollout_score() does, going through self.cache when there
+        is one: rollouts already cached for the AI's information set count towards trials, only the missing ones
+        are played, and the cached mean is scaled to trials"""
+        if self.cache is None:
+            return self.rollout_score(virtual_round, ai_index, card, trials)
+        key = virtual_round.information_set(ai_index) + (card.index,)
+        stats = self.cache.get(key, trials)
+        if stats is None:
+            missing = trials - self.cache.rollouts(key)
+            stats = self.cache.add(key, self.rollout_score(virtual_round, ai_index, card, missing), missing)
+        return stats[0] / stats[1] * trials
+
+    def timed_evaluate(self, virtual_round, ai_index, play_options, option_score):
+        """Runs rollouts round-robin over the play options until self.time_limit seconds have passed, then leaves
+        the mean score of each option in option_score. Every option gets at least one rollout"""
+        start = time.perf_counter()
+        deadline = start + self.time_limit
+        rollouts = {}
+        for card in play_options:
+            rollouts[card] = 0
+        passes = 0
+        while passes == 0 or time.perf_counter() < deadline:
+            for card in play_options:
+                option_score[card] += self.rollout_score(virtual_round, ai_index, card, 1)
+                rollouts[card] += 1
+                if passes > 0 and time.perf_counter() >= deadline:
+                    break
+            passes += 1
+        for key in option_score:
+            option_score[key] = option_score[key] / rollouts[key]
+        self.search_stats = {"rollouts": sum(rollouts.values()), "elapsed": time.perf_counter() - start}
+
+    def halving_evaluate(self, virtual_round, ai_index, play_options, option_score):
+        """Successive halving over the play options. Each round tops every surviving option up to a doubling share
+        of self.trials rollouts and drops the worse half by mean score, so only the final survivor gets the full
+        self.trials. Dropped options are left with an infinite score; the rollouts saved against evaluating every
+        option uniformly are recorded in search_stats"""
+        totals = {}
+        counts = {}
+        for card in play_options:
+            totals[card] = 0
+            counts[card] = 0
+        survivors = list(play_options)
+        rounds = math.ceil(math.log2(len(play_options)))
+        for i in range(rounds + 1):
+            target = max(1, math.ceil(self.trials / 2 ** (rounds - i)))
+            for card in survivors:
+                totals[card] += self.rollout_score(virtual_round, ai_index, card, target - counts[card])
+                counts[card] = target
+            survivors.sort(key=lambda c: totals[c] / counts[c])
+            survivors = survivors[:math.ceil(len(survivors) / 2)]
+
+        for key in option_score:
+            option_score[key] = float("inf")
+        for card in survivors:
+            option_score[card] = totals[card] / counts[card]
+        used = sum(counts.values())
+        self.search_stats = {"rollouts": used, "rollouts saved": self.trials * len(play_options) - used,
+                             "means": {key: totals[key] / counts[key] for key in totals}, "counts": counts}
+
+    def parallel_evaluate(self, virtual_round, ai_index, play_options, option_score):
+        """Splits the trials for every play option into chunks, runs them on the shared rollout pool and merges the
+        results into option_score. Each chunk is seeded from the random module so runs are reproducible. Tasks carry
+        only the round state pickled once by rollout_state(), the seat, the card index, the chunk size and the seed"""
+        pool = rollout_pool(self.workers)
+        chunks = min(self.workers, self.trials)
+        chunk_sizes = [self.trials // chunks + (1 if i < self.trials % chunks else 0) for i in range(chunks)]
+        state = rollout_state(virtual_round)
+        futures = []
         for card in play_options:
-            print(card)
-            print(self.trials)
+            for size in chunk_sizes:
+                futures.append((card, pool.submit(run_rollout_chunk, state, ai_index, card.index, size,
+                                                  random.getrandbits(64))))
+        for card, future in futures:
+            option_score[card] += future.result()
+
+    def batch_evaluate(self, virtual_round, ai_index, play_options, option_score):
+        """Scores every play option with one vectorized BatchRollout call over self.trials determinizations, which
+        are dealt together by a Determinizer and shared by all the options. Both draw from a generator seeded from
+        the random module for each decision, so seeding random makes the decision repeatable"""
+        if self.batch_rollout is None:
+            self.batch_rollout = BatchRollout()
+            self.determinizer = Determinizer()
+        self.batch_rollout.rng = self.determinizer.rng = numpy.random.default_rng(random.getrandbits(64))
+        owners = self.determinizer.deal(virtual_round, ai_index, self.trials)
+        scores = numpy.array([player.score for player in virtual_round.players])
+        others = [(ai_index + i) % 4 for i in range(1, 4)]
+
+        ai_player = virtual_round.players[ai_index]
+        for card in play_options:
+            virtual_round.apply_play(ai_player, card)
+            card_owners = owners.copy()
+            card_owners[:, card.index] = -1
+            points = self.batch_rollout.run(virtual_round, card_owners)
+            totals = points + scores
+            option_score[card] += int((points[:, ai_index] - totals[:, others].min(1)).sum())
+            virtual_round.undo_play()
+
+    def solve_evaluate(self, virtual_round, ai_index, play_options, option_score):
+        """Adds up the exact scores of every play option over self.trials determinizations, each solved double
+        dummy by the player's EndgameSolver. With a time_limit, solving stops at the deadline and only the
+        determinizations solved by then count; if none was, every option gets one rollout instead"""
+        if self.endgame_solver is None:
+            self.endgame_solver = EndgameSolver()
+        solver = self.endgame_solver
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        nodes = solver.nodes
+        solved = 0
+        try:
             for n in range(self.trials):
+                self.deal_unseen(virtual_round, ai_index)
+                scores = solver.solve(virtual_round, ai_index, play_options, deadline)
+                for card, score in zip(play_options, scores):
+                    option_score[card] += score
+                solved += 1
+        except SearchTimeout:
+            if not solved:
+                for card in play_options:
+                    option_score[card] += self.rollout_score(virtual_round, ai_index, card, 1)
+        self.search_stats = {"determinizations": solved, "nodes": solver.nodes - nodes,
+                             "table entries": len(solver.table), "elapsed": time.perf_counter() - start}
+
+    def deal_unseen(self, virtual_round, ai_index):
+        """Deals the cards the AI cannot see to its virtual opponents, uniformly over the deals consistent with its
+        knowledge. The DealSampler is kept while the knowledge and hand sizes it was built from stay the same"""
+        ai_player = virtual_round.players[ai_index]
+        opponents = [virtual_round.players[(ai_index + i) % 4] for i in range(1, 4)]
+        signature = DealSampler.signature(ai_player.knowledge, [len(player.hand.contents) for player in opponents])
+        if self.deal_sampler is None or self.deal_sampler.key != signature:
+            self.deal_sampler = DealSampler(ai_player.knowledge, signature[-1])
+        for player, cards in zip(opponents, self.deal_sampler.sample()):
+            player.hand.set_cards(cards)
+        virtual_round.zobrist = virtual_round.position_hash()
+
+    def determinize(self, virtual_round, ai_index):
+        """Deals a determinization with deal_unseen, then rebuilds the virtual opponents' knowledge from their new
+        hands and the round's public record in one pass"""
+        self.deal_unseen(virtual_round, ai_index)
+        virtual_round.rebuild_knowledge([(ai_index + i) % 4 for i in range(1, 4)])
+
+
+class ISMCTSNode(object):
+    """A node of an information set search tree, reached by one seat playing one card"""
+
+    __slots__ = ("card", "seat", "parent", "children", "visits", "availability", "total")
+
+    def __init__(self, card=None, seat=None, parent=None):
+        self.card = card
+        self.seat = seat
+        self.parent = parent
+        self.children = {}
+        self.visits = 0
+        self.availability = 0
+        self.total = 0.0
+
+    def ucb(self, exploration):
+        """Upper confidence bound of the node, counting the times it was available rather than its parent's visits"""
+        return self.total / self.visits + exploration * math.sqrt(math.log(self.availability) / self.visits)
+
+
+class ISMCTSPlayer(AIplayer):
+    """An AI player using single-observer information set Monte Carlo tree search. Every iteration deals a fresh
+    determinization from the player's knowledge, but all of them share one tree, and the subtree reached by the
+    plays since the last decision is kept for the next one"""
+
+    def __init__(self, name, hand, iterations, time_limit=None, exploration=0.3):
+        """Initiates a player that searches for at most iterations iterations and, if given, time_limit seconds per
+        play"""
+        AIplayer.__init__(self, name, hand, iterations)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.tree_round = None
+        self.tree_depth = 0
+        self.tree_root = None
+
+    def search_root(self, hround):
+        """Returns the tree node for the current position, reusing the last search's subtree when the plays made
+        since then are in it"""
+        history = hround.play_history()
+        node = None
+        if self.tree_round is hround and len(history) >= self.tree_depth:
+            node = self.tree_root
+            for player, card in history[self.tree_depth:]:
+                node = node.children.get(card.index)
+                if node is None:
+                    break
+        if node is None:
+            node = ISMCTSNode()
+        node.parent = None
+        self.tree_round = hround
+        self.tree_depth = len(history)
+        self.tree_root = node
+        return node
 
-                virtual_round.trick.append(card)
-                ai_player.hand.remove_card(card)
-                virtual_round.played_all.append(card)
-                virtual_round.played_players[ai_player.name].append(card)
-                virtual_round.play_trick()
-                virtual_round.play_round()
-
-                print(virtual_round.players)
-                print(ai_player)
-
-                other_players = virtual_round.players[:]
-                other_players.remove(virtual_round.players[ai_index])
-                other_player_scores = [other_players[0].score, other_players[1].score, other_players[2].score]
-                option_score[str(card)] += virtual_round.round_score[ai_player.name] - min(other_player_scores)
-
-                virtual_round = copy.deepcopy(hround)
-
-                lead_position = virtual_round.players.index(virtual_round.has_lead)
-                virtual_players = ["", "", "", ""]
-
-                ai_player = AIplayer(virtual_round.players[ai_index].name,
-                                       virtual_round.players[ai_index].hand, self.trials)
-                ai_player.won_cards = virtual_round.players[ai_index].won_cards[:]
-                ai_player.score = virtual_round.players[ai_index].score
-                ai_player.knowledge = virtual_round.players[ai_index].knowledge
-
-                left_player = Player(virtual_round.players[(ai_index + 1) % 4].name,
-                                       virtual_round.players[(ai_index + 1) % 4].hand, "random")
-                left_player.won_cards = virtual_round.players[(ai_index + 1) % 4].won_cards[:]
-                left_player.score = virtual_round.players[(ai_index + 1) % 4].score
-                left_player.knowledge = virtual_round.players[(ai_index + 1) % 4].knowledge
-
-                across_player = Player(virtual_round.players[(ai_index + 2) % 4].name,
-                                         virtual_round.players[(ai_index + 2) % 4].hand, "random")
-                across_player.won_cards = virtual_round.players[(ai_index + 2) % 4].won_cards[:]
-                across_player.score = virtual_round.players[(ai_index + 2) % 4].score
-                across_player.knowledge = virtual_round.players[(ai_index + 2) % 4].knowledge
-
-                right_player = Player(virtual_round.players[(ai_index + 3) % 4].name,
-                                        virtual_round.players[(ai_index + 3) % 4].hand, "random")
-                right_player.won_cards = virtual_round.players[(ai_index + 3) % 4].won_cards[:]
-                right_player.score = virtual_round.players[(ai_index + 3) % 4].score
-                right_player.knowledge = virtual_round.players[(ai_index + 3) % 4].knowledge
-
-        winning_play_string = min(option_score.keys(), key=(lambda key: option_score[key]))
-
-        card_value = ""
-        card_suit = ""
-        for value in self.hand.value_items:
-            if value in winning_play_string:
-                card_value = value
-        for suit in self.hand.suits:
-            if suit in winning_play_string:
-                card_suit = suit
-
-        card_choice = Card(card_value, card_suit)
-
-        return card_choice
-
-
-
-Bob1 = AIplayer("Bob1", [], 1)
-Bob2 = Player("Bob2", [], "random")
-Bob3 = Player("Bob3", [], "random")
-Bob4 = Player("Bob4", [], "random")
-
-round1 = HeartsRound(Bob1, Bob2, Bob3, Bob4, "left")
+    def choose_play(self, hround):
+        """Picks a card to play by information set Monte Carlo tree search"""
+        play_options = self.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        if len(play_options) == 1:
+            return play_options[0]
+
+        root = self.search_root(hround)
+        reused_visits = root.visits
+        ai_index = hround.players.index(self)
+        virtual_round = hround.clone("random")
+        start = time.perf_counter()
+        deadline = None if self.time_limit is None else start + self.time_limit
+
+        iterations = 0
+        while iterations < self.iterations and (deadline is None or time.perf_counter() < deadline):
+            self.deal_unseen(virtual_round, ai_index)
+            self.iterate(virtual_round, root)
+            root.visits += 1
+            iterations += 1
+
+        best = max(play_options, key=lambda c: root.children[c.index].visits if c.index in root.children else -1)
+        self.search_stats = {"iterations": iterations, "reused visits": reused_visits,
+                             "elapsed": time.perf_counter() - start}
+        return best
+
+    def iterate(self, virtual_round, root):
+        """Runs one select/expand/simulate/backpropagate pass on a determinized round, leaving the round as found"""
+        node = root
+        path = []
+        while virtual_round.trick_num < 13:
+            player = virtual_round.next_player()
+            legal_moves = player.hand.legal_moves(virtual_round.trick, virtual_round.trick_num,
+                                                  virtual_round.hearts_broken)
+            untried = []
+            available = []
+            for card in legal_moves:
+                child = node.children.get(card.index)
+                if child is None:
+                    untried.append(card)
+                else:
+                    child.availability += 1
+                    available.append(child)
+            if untried:
+                card = random.choice(untried)
+                child = ISMCTSNode(card, virtual_round.players.index(player), node)
+                node.children[card.index] = child
+                node = child
+                virtual_round.apply_play(player, card)
+                path.append(node)
+                break
+            node = max(available, key=lambda c: c.ucb(self.exploration))
+            virtual_round.apply_play(player, node.card)
+            path.append(node)
+
+        plays = len(path) + virtual_round.play_out()
+        points = virtual_round.round_points()
+        for node in path:
+            node.visits += 1
+            node.total += 1 - points[node.seat] / 26
+        for i in range(plays):
+            virtual_round.undo_play()
+
+
+def play_game(players, seed):
+    """Plays one silent game of Hearts between four players, seeding the random module with seed first, and returns
+    its result"""
+    random.seed(seed)
+    game = Hearts(*players)
+    game.play_hearts(None)
+    return {"scores": dict(game.game_score), "winner": game.victor, "rounds": game.round_num,
+            "moonshots": dict(game.moonshots), "queens": dict(game.queens)}
+
+
+def play_games(players, first, seeds):
+    """Pool task: plays one game per seed and returns the results, numbered from first"""
+    results = []
+    for i, seed in enumerate(seeds):
+        result = play_game(players, seed)
+        result["game"] = first + i
+        results.append(result)
+    return results
+
+
+def simulate(players, games, seed=None, workers=1, chunk_size=16):
+    """Plays games silent games of Hearts between the four players and yields each game's result in game order, with
+    the elapsed time and the games per second so far. Every game gets its own seed drawn from seed, so a run can be
+    repeated. With more than one worker, chunks of chunk_size games are spread over the shared process pool, with a
+    few chunks per worker in flight at a time"""
+    master = random.Random(seed)
+    chunks = ((first, [master.getrandbits(64) for i in range(min(chunk_size, games - first))])
+              for first in range(0, games, chunk_size))
+    start = time.perf_counter()
+    played = 0
+    if workers > 1:
+        pool = rollout_pool(workers)
+        pending = collections.deque()
+        for first, seeds in chunks:
+            pending.append(pool.submit(play_games, players, first, seeds))
+            if len(pending) < 4 * workers:
+                continue
+            for result in pending.popleft().result():
+                played += 1
+                elapsed = time.perf_counter() - start
+                result["elapsed"] = elapsed
+                result["games per second"] = played / elapsed
+                yield result
+        batches = (future.result() for future in pending)
+    else:
+        batches = (play_games(players, first, seeds) for first, seeds in chunks)
+    for batch in batches:
+        for result in batch:
+            played += 1
+            elapsed = time.perf_counter() - start
+            result["elapsed"] = elapsed
+            result["games per second"] = played / elapsed
+            yield result
+
+
+def make_player(name, spec):
+    """Builds a player from a command line spec: "random", "ai:TRIALS" or "ismcts:ITERATIONS" """
+    kind, _, count = spec.partition(":")
+    if kind == "random":
+        return Player(name, [], "random")
+    if kind == "ai":
+        return AIplayer(name, [], int(count or 10))
+    if kind == "ismcts":
+        return ISMCTSPlayer(name, [], int(count or 200))
+    raise ValueError("Unknown player spec: %s" % spec)
+
+
+def demo():
+    """Deals a round between an AI player and three random players, passes and plays the first trick aloud"""
+    bob1 = AIplayer("Bob1", [], 1)
+    bob2 = Player("Bob2", [], "random")
+    bob3 = Player("Bob3", [], "random")
+    bob4 = Player("Bob4", [], "random")
+
+    round1 = HeartsRound(bob1, bob2, bob3, bob4, "left")
+
+    round1.start_passing_np()
+
+    round1.play_trick()
+
+
+def benchmark_startup(runs=5, workers=2):
+    """Times how long a fresh interpreter takes to import this module, as a spawned pool worker would, and how long
+    the rollout pool takes to come up with the given number of workers. Returns the median import time and the pool
+    start time in seconds"""
+    import statistics
+    import subprocess
+    directory = os.path.dirname(os.path.abspath(__file__))
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    code = "import time; start = time.perf_counter(); import %s; print(time.perf_counter() - start)" % module
+    times = []
+    for run in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True, text=True,
+                                check=True).stdout
+        times.append(float(output.split()[-1]))
+    start = time.perf_counter()
+    rollout_pool(workers)
+    return statistics.median(times), time.perf_counter() - start
+
+
+def main(argv=None):
+    """Command line entry point: simulates games between four players and reports the results and games per
+    second"""
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(description="Simulate games of Hearts without printing them.")
+    parser.add_argument("players", nargs="*", help='"random", "ai:TRIALS" or "ismcts:ITERATIONS" for each of the '
+                                                   'four seats; with none, a demo trick is played')
+    parser.add_argument("-n", "--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="seed for a repeatable run")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes to play games on")
+    parser.add_argument("--stream", action="store_true", help="print every game's result as a JSON line")
+    parser.add_argument("--report", type=int, default=1000, help="print progress every this many games")
+    parser.add_argument("--startup-benchmark", action="store_true",
+                        help="time importing the module and starting the worker pool, then exit")
+    args = parser.parse_args(argv)
+
+    if args.startup_benchmark:
+        import_time, pool_time = benchmark_startup(workers=max(args.workers, 2))
+        print("Import: %.1f ms, pool start: %.1f ms" % (import_time * 1000, pool_time * 1000))
+        return
+    if not args.players:
+        demo()
+        return
+    if len(args.players) != 4:
+        parser.error("give one player spec for each of the four seats")
+
+    players = [make_player("P%d" % (i + 1), spec) for i, spec in enumerate(args.players)]
+    wins = {player.name: 0 for player in players}
+    totals = {player.name: 0 for player in players}
+    result = None
+    for result in simulate(players, args.games, args.seed, args.workers):
+        wins[result["winner"]] += 1
+        for name, score in result["scores"].items():
+            totals[name] += score
+        if args.stream:
+            print(json.dumps(result))
+        if (result["game"] + 1) % args.report == 0:
+            print("%d games, %.1f games/s" % (result["game"] + 1, result["games per second"]), file=sys.stderr)
+    if result is None:
+        return
+    print("Games: %d in %.2f s (%.1f games/s)" % (args.games, result["elapsed"], result["games per second"]))
+    for player, spec in zip(players, args.players):
+        print("%s (%s): %d wins, %.2f average score" % (player.name, spec, wins[player.name],
+                                                         totals[player.name] / args.games))
 
-round1.start_passing_np()
 
-round1.play_trick()
 
 
 
@@ -5674,4 +2461,5 @@ round1.play_trick()
 # Round1.start_passing()
 
 
-
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GameKnowledgeSecond import CardSet, HeartsRound, Player  # noqa: E402
+
+
+def started_round(seed, plays, pass_dir="left"):
+    """Returns a round of random players after passing and the given number of random plays"""
+    random.seed(seed)
+    players = [Player("P%d" % i, [], "random") for i in range(4)]
+    hround = HeartsRound(*players, pass_dir)
+    hround.start_passing_np()
+    for n in range(plays):
+        player = hround.next_player()
+        hround.apply_play(player, random.choice(
+            player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)))
+    return hround
+
+
+def consistent_deals(knowledge, hand_sizes):
+    """Lists every deal of the unseen cards that fits the knowledge, by trying each seat for each card"""
+    unseen = list(CardSet(mask=knowledge.possible[0] | knowledge.possible[1] | knowledge.possible[2]))
+    deals = []
+    for seats in itertools.product(range(3), repeat=len(unseen)):
+        if all(seats.count(seat) == size for seat, size in enumerate(hand_sizes)) and \
+                all(knowledge.possible[seat] >> card.index & 1 for card, seat in zip(unseen, seats)):
+            deals.append(tuple(frozenset(card for card, seat in zip(unseen, seats) if seat == hand)
+                               for hand in range(3)))
+    return deals
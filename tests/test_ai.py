@@ -0,0 +1,129 @@
+import random
+import time
+
+import pytest
+
+from GameKnowledgeSecond import AIplayer, Card, HeartsRound, ISMCTSPlayer, Player
+
+
+def play_round_with(ai_player, seed):
+    """Plays one round of ai_player against three random players and returns the round"""
+    random.seed(seed)
+    players = [ai_player] + [Player("P%d" % i, [], "random") for i in range(1, 4)]
+    hround = HeartsRound(*players, "none")
+    hround.play_round_np()
+    return hround
+
+
+@pytest.mark.parametrize("options", [
+    {"vectorized": True, "workers": 2},
+    {"time_limit": 0.1, "workers": 2},
+    {"time_limit": 0.1, "allocation": "halving"},
+    {"vectorized": True, "allocation": "halving"},
+])
+def test_conflicting_evaluation_modes_are_rejected(options):
+    with pytest.raises(ValueError):
+        AIplayer("A", [], 4, **options)
+
+
+def test_unknown_allocation_is_rejected():
+    with pytest.raises(ValueError):
+        AIplayer("A", [], 4, allocation="ucb")
+
+
+def test_endgame_solving_keeps_to_the_time_limit():
+    ai_player = AIplayer("A", [], 50, time_limit=0.05, endgame_trick=6)
+    latencies = []
+    choose_play = ai_player.choose_play
+
+    def timed_choose_play(hround):
+        start = time.perf_counter()
+        card = choose_play(hround)
+        latencies.append(time.perf_counter() - start)
+        return card
+
+    ai_player.choose_play = timed_choose_play
+    for seed in (40, 44):
+        assert play_round_with(ai_player, seed).trick_num == 13
+    assert len(latencies) > 20 and max(latencies) < 0.2
+
+
+def test_timed_search_runs_at_least_one_rollout_per_option():
+    ai_player = AIplayer("A", [], 4, time_limit=0.01)
+    hround = play_round_with(ai_player, 41)
+    assert hround.trick_num == 13
+    assert ai_player.search_stats["rollouts"] >= 2
+
+
+def test_queen_of_spades_is_weighed_against_its_touching_cards():
+    queen = Card("queen", "spades")
+    ai_player = AIplayer("A", [], 2)
+    weighed = []
+    evaluated = []
+    choose_play = ai_player.choose_play
+    rollout_score = ai_player.rollout_score
+
+    def recording_rollout_score(virtual_round, ai_index, card, trials):
+        evaluated.append(card)
+        return rollout_score(virtual_round, ai_index, card, trials)
+
+    def recording_choose_play(hround):
+        legal = hround.players[0].hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        del evaluated[:]
+        card = choose_play(hround)
+        if queen in legal and len(legal) > 1 and hround.equivalent_moves(ai_player):
+            assert evaluated == [cards[0] for cards in hround.move_classes(ai_player, legal)]
+            assert queen in evaluated and len(evaluated) > 1
+            weighed.append(card)
+        return card
+
+    ai_player.rollout_score = recording_rollout_score
+    ai_player.choose_play = recording_choose_play
+    for seed in (25, 37, 54):
+        assert play_round_with(ai_player, seed).trick_num == 13
+    assert len(weighed) == 3
+
+
+def test_successive_halving_saves_rollouts():
+    ai_player = AIplayer("A", [], 16, allocation="halving")
+    saved = []
+    choose_play = ai_player.choose_play
+
+    def recording_choose_play(hround):
+        ai_player.search_stats = {}
+        legal = hround.players[0].hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        card = choose_play(hround)
+        if "rollouts saved" in ai_player.search_stats:
+            stats = ai_player.search_stats
+            assert list(stats["counts"]) == [cards[0] for cards in hround.move_classes(ai_player, legal)]
+            saved.append(stats["rollouts saved"])
+            assert max(stats["counts"].values()) == 16
+            assert stats["counts"][card] == 16
+            assert stats["means"][card] == min(stats["means"][option] for option in stats["counts"]
+                                               if stats["counts"][option] == 16)
+            assert stats["rollouts"] + stats["rollouts saved"] == 16 * len(stats["counts"])
+        return card
+
+    ai_player.choose_play = recording_choose_play
+    assert play_round_with(ai_player, 42).trick_num == 13
+    assert saved and all(rollouts > 0 for rollouts in saved)
+
+
+def test_ismcts_player_plays_legal_cards_and_reuses_its_tree():
+    ai_player = ISMCTSPlayer("A", [], 60)
+    reused = []
+    choose_play = ai_player.choose_play
+
+    def recording_choose_play(hround):
+        legal = hround.players[0].hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        card = choose_play(hround)
+        assert card in legal
+        if len(legal) > 1:
+            assert ai_player.search_stats["iterations"] == 60
+            reused.append(ai_player.search_stats["reused visits"])
+        return card
+
+    ai_player.choose_play = recording_choose_play
+    assert play_round_with(ai_player, 43).trick_num == 13
+    assert any(visits > 0 for visits in reused[1:])
+    assert all(child.parent is ai_player.tree_root for child in ai_player.tree_root.children.values())
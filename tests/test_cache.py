@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from GameKnowledgeSecond import AIplayer, HeartsRound, Player, RolloutCache
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = RolloutCache(max_entries=2)
+    cache.add("a", 3)
+    cache.add("b", 5)
+    assert cache.get("a", 1) == [3, 1]
+    cache.add("c", 7)
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.evictions == 1 and len(cache) == 2
+
+
+def test_entries_are_evicted_to_stay_under_the_memory_cap():
+    key = (1, (2, 3), "card")
+    size = RolloutCache.entry_size(key, [0, 0])
+    cache = RolloutCache(max_bytes=size * 3 // 2)
+    cache.add(key, 1)
+    assert cache.bytes == size
+    cache.add((4, (5, 6), "card"), 1)
+    assert len(cache) == 1 and key not in cache.entries
+    assert cache.bytes <= cache.max_bytes and cache.evictions == 1
+
+
+def test_counters_track_hits_and_misses():
+    cache = RolloutCache()
+    assert cache.get("a", 1) is None
+    cache.add("a", 6, 2)
+    assert cache.get("a", 3) is None
+    assert cache.rollouts("a") == 2
+    assert cache.get("a", 2) == [6, 2]
+    assert cache.stats() == {"entries": 1, "bytes": cache.bytes, "hits": 1, "misses": 2, "evictions": 0,
+                             "hit rate": 1 / 3}
+
+
+def ai_decision(seed, ai_player):
+    """Returns a round in which ai_player is to play with a choice of more than one class of moves"""
+    random.seed(seed)
+    hround = HeartsRound(ai_player, *[Player("P%d" % i, [], "random") for i in range(1, 4)], "left")
+    hround.start_passing_np()
+    while True:
+        player = hround.next_player()
+        legal = player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        if player is ai_player and len(hround.move_classes(player, legal)) > 1:
+            return hround
+        hround.apply_play(player, random.choice(legal))
+
+
+def test_a_repeated_decision_reuses_the_cached_rollouts():
+    cache = RolloutCache()
+    ai_player = AIplayer("A", [], 4, cache=cache)
+    hround = ai_decision(5, ai_player)
+    rollouts = []
+    rollout_score = ai_player.rollout_score
+
+    def counting_rollout_score(virtual_round, ai_index, card, trials):
+        rollouts.append(trials)
+        return rollout_score(virtual_round, ai_index, card, trials)
+
+    ai_player.rollout_score = counting_rollout_score
+    first = ai_player.choose_play(hround)
+    options = len(rollouts)
+    assert cache.misses == options and cache.hits == 0 and len(cache) == options
+    assert ai_player.choose_play(hround) is first
+    assert len(rollouts) == options and cache.hits == options
+
+    ai_player.trials = 6
+    ai_player.choose_play(hround)
+    assert rollouts[options:] == [2] * options
+    assert all(stats[1] == 6 for stats in cache.entries.values())
+
+    hround.players[1].score += 10
+    ai_player.choose_play(hround)
+    assert len(cache) == 2 * options
+
+
+@pytest.mark.parametrize("options", [{"vectorized": True}, {"workers": 2}, {"time_limit": 0.1},
+                                     {"allocation": "halving"}])
+def test_the_cache_only_serves_uniform_rollouts(options):
+    with pytest.raises(ValueError):
+        AIplayer("A", [], 4, cache=RolloutCache(), **options)
@@ -0,0 +1,95 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from GameKnowledgeSecond import AIplayer, Card, CardSet, Deck, HeartsRound, Player, cards_by_index
+
+
+def test_card_indexes_follow_sorted_deck_order():
+    assert [card.index for card in cards_by_index] == list(range(52))
+    assert Card("2", "spades").index == 0
+    assert Card("queen", "spades").index == 10
+    assert Card("2", "clubs").index == 39
+    assert Card("ace", "clubs").index == 51
+    assert all(Card.from_index(card.index) == card for card in cards_by_index)
+
+
+def test_card_set_matches_a_python_set():
+    rng = random.Random(1)
+    for trial in range(200):
+        cards = rng.sample(cards_by_index, rng.randrange(53))
+        other = rng.sample(cards_by_index, rng.randrange(53))
+        card_set = CardSet(cards)
+        assert len(card_set) == len(cards)
+        assert list(card_set) == sorted(cards, key=Card.sort_key)
+        assert all(card in card_set for card in cards)
+        assert set(card_set | CardSet(other)) == set(cards) | set(other)
+        assert set(card_set & CardSet(other)) == set(cards) & set(other)
+        assert set(card_set - CardSet(other)) == set(cards) - set(other)
+        assert set(card_set.complement()) == set(cards_by_index) - set(cards)
+        assert set(card_set.select_suit("hearts")) == {card for card in cards if card.suit == "hearts"}
+
+
+def test_card_set_add_remove_and_discard():
+    card_set = CardSet()
+    queen = Card("queen", "spades")
+    assert not card_set
+    card_set.add(queen)
+    assert queen in card_set and len(card_set) == 1
+    copy = card_set.copy()
+    card_set.remove(queen)
+    assert queen not in card_set and queen in copy
+    with pytest.raises(KeyError):
+        card_set.remove(queen)
+    card_set.discard(queen)
+    assert card_set == CardSet()
+
+
+def test_played_cards_are_tracked_as_a_card_set():
+    random.seed(2)
+    players = [Player("P%d" % i, [], "random") for i in range(4)]
+    hround = HeartsRound(*players, "none")
+    hround.play_round_np()
+    assert hround.played_all == CardSet(mask=CardSet.full)
+    assert Deck().cards == CardSet(cards_by_index)
+
+
+def test_ai_player_completes_a_round():
+    random.seed(3)
+    players = [AIplayer("A", [], 2)] + [Player("P%d" % i, [], "random") for i in range(1, 4)]
+    hround = HeartsRound(*players, "left")
+    hround.play_round_np()
+    assert hround.trick_num == 13
+    assert sum(hround.round_score.values()) in (26, 78)
+
+
+def test_cards_are_interned_immutable_singletons():
+    queen = Card("queen", "spades")
+    assert queen is cards_by_index[10] is Card.from_index(10)
+    assert hash(queen) == 10
+    assert copy.copy(queen) is queen and copy.deepcopy([queen])[0] is queen
+    assert pickle.loads(pickle.dumps(queen)) is queen
+    with pytest.raises(AttributeError):
+        queen.value = "king"
+    assert {Card(card.value, card.suit) for card in cards_by_index} == set(cards_by_index)
+
+
+def test_an_invalid_card_raises_value_error_without_printing(capsys):
+    with pytest.raises(ValueError):
+        Card("11", "spades")
+    with pytest.raises(ValueError):
+        Card("2", "stars")
+    assert capsys.readouterr().out == ""
+
+
+def test_rank_tables_match_brute_force():
+    for card in cards_by_index:
+        below = [other for other in cards_by_index if other.suit == card.suit and
+                 Card.values[other.value] < Card.values[card.value]]
+        above = [other for other in cards_by_index if other.suit == card.suit and
+                 Card.values[other.value] > Card.values[card.value]]
+        assert list(Card.below[card.index]) == below and list(Card.above[card.index]) == above
+        assert Card.below_masks[card.index] == CardSet(below).mask
+        assert Card.above_masks[card.index] == CardSet(above).mask
@@ -0,0 +1,40 @@
+import random
+
+from GameKnowledgeSecond import Card, Deck, cards_by_index
+
+
+def test_shuffle_is_in_place_and_keeps_the_cards():
+    deck = Deck()
+    order = deck.order
+    deck.shuffle(random.Random(4))
+    assert deck.order is order
+    assert sorted(deck.order, key=Card.sort_key) == cards_by_index
+    assert deck.order != cards_by_index
+
+
+def test_shuffle_is_reproducible_with_a_seeded_rng():
+    first = Deck()
+    second = Deck()
+    first.shuffle(random.Random(5))
+    second.shuffle(random.Random(5))
+    assert first.order == second.order
+
+
+def test_reset_restores_sorted_order():
+    deck = Deck()
+    deck.shuffle(random.Random(6))
+    deck.reset()
+    assert deck.order == cards_by_index
+    assert deck.contents == cards_by_index
+
+
+def test_sort_deck_and_arrange_contents_use_the_ordering_table():
+    deck = Deck()
+    deck.shuffle(random.Random(7))
+    shuffled = deck.order[:]
+    deck.arrange_contents()
+    assert deck.contents == cards_by_index
+    assert deck.order == shuffled
+    deck.sort_deck()
+    assert deck.order == cards_by_index
+    assert sorted(cards_by_index, key=Card.sort_key) == cards_by_index
@@ -0,0 +1,47 @@
+import collections
+
+import pytest
+
+from conftest import consistent_deals, started_round
+
+numpy = pytest.importorskip("numpy")
+
+from GameKnowledgeSecond import Determinizer, cards_by_index  # noqa: E402
+
+
+def test_determinizations_fit_the_knowledge_and_hand_sizes():
+    for seed in range(8):
+        hround = started_round(seed, 5 * seed, ["left", "right", "across", "none"][seed % 4])
+        player = hround.next_player()
+        ai_index = hround.players.index(player)
+        owners = Determinizer(seed).deal(hround, ai_index, 300)
+        assert owners.shape == (300, 52)
+        for seat, other in enumerate(hround.players):
+            assert ((owners == seat).sum(1) == len(other.hand.contents)).all()
+        assert (owners[:, [card.index for card in player.hand.contents]] == ai_index).all()
+        assert (owners[:, [card.index for card in hround.played_all]] == -1).all()
+        for relative, possible in enumerate(player.knowledge.possible, 1):
+            allowed = numpy.array([possible >> index & 1 == 1 for index in range(52)])
+            assert not ((owners == (ai_index + relative) % 4) & ~allowed).any()
+
+
+def test_determinizations_are_uniform_over_consistent_deals():
+    hround = started_round(9, 44)
+    player = hround.next_player()
+    ai_index = hround.players.index(player)
+    seats = [(ai_index + i) % 4 for i in range(1, 4)]
+    deals = consistent_deals(player.knowledge, [len(hround.players[seat].hand.contents) for seat in seats])
+    owners = Determinizer(4).deal(hround, ai_index, 200 * len(deals))
+    counts = collections.Counter(tuple(frozenset(cards_by_index[index] for index in numpy.flatnonzero(row == seat))
+                                       for seat in seats) for row in owners)
+    assert set(counts) == set(deals)
+    assert max(abs(count - 200) for count in counts.values()) < 5 * 200 ** 0.5
+
+
+def test_determinizations_are_reproducible_with_a_seed():
+    hround = started_round(10, 7)
+    ai_index = hround.players.index(hround.next_player())
+    first = Determinizer(5).stream(hround, ai_index, 40)
+    second = Determinizer(5).stream(hround, ai_index, 40)
+    for batch in range(3):
+        assert (next(first) == next(second)).all()
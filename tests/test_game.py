@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from GameKnowledgeSecond import AIplayer, Hearts, HeartsRound, Player, simulate
+
+
+def random_players():
+    """Returns four fresh random players"""
+    return [Player("P%d" % i, [], "random") for i in range(4)]
+
+
+def test_played_game_reports_every_trick_and_score_to_the_sink(capsys):
+    random.seed(14)
+    game = Hearts(*random_players())
+    events = []
+    game.play_hearts(lambda event, *details: events.append((event,) + details))
+    assert capsys.readouterr().out == ""
+    kinds = [event[0] for event in events]
+    assert kinds.count("score") == game.round_num
+    assert kinds.count("trick") == kinds.count("win") == 13 * game.round_num
+    assert kinds.count("play") == 52 * game.round_num
+    assert kinds[:kinds.index("score") + 1] == (["play"] * 4 + ["trick", "win"]) * 13 + ["score"]
+    assert all(sum(event[1].values()) in (26, 78) for event in events if event[0] == "score")
+
+
+def test_round_score_goes_to_the_sink():
+    random.seed(15)
+    hround = HeartsRound(*random_players(), "right")
+    events = []
+    hround.score_round(lambda event, *details: events.append((event,) + details))
+    hround.play_round(lambda event, *details: events.append((event,) + details))
+    assert events[0] == ("notice", "Round is not complete")
+    assert events[-1] == ("score", hround.round_score)
+
+
+def test_silent_and_reported_games_play_the_same_game():
+    scores = []
+    for sink in (None, lambda event, *details: None):
+        random.seed(16)
+        game = Hearts(*random_players())
+        game.play_hearts(sink)
+        scores.append(game.game_score)
+    assert scores[0] == scores[1]
+
+
+def test_simulate_is_reproducible_across_workers():
+    runs = []
+    for workers in (1, 1, 2):
+        results = list(simulate(random_players(), 5, seed=17, workers=workers, chunk_size=2))
+        for result in results:
+            assert result.pop("elapsed") > 0 and result.pop("games per second") > 0
+        runs.append(results)
+    assert [result["game"] for result in runs[0]] == list(range(5))
+    assert runs[0] == runs[1] == runs[2]
+
+
+def test_simulate_repeats_games_of_vectorized_players():
+    pytest.importorskip("numpy")
+    runs = []
+    for workers in (1, 1, 2):
+        players = [AIplayer("A", [], 4, vectorized=True)] + random_players()[1:]
+        results = list(simulate(players, 2, seed=7, workers=workers, chunk_size=1))
+        runs.append([result["scores"] for result in results])
+    assert runs[0] == runs[1] == runs[2]
@@ -0,0 +1,136 @@
+import random
+
+from conftest import started_round
+
+from GameKnowledgeSecond import Card, CardSet, Deck, Hand, cards_by_index
+
+
+def check_buckets(hand):
+    """Asserts that the hand's per-suit buckets and suit queries agree with its cards"""
+    assert hand.contents == sorted(hand.order, key=Card.sort_key)
+    assert hand.cards == CardSet(hand.order)
+    for suit in Card.suits:
+        cards = [card for card in hand.contents if card.suit == suit]
+        assert hand.by_suit[suit] == cards
+        assert hand.select_suit(suit) is hand.by_suit[suit]
+        assert hand.has_suit(suit) == bool(cards) and hand.count_suit(suit) == len(cards)
+        assert hand.select_anti_suit(suit) == [card for card in hand.contents if card.suit != suit]
+    assert hand.select_no_points() == [card for card in hand.contents if card.suit != "hearts" and card.index != 10]
+    if hand.order:
+        assert hand.one_suit() == (len({card.suit for card in hand.order}) == 1)
+
+
+def dealt_hand(seed, size=13):
+    """Returns a hand dealt from a deck shuffled with seed"""
+    deck = Deck()
+    deck.shuffle(random.Random(seed))
+    return Hand(deck, size)
+
+
+def test_buckets_follow_added_and_removed_cards():
+    rng = random.Random(1)
+    for seed in range(10):
+        hand = dealt_hand(seed)
+        outside = [card for card in Deck().order if card not in hand]
+        check_buckets(hand)
+        for step in range(40):
+            if hand.order and (not outside or rng.random() < 0.5):
+                card = rng.choice(hand.order)
+                order = hand.order[:]
+                position = hand.remove_card(card)
+                assert order[position] is card and card not in hand
+                outside.append(card)
+            else:
+                card = outside.pop(rng.randrange(len(outside)))
+                hand.add_card(card, rng.randrange(len(hand.order) + 1) if rng.random() < 0.5 else None)
+                assert card in hand
+            check_buckets(hand)
+
+
+def test_hand_copies_keep_their_own_buckets():
+    hand = dealt_hand(2)
+    copy = hand.copy()
+    card = hand.by_suit["clubs"][0] if hand.by_suit["clubs"] else hand.contents[0]
+    hand.remove_card(card)
+    check_buckets(hand)
+    check_buckets(copy)
+    assert card in copy and card in copy.select_suit(card.suit)
+    copy.set_cards(hand.order[:5])
+    check_buckets(copy)
+    assert copy.contents == sorted(hand.order[:5], key=Card.sort_key)
+
+
+def test_buckets_survive_undo_and_restore():
+    for seed in range(10):
+        hround = started_round(seed, 3 * seed)
+        state = hround.snapshot()
+        plays = hround.play_out()
+        for player in hround.players:
+            check_buckets(player.hand)
+        for n in range(plays // 2):
+            hround.undo_play()
+        for player in hround.players:
+            check_buckets(player.hand)
+        hround.restore(state)
+        for player in hround.players:
+            check_buckets(player.hand)
+
+
+def reference_legal_cards(cards, lead_suit, first_trick, hearts_broken):
+    """Lists the legal plays from cards by the rules, given the suit led ("" when leading)"""
+    if first_trick and lead_suit == "":
+        return [card for card in cards if card.index == 39]
+    following = [card for card in cards if card.suit == lead_suit]
+    if following:
+        return following
+    if first_trick:
+        no_points = [card for card in cards if card.suit != "hearts" and card.index != 10]
+        return no_points or cards
+    if lead_suit == "" and not hearts_broken:
+        return [card for card in cards if card.suit != "hearts"] or cards
+    return cards
+
+
+def test_legal_mask_matches_the_rules():
+    rng = random.Random(3)
+    for trial in range(2000):
+        hand = dealt_hand(trial, rng.randint(1, 13))
+        lead_suit = rng.choice(Card.suits + [""])
+        first_trick = rng.random() < 0.3
+        if first_trick and lead_suit:
+            lead_suit = "clubs"
+        hearts_broken = rng.random() < 0.5
+        expected = reference_legal_cards(hand.contents, lead_suit, first_trick, hearts_broken)
+        for repeat in range(2):
+            assert hand.legal_mask(lead_suit, first_trick, hearts_broken) == CardSet(expected).mask
+            assert hand.legal_entry(lead_suit, first_trick, hearts_broken)[1] == tuple(expected)
+        trick = [cards_by_index[13 * Card.suit_indexes[lead_suit]]] if lead_suit else []
+        assert hand.legal_moves(trick, 0 if first_trick else 5, hearts_broken) == expected
+
+
+def test_memoized_legal_moves_stay_correct_through_undo():
+    for seed in range(10):
+        hround = started_round(seed, 0, ["left", "right", "across", "none"][seed % 4])
+        while hround.trick_num < 13:
+            player = hround.next_player()
+            expected = reference_legal_cards(player.hand.contents, hround.trick_suit, hround.trick_num == 0,
+                                             hround.hearts_broken)
+            assert player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken) == expected
+            plays = hround.play_out()
+            for n in range(plays):
+                hround.undo_play()
+            assert player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken) == expected
+            hround.apply_play(player, random.choice(expected))
+
+
+def test_legal_memo_is_shared_by_copies_and_bounded():
+    hand = dealt_hand(4)
+    hand.legal_memo_size = 3
+    copy = hand.copy()
+    assert copy.legal_memo is hand.legal_memo
+    for lead_suit in Card.suits:
+        for hearts_broken in (False, True):
+            hand.legal_mask(lead_suit, False, hearts_broken)
+            assert len(hand.legal_memo) <= 3
+    assert copy.legal_mask("hearts", False, True) == \
+        CardSet(reference_legal_cards(copy.contents, "hearts", False, True)).mask
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from conftest import started_round
+
+from GameKnowledgeSecond import AIplayer, Card, CardSet, HeartsRound, KnowledgeState
+
+
+def check_knowledge(hround):
+    """Asserts that every player's knowledge admits the true deal and that its dict view agrees with the masks"""
+    for seat, player in enumerate(hround.players):
+        knowledge = player.knowledge
+        others = [hround.players[(seat + offset) % 4] for offset in range(1, 4)]
+        out = 0
+        for possible, name, other in zip(knowledge.possible, KnowledgeState.seat_names, others):
+            held = other.hand.cards.mask
+            out |= held
+            assert held & ~possible == 0
+            assert CardSet(knowledge["held by " + name]).mask & ~held == 0
+            for suit in Card.suits:
+                if knowledge[name + " no " + suit]:
+                    assert not held & CardSet.suit_masks[suit]
+        assert knowledge.possible[0] | knowledge.possible[1] | knowledge.possible[2] == out
+        assert sorted((card for key in KnowledgeState.held_keys for card in knowledge[key]), key=Card.sort_key) == \
+            list(CardSet(mask=out))
+
+
+def test_true_hands_stay_possible_throughout_the_round():
+    for seed in range(20):
+        hround = started_round(seed, 0, ["left", "right", "across", "none"][seed % 4])
+        check_knowledge(hround)
+        while hround.trick_num < 13:
+            player = hround.next_player()
+            hround.apply_play(player, random.choice(
+                player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)))
+            check_knowledge(hround)
+
+
+def test_observe_infers_voids_and_only_points():
+    knowledge = KnowledgeState(CardSet.full)
+    knowledge.observe(1, Card("3", "hearts").index, CardSet.suit_masks["clubs"], 12)
+    assert knowledge["across no clubs"] and not knowledge["left no clubs"]
+    assert Card("3", "hearts") not in knowledge["held by any"]
+    assert knowledge["only points"] == ""
+    knowledge.observe(2, Card("4", "hearts").index, HeartsRound.non_points_mask, 12)
+    assert knowledge["only points"] == 2
+    assert knowledge["right no diamonds"] and not knowledge["right no hearts"]
+    assert CardSet(knowledge["held by right"]) == CardSet(mask=CardSet.suit_masks["hearts"] | 1 << 10) - \
+        CardSet([Card("3", "hearts"), Card("4", "hearts")])
+
+
+def test_observe_settles_a_hand_that_must_hold_its_possible_cards():
+    knowledge = KnowledgeState(CardSet.suit_masks["spades"])
+    knowledge.exclude(1, CardSet.suit_masks["spades"])
+    knowledge.exclude(2, CardSet(Card(value, "spades") for value in ["2", "3", "4"]).mask)
+    knowledge.observe(2, Card("5", "spades").index, 0, 9)
+    assert knowledge["held by left"] == [Card(value, "spades") for value in ["2", "3", "4"]]
+    assert len(knowledge["held by right"]) == 9 and knowledge["held by left or right"] == []
+
+
+def test_dict_view_is_read_only():
+    knowledge = KnowledgeState(CardSet.full)
+    with pytest.raises(TypeError):
+        knowledge["held by any"] = []
+    with pytest.raises(KeyError):
+        knowledge["held by nobody"]
+    assert list(knowledge) == KnowledgeState.key_order and len(knowledge) == 20
+
+
+def test_rebuilt_knowledge_contains_the_incremental_knowledge():
+    for seed in range(10):
+        hround = started_round(seed, 4 * seed + 1, ["left", "right", "across", "none"][seed % 4])
+        incremental = [player.knowledge.copy() for player in hround.players]
+        hround.rebuild_knowledge(range(4))
+        check_knowledge(hround)
+        for seat, player in enumerate(hround.players):
+            assert player.knowledge.only_points == incremental[seat].only_points
+            for offset, (rebuilt, known) in enumerate(zip(player.knowledge.possible, incremental[seat].possible), 1):
+                assert known & ~rebuilt == 0
+                assert rebuilt == CardSet.full & ~hround.played_all.mask & ~player.hand.cards.mask & \
+                    ~hround.ruled_out[(seat + offset) % 4]
+
+
+def test_determinized_opponents_get_sound_knowledge():
+    for seed in range(10):
+        hround = started_round(seed, 3 * seed + 2)
+        ai_index = hround.players.index(hround.next_player())
+        virtual_round = hround.clone("random")
+        AIplayer("A", None, 1).determinize(virtual_round, ai_index)
+        assert virtual_round.players[ai_index].hand.cards == hround.players[ai_index].hand.cards
+        check_knowledge(virtual_round)
@@ -0,0 +1,48 @@
+import pickle
+import random
+
+from conftest import started_round
+
+from GameKnowledgeSecond import AIplayer, HeartsRound, Player, rollout_state, run_rollout_chunk, worker_rollouts
+
+
+def virtual_round_at(seed, plays):
+    """Returns a started round cloned the way AIplayer.choose_play clones it"""
+    return started_round(seed, plays).clone("random")
+
+
+def test_worker_rollouts_match_serial_rollouts():
+    for seed in range(4):
+        virtual_round = virtual_round_at(seed, 5 + seed)
+        player = virtual_round.next_player()
+        ai_index = virtual_round.players.index(player)
+        card = player.hand.legal_moves(virtual_round.trick, virtual_round.trick_num, virtual_round.hearts_broken)[0]
+        state = rollout_state(virtual_round)
+        worker_rollouts.clear()
+        pooled = run_rollout_chunk(state, ai_index, card.index, 6, seed)
+        random.seed(seed)
+        serial = AIplayer("serial", None, 0).rollout_score(virtual_round, ai_index, card, 6)
+        assert pooled == serial
+
+
+def test_rollout_state_is_small_and_carries_no_player_objects():
+    virtual_round = virtual_round_at(7, 9)
+    state = rollout_state(virtual_round)
+    assert len(state) < 4000
+    names, pass_dir, snapshot = pickle.loads(state)
+    assert names == ["P0", "P1", "P2", "P3"]
+    rebuilt = HeartsRound(*[Player(name, None, "random") for name in names], pass_dir)
+    rebuilt.restore(snapshot)
+    assert rebuilt.snapshot() == virtual_round.snapshot()
+    assert rebuilt.zobrist == virtual_round.zobrist
+
+
+def test_parallel_evaluation_is_reproducible():
+    scores = []
+    for trial in range(2):
+        random.seed(8)
+        players = [AIplayer("A", [], 4, workers=2)] + [Player("P%d" % i, [], "random") for i in range(1, 4)]
+        hround = HeartsRound(*players, "none")
+        hround.play_round_np()
+        scores.append(hround.round_score)
+    assert scores[0] == scores[1]
@@ -0,0 +1,37 @@
+import pytest
+
+from conftest import started_round
+
+numpy = pytest.importorskip("numpy")
+
+from GameKnowledgeSecond import BatchRollout  # noqa: E402
+
+
+def owners_of(hround, count):
+    """Returns count rows giving the seat holding each card of the round, -1 for cards out of play"""
+    owners = numpy.full((count, 52), -1, dtype=numpy.int8)
+    for seat, player in enumerate(hround.players):
+        owners[:, [card.index for card in player.hand.contents]] = seat
+    return owners
+
+
+def test_batch_rollouts_hand_out_every_point():
+    for seed in range(5):
+        hround = started_round(seed, 4 * seed + 1)
+        points = BatchRollout(seed).run(hround, owners_of(hround, 200))
+        assert points.shape == (200, 4)
+        assert set(points.sum(1)) <= {26, 78}
+
+
+def test_batch_rollout_of_a_forced_ending_matches_serial_play():
+    hround = started_round(20, 48)
+    expected = hround.clone("random")
+    expected.play_out()
+    points = BatchRollout(1).run(hround, owners_of(hround, 10))
+    assert (points == numpy.array(expected.round_points())).all()
+
+
+def test_batch_rollouts_are_reproducible_with_a_seed():
+    hround = started_round(21, 6)
+    owners = owners_of(hround, 50)
+    assert (BatchRollout(3).run(hround, owners) == BatchRollout(3).run(hround, owners)).all()
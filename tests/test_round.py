@@ -0,0 +1,126 @@
+import random
+
+from conftest import started_round
+
+from GameKnowledgeSecond import Card, HeartsRound, Player, cards_by_index
+
+
+def test_clone_shares_no_mutable_state():
+    hround = started_round(10, 17)
+    before = hround.snapshot()
+    clone = hround.clone("random")
+    clone.play_out()
+    assert clone.trick_num == 13
+    assert hround.snapshot() == before
+    assert [player.name for player in clone.players] == [player.name for player in hround.players]
+    assert all(player.ai == "random" for player in clone.players)
+
+
+def test_restore_returns_to_the_snapshot_repeatedly():
+    hround = started_round(11, 9)
+    state = hround.snapshot()
+    zobrist = hround.zobrist
+    for trial in range(3):
+        hround.play_out()
+        hround.restore(state)
+        assert hround.snapshot() == state
+        assert hround.zobrist == zobrist
+
+
+def test_undo_play_restores_state_and_hash():
+    for seed in range(20):
+        hround = started_round(seed, seed % 13)
+        state = hround.snapshot()
+        zobrist = hround.zobrist
+        knowledge = [player.knowledge.state() for player in hround.players]
+        ruled_out = hround.ruled_out
+        plays = hround.play_out()
+        assert hround.trick_num == 13
+        for n in range(plays):
+            hround.undo_play()
+        assert hround.snapshot() == state
+        assert [player.knowledge.state() for player in hround.players] == knowledge
+        assert hround.ruled_out == ruled_out
+        assert hround.zobrist == zobrist == hround.position_hash()
+
+
+def test_play_trick_reports_every_play_to_the_sink():
+    random.seed(12)
+    players = [Player("P%d" % i, [], "random") for i in range(4)]
+    hround = HeartsRound(*players, "none")
+    hround.start_passing_np()
+    events = []
+    for trick in range(13):
+        hround.play_trick(lambda event, *details: events.append((event,) + details))
+    assert [event[0] for event in events] == (["play"] * 4 + ["trick", "win"]) * 13
+    plays = [event[2] for event in events if event[0] == "play"]
+    assert len(set(plays)) == 52
+    wins = [event for event in events if event[0] == "win"]
+    assert [event[2] for event in wins] == list(range(1, 14))
+
+
+def test_silent_and_reported_tricks_play_the_same_round():
+    rounds = []
+    for sink in (None, lambda event, *details: None):
+        random.seed(13)
+        players = [Player("P%d" % i, [], "random") for i in range(4)]
+        hround = HeartsRound(*players, "none")
+        hround.start_passing_np()
+        for trick in range(13):
+            hround.play_trick(sink)
+        rounds.append(hround.played_players)
+    assert rounds[0] == rounds[1]
+
+
+def test_undo_play_restores_each_intermediate_hash():
+    hround = started_round(30, 5)
+    hashes = [hround.zobrist]
+    while hround.trick_num < 13:
+        player = hround.next_player()
+        hround.apply_play(player, random.choice(
+            player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)))
+        hashes.append(hround.zobrist)
+    while len(hashes) > 1:
+        assert hround.zobrist == hashes.pop()
+        hround.undo_play()
+    assert hround.zobrist == hashes.pop()
+
+
+def test_incremental_hash_matches_a_fresh_hash_after_every_play():
+    for seed in range(10):
+        hround = started_round(seed, 0, ["left", "right", "across", "none"][seed % 4])
+        hashes = {hround.zobrist}
+        while hround.trick_num < 13:
+            player = hround.next_player()
+            hround.apply_play(player, random.choice(
+                player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)))
+            assert hround.zobrist == hround.position_hash()
+            hashes.add(hround.zobrist)
+        assert len(hashes) == 53
+
+
+def outstanding_cards(hround, player):
+    """Lists the cards other players may still play against player: unplayed cards outside their hand, plus the
+    current trick"""
+    return [card for card in cards_by_index if card not in hround.played_all and card not in player.hand.contents] + \
+        hround.trick
+
+
+def test_position_queries_match_card_by_card_checks():
+    for seed in range(20):
+        hround = started_round(seed, 0, ["left", "right", "across", "none"][seed % 4])
+        while hround.trick_num < 13:
+            player = hround.next_player()
+            legal = player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+            outstanding = outstanding_cards(hround, player)
+            low, high = legal[0], legal[-1]
+            assert hround.equivalent_moves(player) == (low.suit == high.suit and not any(
+                card.suit == low.suit and Card.values[low.value] < Card.values[card.value] < Card.values[high.value]
+                for card in outstanding))
+            assert hround.cant_effect_outcome(player) == (
+                not any(card.suit == "hearts" or card.index == 10 for card in player.hand.contents) and
+                not any(card.suit == mine.suit and Card.values[card.value] < Card.values[mine.value]
+                        for mine in player.hand.contents for card in outstanding))
+            assert hround.points_remain() == any(card.suit == "hearts" or card.index == 10
+                                                 for card in outstanding + player.hand.contents)
+            hround.apply_play(player, random.choice(legal))
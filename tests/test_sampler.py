@@ -0,0 +1,55 @@
+import collections
+import random
+
+import pytest
+
+from conftest import consistent_deals, started_round
+
+from GameKnowledgeSecond import CardSet, DealSampler, KnowledgeState, cards_by_index
+
+
+def small_knowledge():
+    """Returns knowledge of nine unseen cards with every kind of knowledge list: two cards each for any seat and for
+    each pair of seats, and one card known to be held by left"""
+    knowledge = KnowledgeState()
+    knowledge.possible = [CardSet(cards_by_index[index] for index in indexes).mask for indexes in
+                          ((0, 1, 2, 3, 6, 7, 8), (0, 1, 4, 5, 6, 7), (2, 3, 4, 5, 6, 7))]
+    return knowledge
+
+
+def test_sampler_counts_every_consistent_deal():
+    knowledge = small_knowledge()
+    for hand_sizes in ((3, 3, 3), (4, 2, 3), (2, 3, 4)):
+        assert DealSampler(knowledge, hand_sizes).count == len(consistent_deals(knowledge, hand_sizes))
+
+
+def test_sampler_draws_consistent_deals_uniformly():
+    knowledge = small_knowledge()
+    deals = consistent_deals(knowledge, (3, 3, 3))
+    sampler = DealSampler(knowledge, (3, 3, 3))
+    rng = random.Random(8)
+    trials = 200 * len(deals)
+    counts = collections.Counter(tuple(frozenset(hand) for hand in sampler.sample(rng)) for trial in range(trials))
+    assert set(counts) == set(deals)
+    assert max(abs(count - 200) for count in counts.values()) < 5 * 200 ** 0.5
+
+
+def test_sampler_rejects_impossible_hand_sizes():
+    with pytest.raises(ValueError):
+        DealSampler(small_knowledge(), (0, 4, 5))
+
+
+def test_samples_fit_the_knowledge_during_play():
+    for seed in range(8):
+        hround = started_round(seed, 5 * seed, ["left", "right", "across", "none"][seed % 4])
+        player = hround.next_player()
+        ai_index = hround.players.index(player)
+        seats = [(ai_index + i) % 4 for i in range(1, 4)]
+        sampler = DealSampler(player.knowledge, [len(hround.players[seat].hand.contents) for seat in seats])
+        for trial in range(50):
+            hands = sampler.sample()
+            assert sorted(card.index for hand in hands for card in hand) == \
+                sorted(card.index for seat in seats for card in hround.players[seat].hand.contents)
+            for possible, seat, hand in zip(player.knowledge.possible, seats, hands):
+                assert len(hand) == len(hround.players[seat].hand.contents)
+                assert all(possible >> card.index & 1 for card in hand)
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from conftest import started_round
+
+from GameKnowledgeSecond import Card, CardSet, EndgameSolver, SearchTimeout
+
+
+def exhaustive_score(hround, ai_index):
+    """Paranoid minimax over every legal play of the rest of the round, using the round's own rules"""
+    if hround.trick_num == 13:
+        points = hround.round_points()
+        return points[ai_index] - min(hround.players[(ai_index + i) % 4].score + points[(ai_index + i) % 4]
+                                      for i in range(1, 4))
+    player = hround.next_player()
+    scores = []
+    for card in player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken):
+        hround.apply_play(player, card)
+        scores.append(exhaustive_score(hround, ai_index))
+        hround.undo_play()
+    return min(scores) if hround.players.index(player) == ai_index else max(scores)
+
+
+def test_solver_matches_exhaustive_search():
+    solver = EndgameSolver()
+    for seed in range(12):
+        hround = started_round(seed, 40 + seed % 4)
+        for seat, other in enumerate(hround.players):
+            other.score = seed * seat * 7 % 60
+        player = hround.next_player()
+        ai_index = hround.players.index(player)
+        cards = player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        expected = []
+        for card in cards:
+            hround.apply_play(player, card)
+            expected.append(exhaustive_score(hround, ai_index))
+            hround.undo_play()
+        assert solver.solve(hround, ai_index, cards) == expected
+
+
+def test_solver_leaves_the_round_unchanged():
+    hround = started_round(50, 37)
+    state = hround.snapshot()
+    zobrist = hround.zobrist
+    player = hround.next_player()
+    EndgameSolver().solve(hround, hround.players.index(player),
+                          player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken))
+    assert hround.snapshot() == state
+    assert hround.zobrist == zobrist
+
+
+def test_move_classes_partition_the_cards_into_touching_runs():
+    for seed in range(30):
+        hround = started_round(seed, seed + 4)
+        player = hround.next_player()
+        live = CardSet.full & ~hround.played_all.mask | CardSet(hround.trick).mask
+        classes = hround.move_classes(player, player.hand.contents[::-1])
+        assert [card for cards in classes for card in cards] == player.hand.contents
+        for cards in classes:
+            assert len({card.suit for card in cards}) == 1
+            assert len(cards) == 1 or all(card.index != 10 for card in cards)
+            for low, high in zip(cards, cards[1:]):
+                assert not live & Card.above_masks[low.index] & Card.below_masks[high.index]
+        for low, high in zip(classes, classes[1:]):
+            assert low[-1].suit != high[0].suit or 10 in (low[-1].index, high[0].index) or \
+                live & Card.above_masks[low[-1].index] & Card.below_masks[high[0].index]
+
+
+def test_moves_in_a_class_have_equal_solved_scores():
+    solver = EndgameSolver()
+    grouped = 0
+    for seed in range(40):
+        hround = started_round(seed, 32 + seed % 8)
+        for seat, other in enumerate(hround.players):
+            other.score = seed * seat * 11 % 70
+        player = hround.next_player()
+        ai_index = hround.players.index(player)
+        cards = player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+        scores = dict(zip(cards, solver.solve(hround, ai_index, cards)))
+        for cards in hround.move_classes(player, cards):
+            assert len({scores[card] for card in cards}) == 1
+            grouped += len(cards) > 1
+    assert grouped > 5
+
+
+def test_solver_stops_at_its_deadline():
+    hround = started_round(51, 16)
+    player = hround.next_player()
+    cards = player.hand.legal_moves(hround.trick, hround.trick_num, hround.hearts_broken)
+    start = time.perf_counter()
+    with pytest.raises(SearchTimeout):
+        EndgameSolver().solve(hround, hround.players.index(player), cards, start + 0.02)
+    assert time.perf_counter() - start < 0.2
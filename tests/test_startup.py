@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code):
+    """Runs code in a fresh interpreter from the repository directory and returns what it printed"""
+    return subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True, text=True,
+                          check=True).stdout
+
+
+def test_import_prints_nothing_and_leaves_numpy_unloaded():
+    output = run_python("import sys, GameKnowledgeSecond; print('numpy' in sys.modules)")
+    assert output == "False\n"
+
+
+def test_import_builds_no_players_or_rounds():
+    output = run_python("import GameKnowledgeSecond as module; "
+                        "print(sorted(name for name, value in vars(module).items() "
+                        "if isinstance(value, (module.Player, module.HeartsRound))))")
+    assert output == "[]\n"
+
+
+def test_import_is_fast():
+    output = run_python("import time; start = time.perf_counter(); import GameKnowledgeSecond; "
+                        "print(time.perf_counter() - start)")
+    assert float(output) < 1